@@ -9,12 +9,21 @@ Provides two triggers:
 import azure.functions as func
 import logging
 import json
+import os
 from datetime import datetime
 
+from src.utils import json_utils
+
 app = func.FunctionApp()
 
 logger = logging.getLogger(__name__)
 
+# Import the sync stack (clients, transformers, pydantic settings) while the
+# worker loads and indexes this module, so on pre-warmed or always-ready
+# instances the first trigger doesn't pay for it. Skipped outside the host.
+if os.environ.get("FUNCTIONS_WORKER_RUNTIME"):
+    import src.main  # noqa: F401
+
 
 @app.timer_trigger(
     schedule="0 0 11-22 * * *",
@@ -40,7 +49,10 @@ def scheduled_sync(timer: func.TimerRequest) -> None:
         setup_logging(settings.log_level)
 
         result = main(delta_hours=16)
-        logger.info(f"Scheduled sync completed: {json.dumps(result, default=str)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Scheduled sync completed: %s", json_utils.dumps(result, default=str).decode()
+            )
 
     except Exception as e:
         logger.error(f"Scheduled sync failed: {e}", exc_info=True)
@@ -95,7 +107,7 @@ def manual_sync(req: func.HttpRequest) -> func.HttpResponse:
         result = main(full_sync=full_sync, delta_hours=delta_hours, filter_condition=year_filter)
 
         return func.HttpResponse(
-            body=json.dumps({
+            body=json_utils.dumps({
                 "status": "success",
                 "timestamp": datetime.now().isoformat(),
                 "result": result
@@ -256,9 +268,12 @@ def fix_associations(req: func.HttpRequest) -> func.HttpResponse:
             logger.info("Fixing order associations...")
             results["orders_fixed"] = fix_deals('epicor_order_number', 'order')
 
-        logger.info(f"Fix-associations complete: {json.dumps(results, default=str)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Fix-associations complete: %s", json_utils.dumps(results, default=str).decode()
+            )
         return func.HttpResponse(
-            body=json.dumps(results, default=str, indent=2),
+            body=json_utils.dumps(results, default=str, indent=True),
             mimetype="application/json",
             status_code=200
         )
@@ -276,7 +291,6 @@ def _get_blob_service():
     """Return BlobServiceClient using storage connection string (managed identity-aware)."""
     from azure.storage.blob import BlobServiceClient
     from azure.identity import DefaultAzureCredential
-    import os
     # Try connection string first (works with AzureWebJobsStorage)
     conn_str = os.environ.get('AzureWebJobsStorage')
     if conn_str and 'AccountKey=' in conn_str:
@@ -300,7 +314,7 @@ def _read_checkpoint_blob(blob_name: str):
         blob = client.get_blob_client(blob_name)
         if not blob.exists():
             return None
-        return json.loads(blob.download_blob().readall())
+        return json_utils.loads(blob.download_blob().readall())
     except Exception as e:
         logger.warning(f"Could not read blob {blob_name}: {e}")
         return None
@@ -315,7 +329,7 @@ def _write_checkpoint_blob(blob_name: str, data: dict):
         pass
     client.upload_blob(
         blob_name,
-        json.dumps(data, default=str),
+        json_utils.dumps(data, default=str),
         overwrite=True
     )
 
@@ -852,7 +866,7 @@ def _compute_diff_phase(epicor_blob: str, hubspot_blob: str, diff_blob: str, req
         "result_blob": diff_blob,
     }
     return func.HttpResponse(
-        body=json.dumps(summary, default=str, indent=2),
+        body=json_utils.dumps(summary, default=str, indent=True),
         mimetype="application/json", status_code=200
     )
 
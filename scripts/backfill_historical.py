@@ -324,8 +324,9 @@ def sync_quotes_by_year(
         total_stats['updated'] += year_stats['updated']
         total_stats['errors'] += year_stats['errors']
 
-        # Save checkpoint after each year
+        # Save checkpoint after each year, once its failures are on disk for retry_failed.py
         if checkpoint:
+            failed_tracker.flush()
             checkpoint.complete_quote_year(year, year_stats)
 
         print(f"Year {year}: {year_stats['total']} quotes, "
@@ -410,8 +411,9 @@ def sync_orders_by_year(
         total_stats['updated'] += year_stats['updated']
         total_stats['errors'] += year_stats['errors']
 
-        # Save checkpoint after each year
+        # Save checkpoint after each year, once its failures are on disk for retry_failed.py
         if checkpoint:
+            failed_tracker.flush()
             checkpoint.complete_order_year(year, year_stats)
 
         print(f"Year {year}: {year_stats['total']} orders, "
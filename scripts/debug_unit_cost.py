@@ -109,10 +109,20 @@ def debug_quote(quote_num: int):
     print("\n[STEP 4] Checking HubSpot for existing line items...")
     print("-" * 70)
 
-    for i, line in enumerate(line_items):
-        epicor_id = f"Q{quote_num}-{line.get('QuoteLine')}"
-        try:
-            existing = hubspot_client.get_line_item_by_epicor_id(epicor_id)
+    epicor_ids = [f"Q{quote_num}-{line.get('QuoteLine')}" for line in line_items]
+    try:
+        # One batched IN-filter search instead of one search per line
+        existing_by_id = hubspot_client.search_objects_batch(
+            "line_items",
+            "epicor_line_item_id",
+            epicor_ids,
+            properties=["hs_cost_of_goods_sold", "epicor_line_current_cost", "epicor_cost_source"]
+        )
+    except Exception as e:
+        print(f"\n  Error checking line items: {e}")
+    else:
+        for epicor_id in epicor_ids:
+            existing = existing_by_id.get(epicor_id)
             if existing:
                 props = existing.get('properties', {})
                 print(f"\n  Line item {epicor_id} found in HubSpot (ID: {existing.get('id')}):")
@@ -121,8 +131,6 @@ def debug_quote(quote_num: int):
                 print(f"    epicor_cost_source:        {props.get('epicor_cost_source')}")
             else:
                 print(f"\n  Line item {epicor_id} NOT found in HubSpot")
-        except Exception as e:
-            print(f"\n  Error checking {epicor_id}: {e}")
 
     # STEP 5: Check if HubSpot properties exist
     print("\n[STEP 5] Checking HubSpot custom properties exist...")
@@ -16,6 +16,7 @@ WARNING: This will create/update REAL data in HubSpot!
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -28,6 +29,7 @@ from src.clients.epicor_client import EpicorClient
 from src.clients.hubspot_client import HubSpotClient
 from src.transformers.quote_transformer import QuoteTransformer
 from src.transformers.order_transformer import OrderTransformer
+from src.transformers.line_item_transformer import LineItemTransformer
 from src.sync.line_item_sync import LineItemSync
 from src.utils.logger import setup_logging
 
@@ -57,38 +59,81 @@ CUSTOMER_HUBSPOT_MAP = {
 
 CUSTOMER_NUMS = list(CUSTOMER_HUBSPOT_MAP.keys())
 
+# OData filter shared by the quote and order fetches
+CUST_FILTER = " or ".join(f"CustNum eq {c}" for c in CUSTOMER_NUMS)
+
+# Only request the columns the transformers read (nested $select for line items)
+QUOTE_SELECT = ",".join(QuoteTransformer.SOURCE_FIELDS)
+QUOTE_EXPAND = f"QuoteDtls($select={','.join(LineItemTransformer.QUOTE_LINE_SOURCE_FIELDS)})"
+ORDER_SELECT = ",".join(OrderTransformer.SOURCE_FIELDS)
+ORDER_EXPAND = f"OrderDtls($select={','.join(LineItemTransformer.ORDER_LINE_SOURCE_FIELDS)})"
+
 # Limit quotes/orders per customer for testing
 MAX_QUOTES_PER_CUSTOMER = 5
 MAX_ORDERS_PER_CUSTOMER = 5
 
 
-def sync_quotes(epicor_client, hubspot_client, line_item_sync, settings):
-    """Sync quotes for the specified customers."""
-    print("\n" + "=" * 70)
-    print("SYNCING QUOTES")
-    print("=" * 70)
+def fetch_quotes_and_orders(epicor_client):
+    """
+    Fetch quotes and orders for the specified customers.
 
-    transformer = QuoteTransformer()
-    pipeline_id = settings.hubspot_quotes_pipeline_id
-
-    stats = {'created': 0, 'updated': 0, 'skipped': 0, 'errors': 0, 'line_items': 0}
+    Both OData requests are issued concurrently so the two large fetches
+    overlap instead of running back to back.
 
-    # Build filter for customer numbers
-    cust_filter = " or ".join([f"CustNum eq {c}" for c in CUSTOMER_NUMS])
+    Returns:
+        Tuple of (quotes, orders); either is None if its fetch failed
+    """
+    print(f"\nFetching quotes and orders for {len(CUSTOMER_NUMS)} customers...")
 
-    print(f"\nFetching quotes for {len(CUSTOMER_NUMS)} customers...")
-
-    try:
-        quotes = epicor_client.get_entity(
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        quotes_future = executor.submit(
+            epicor_client.get_entity,
             service="Erp.BO.QuoteSvc",
             entity_set="Quotes",
-            filter_expr=cust_filter,
-            expand="QuoteDtls",
+            filter_expr=CUST_FILTER,
+            select=QUOTE_SELECT,
+            expand=QUOTE_EXPAND,
             limit=100  # Limit total quotes for testing
         )
+        orders_future = executor.submit(
+            epicor_client.get_entity,
+            service="Erp.BO.SalesOrderSvc",
+            entity_set="SalesOrders",
+            filter_expr=CUST_FILTER,
+            select=ORDER_SELECT,
+            expand=ORDER_EXPAND,
+            limit=100  # Limit total orders for testing
+        )
+
+    try:
+        quotes = quotes_future.result()
         print(f"Found {len(quotes)} quotes")
     except Exception as e:
         print(f"ERROR fetching quotes: {e}")
+        quotes = None
+
+    try:
+        orders = orders_future.result()
+        print(f"Found {len(orders)} orders")
+    except Exception as e:
+        print(f"ERROR fetching orders: {e}")
+        orders = None
+
+    return quotes, orders
+
+
+def sync_quotes(quotes, hubspot_client, line_item_sync, settings):
+    """Sync pre-fetched quotes for the specified customers."""
+    print("\n" + "=" * 70)
+    print("SYNCING QUOTES")
+    print("=" * 70)
+
+    transformer = QuoteTransformer()
+    pipeline_id = settings.hubspot_quotes_pipeline_id
+
+    stats = {'created': 0, 'updated': 0, 'skipped': 0, 'errors': 0, 'line_items': 0}
+
+    if quotes is None:
         return stats
 
     if not quotes:
@@ -193,8 +238,8 @@ def sync_quotes(epicor_client, hubspot_client, line_item_sync, settings):
     return stats
 
 
-def sync_orders(epicor_client, hubspot_client, line_item_sync, settings):
-    """Sync orders for the specified customers."""
+def sync_orders(orders, hubspot_client, line_item_sync, settings):
+    """Sync pre-fetched orders for the specified customers."""
     print("\n" + "=" * 70)
     print("SYNCING ORDERS")
     print("=" * 70)
@@ -204,22 +249,7 @@ def sync_orders(epicor_client, hubspot_client, line_item_sync, settings):
 
     stats = {'created': 0, 'updated': 0, 'skipped': 0, 'errors': 0, 'line_items': 0}
 
-    # Build filter for customer numbers
-    cust_filter = " or ".join([f"CustNum eq {c}" for c in CUSTOMER_NUMS])
-
-    print(f"\nFetching orders for {len(CUSTOMER_NUMS)} customers...")
-
-    try:
-        orders = epicor_client.get_entity(
-            service="Erp.BO.SalesOrderSvc",
-            entity_set="SalesOrders",
-            filter_expr=cust_filter,
-            expand="OrderDtls",
-            limit=100  # Limit total orders for testing
-        )
-        print(f"Found {len(orders)} orders")
-    except Exception as e:
-        print(f"ERROR fetching orders: {e}")
+    if orders is None:
         return stats
 
     if not orders:
@@ -373,10 +403,11 @@ def main():
 
     # Sync quotes
     print("\n[5/5] Syncing data...")
-    quote_stats = sync_quotes(epicor_client, hubspot_client, line_item_sync, settings)
+    quotes, orders = fetch_quotes_and_orders(epicor_client)
+    quote_stats = sync_quotes(quotes, hubspot_client, line_item_sync, settings)
 
     # Sync orders
-    order_stats = sync_orders(epicor_client, hubspot_client, line_item_sync, settings)
+    order_stats = sync_orders(orders, hubspot_client, line_item_sync, settings)
 
     # Final summary
     print("\n" + "=" * 70)
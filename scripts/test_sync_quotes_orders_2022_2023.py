@@ -11,6 +11,7 @@ WARNING: This will create/update REAL deals in HubSpot!
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -23,6 +24,7 @@ from src.clients.epicor_client import EpicorClient
 from src.clients.hubspot_client import HubSpotClient
 from src.transformers.quote_transformer import QuoteTransformer
 from src.transformers.order_transformer import OrderTransformer
+from src.transformers.line_item_transformer import LineItemTransformer
 from src.sync.line_item_sync import LineItemSync
 from src.utils.logger import setup_logging
 
@@ -31,6 +33,15 @@ CUSTOMER_NUMS_2022 = [1358, 1359, 1360, 1361, 1363, 1365, 1366, 1367, 1369, 1370
 CUSTOMER_NUMS_2023 = [1384, 1385, 1386, 1387, 1388, 1390, 1391, 1392, 1393, 1394]
 CUSTOMER_NUMS = CUSTOMER_NUMS_2022 + CUSTOMER_NUMS_2023
 
+# OData filter shared by the quote and order fetches
+CUST_FILTER = " or ".join(f"CustNum eq {c}" for c in CUSTOMER_NUMS)
+
+# Only request the columns the transformers read (nested $select for line items)
+QUOTE_SELECT = ",".join(QuoteTransformer.SOURCE_FIELDS)
+QUOTE_EXPAND = f"QuoteDtls($select={','.join(LineItemTransformer.QUOTE_LINE_SOURCE_FIELDS)})"
+ORDER_SELECT = ",".join(OrderTransformer.SOURCE_FIELDS)
+ORDER_EXPAND = f"OrderDtls($select={','.join(LineItemTransformer.ORDER_LINE_SOURCE_FIELDS)})"
+
 # Customer mapping: CustNum -> HubSpot Company ID
 CUSTOMER_HUBSPOT_MAP = {
     # 2022 customers
@@ -62,8 +73,46 @@ MAX_QUOTES_PER_CUSTOMER = 5
 MAX_ORDERS_PER_CUSTOMER = 5
 
 
-def sync_quotes(epicor_client, hubspot_client, line_item_sync, settings):
-    """Sync quotes for the specified customers."""
+def fetch_quotes_and_orders(epicor_client):
+    """
+    Fetch quotes and orders (with line items) for the specified customers.
+
+    Both OData requests are issued concurrently so the two large fetches
+    overlap instead of running back to back.
+
+    Returns:
+        Tuple of (quotes, orders)
+    """
+    print(f"\nFetching quotes and orders for {len(CUSTOMER_NUMS)} customers...")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        quotes_future = executor.submit(
+            epicor_client.get_entity,
+            service="Erp.BO.QuoteSvc",
+            entity_set="Quotes",
+            filter_expr=CUST_FILTER,
+            select=QUOTE_SELECT,
+            expand=QUOTE_EXPAND,
+            limit=len(CUSTOMER_NUMS) * MAX_QUOTES_PER_CUSTOMER
+        )
+        orders_future = executor.submit(
+            epicor_client.get_entity,
+            service="Erp.BO.SalesOrderSvc",
+            entity_set="SalesOrders",
+            filter_expr=CUST_FILTER,
+            select=ORDER_SELECT,
+            expand=ORDER_EXPAND,
+            limit=len(CUSTOMER_NUMS) * MAX_ORDERS_PER_CUSTOMER
+        )
+        quotes = quotes_future.result()
+        orders = orders_future.result()
+
+    print(f"Found {len(quotes)} quotes, {len(orders)} orders")
+    return quotes, orders
+
+
+def sync_quotes(quotes, hubspot_client, line_item_sync, settings):
+    """Sync pre-fetched quotes for the specified customers."""
     print("\n" + "=" * 70)
     print("SYNCING QUOTES")
     print("=" * 70)
@@ -73,20 +122,6 @@ def sync_quotes(epicor_client, hubspot_client, line_item_sync, settings):
 
     stats = {'created': 0, 'updated': 0, 'skipped': 0, 'errors': 0, 'line_items': 0}
 
-    # Build filter for customer numbers
-    cust_filter = " or ".join([f"CustNum eq {c}" for c in CUSTOMER_NUMS])
-
-    # Fetch quotes with line items
-    print(f"\nFetching quotes for {len(CUSTOMER_NUMS)} customers...")
-    quotes = epicor_client.get_entity(
-        service="Erp.BO.QuoteSvc",
-        entity_set="Quotes",
-        filter_expr=cust_filter,
-        expand="QuoteDtls",
-        limit=len(CUSTOMER_NUMS) * MAX_QUOTES_PER_CUSTOMER
-    )
-    print(f"Found {len(quotes)} quotes")
-
     debug_first = True
     for quote in quotes:
         quote_num = quote.get('QuoteNum')
@@ -188,8 +223,8 @@ def sync_quotes(epicor_client, hubspot_client, line_item_sync, settings):
     return stats
 
 
-def sync_orders(epicor_client, hubspot_client, line_item_sync, settings):
-    """Sync orders for the specified customers."""
+def sync_orders(orders, hubspot_client, line_item_sync, settings):
+    """Sync pre-fetched orders for the specified customers."""
     print("\n" + "=" * 70)
     print("SYNCING ORDERS")
     print("=" * 70)
@@ -199,20 +234,6 @@ def sync_orders(epicor_client, hubspot_client, line_item_sync, settings):
 
     stats = {'created': 0, 'updated': 0, 'skipped': 0, 'errors': 0, 'line_items': 0}
 
-    # Build filter for customer numbers
-    cust_filter = " or ".join([f"CustNum eq {c}" for c in CUSTOMER_NUMS])
-
-    # Fetch orders with line items
-    print(f"\nFetching orders for {len(CUSTOMER_NUMS)} customers...")
-    orders = epicor_client.get_entity(
-        service="Erp.BO.SalesOrderSvc",
-        entity_set="SalesOrders",
-        filter_expr=cust_filter,
-        expand="OrderDtls",
-        limit=len(CUSTOMER_NUMS) * MAX_ORDERS_PER_CUSTOMER
-    )
-    print(f"Found {len(orders)} orders")
-
     for order in orders:
         order_num = order.get('OrderNum')
         cust_num = order.get('CustNum')
@@ -373,10 +394,11 @@ def main():
 
     # Sync quotes
     print("\n[5/5] Syncing data...")
-    quote_stats = sync_quotes(epicor_client, hubspot_client, line_item_sync, settings)
+    quotes, orders = fetch_quotes_and_orders(epicor_client)
+    quote_stats = sync_quotes(quotes, hubspot_client, line_item_sync, settings)
 
     # Sync orders
-    order_stats = sync_orders(epicor_client, hubspot_client, line_item_sync, settings)
+    order_stats = sync_orders(orders, hubspot_client, line_item_sync, settings)
 
     # Final summary
     print("\n" + "=" * 70)
@@ -9,15 +9,46 @@ retry logic, and error handling.
 import base64
 import logging
 import time
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from urllib.parse import urlencode
 import requests
+import urllib3
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from ..utils import json_utils
 from ..utils.error_handler import EpicorAPIError, retry, log_errors
 
 
+def _chunked(items: List[Any], size: int) -> List[List[Any]]:
+    """Split items into consecutive chunks of at most size."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _query_params(
+    expand: Optional[str],
+    filter_expr: Optional[str],
+    select: Optional[str],
+    orderby: Optional[str]
+) -> Dict[str, str]:
+    """OData query parameters for an entity fetch (paging is added by _iter_pages)."""
+    params = {}
+    if expand:
+        params['$expand'] = expand
+    if filter_expr:
+        params['$filter'] = filter_expr
+    if select:
+        params['$select'] = select
+    if orderby:
+        params['$orderby'] = orderby
+    return params
+
+
+def _or_filter(field: str, values: List[Any]) -> str:
+    """OData filter matching any of values, e.g. 'QuoteNum eq 1 or QuoteNum eq 2'."""
+    return " or ".join(f"{field} eq {value}" for value in values)
+
+
 class EpicorClient:
     """
     Generic client for Epicor REST API v2 (OData v4).
@@ -30,6 +61,11 @@ class EpicorClient:
     - Error handling: Comprehensive error logging and exceptions
     """
 
+    # Keep-alive connections kept open to the Epicor host (one host, so one pool)
+    POOL_MAXSIZE = 16
+    # Key values per OR-chained $filter in batch lookups (keeps URLs well under limits)
+    FILTER_CHUNK_SIZE = 50
+
     def __init__(
         self,
         base_url: str,
@@ -64,14 +100,17 @@ class EpicorClient:
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["GET", "POST", "PATCH", "PUT"]
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=retry_strategy
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
         # Disable SSL verification for self-signed certificates (Epicor server)
         self.session.verify = False
         # Suppress SSL warnings
-        import urllib3
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
         # Set authentication headers (BOTH Basic Auth AND API Key required)
@@ -124,9 +163,6 @@ class EpicorClient:
         """
         Fetch all pages of data from an OData endpoint.
 
-        Handles OData pagination using $top and $skip parameters.
-        Retries with exponential backoff on Epicor license limit errors.
-
         Args:
             url: Base URL (may already contain query parameters)
             batch_size: Number of records per page (default: self.batch_size)
@@ -134,13 +170,40 @@ class EpicorClient:
         Returns:
             List of all records across all pages
 
+        Raises:
+            EpicorAPIError: If API request fails after all retries
+        """
+        all_records = []
+        for records in self._iter_pages(url, batch_size):
+            all_records.extend(records)
+        return all_records
+
+    def _iter_pages(
+        self,
+        url: str,
+        batch_size: Optional[int] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Lazily fetch pages of data from an OData endpoint.
+
+        Handles OData pagination using $top and $skip parameters; the next
+        page is only requested once the caller has consumed the current one.
+        Retries with exponential backoff on Epicor license limit errors.
+
+        Args:
+            url: Base URL (may already contain query parameters)
+            batch_size: Number of records per page (default: self.batch_size)
+
+        Yields:
+            Non-empty lists of records, one per page
+
         Raises:
             EpicorAPIError: If API request fails after all retries
         """
         if batch_size is None:
             batch_size = self.batch_size
 
-        all_records = []
+        total = 0
         skip = 0
         page = 1
         license_max_retries = 5
@@ -151,7 +214,7 @@ class EpicorClient:
             separator = '&' if '?' in url else '?'
             paged_url = f"{url}{separator}$top={batch_size}&$skip={skip}"
 
-            self.logger.debug(f"Fetching page {page}: {paged_url}")
+            self.logger.debug("Fetching page %s: %s", page, paged_url)
 
             try:
                 response = self.session.get(paged_url, timeout=120)
@@ -177,31 +240,33 @@ class EpicorClient:
                             response=response.text
                         )
 
-                data = response.json()
-                records = data.get('value', [])
+                # Pages with expanded line items are large; parse the raw bytes
+                # with json_utils (orjson when installed) instead of response.json()
+                data = json_utils.loads(response.content)
 
-                if not records:
-                    self.logger.info(f"No more records. Total fetched: {len(all_records)}")
-                    break
+            except requests.exceptions.RequestException as e:
+                raise EpicorAPIError(f"Request failed: {str(e)}")
+            except ValueError as e:
+                raise EpicorAPIError(f"Invalid JSON response: {str(e)}")
 
-                all_records.extend(records)
-                skip += len(records)
-                page += 1
+            records = data.get('value', [])
 
-                self.logger.info(
-                    f"Page {page-1}: Fetched {len(records)} records, "
-                    f"total: {len(all_records)}"
-                )
+            if not records:
+                self.logger.info("No more records. Total fetched: %s", total)
+                return
 
-                # If we got fewer records than requested, we've reached the last page.
-                # Note: Epicor does not return @odata.nextLink, so we cannot rely on it.
-                if len(records) < batch_size:
-                    break
+            total += len(records)
+            skip += len(records)
+            page += 1
 
-            except requests.exceptions.RequestException as e:
-                raise EpicorAPIError(f"Request failed: {str(e)}")
+            self.logger.info("Page %s: Fetched %s records, total: %s", page - 1, len(records), total)
 
-        return all_records
+            yield records
+
+            # If we got fewer records than requested, we've reached the last page.
+            # Note: Epicor does not return @odata.nextLink, so we cannot rely on it.
+            if len(records) < batch_size:
+                return
 
     def _is_license_error(self, response) -> bool:
         """Check if an HTTP response is an Epicor license limit error."""
@@ -293,19 +358,9 @@ class EpicorClient:
             ...     filter_expr="QuoteNum gt 1000"
             ... )
         """
-        params = {}
-
-        if expand:
-            params['$expand'] = expand
-        if filter_expr:
-            params['$filter'] = filter_expr
-        if select:
-            params['$select'] = select
-        if orderby:
-            params['$orderby'] = orderby
-        # Note: Don't add $top here - _get_paged handles pagination with $top/$skip
-
-        url = self._build_url(service, entity_set, params)
+        url = self._build_url(
+            service, entity_set, _query_params(expand, filter_expr, select, orderby)
+        )
 
         if limit:
             # If limit is specified, don't paginate beyond it
@@ -313,6 +368,38 @@ class EpicorClient:
         else:
             return self._get_paged(url)
 
+    def iter_entity_pages(
+        self,
+        service: str,
+        entity_set: str,
+        expand: Optional[str] = None,
+        filter_expr: Optional[str] = None,
+        select: Optional[str] = None,
+        orderby: Optional[str] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Lazily fetch entities from any Epicor service, one page at a time.
+
+        Streaming version of get_entity: each page is requested only when the
+        caller asks for it, so processing can start after the first page and
+        only the current page needs to be held in memory.
+
+        Args:
+            service: Service name (e.g., "Erp.BO.QuoteSvc")
+            entity_set: Entity set name (e.g., "Quotes")
+            expand: OData $expand parameter (e.g., "QuoteDtls")
+            filter_expr: OData $filter parameter (e.g., "QuoteNum gt 1000")
+            select: OData $select parameter (e.g., "QuoteNum,CustNum")
+            orderby: OData $orderby parameter (e.g., "QuoteNum")
+
+        Yields:
+            Lists of entity records (batch_size per page)
+        """
+        url = self._build_url(
+            service, entity_set, _query_params(expand, filter_expr, select, orderby)
+        )
+        return self._iter_pages(url)
+
     # ========================================================================
     # Convenience Methods for Common Entities
     # ========================================================================
@@ -336,6 +423,25 @@ class EpicorClient:
             filter_expr=filter_condition
         )
 
+    def iter_customer_pages(
+        self,
+        filter_condition: Optional[str] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Fetch customers from Epicor one page at a time.
+
+        Args:
+            filter_condition: Optional OData filter expression
+
+        Yields:
+            Lists of customer records (batch_size per page)
+        """
+        return self.iter_entity_pages(
+            service="Erp.BO.CustomerSvc",
+            entity_set="Customers",
+            filter_expr=filter_condition
+        )
+
     def get_quotes(
         self,
         expand_line_items: bool = False,
@@ -359,6 +465,28 @@ class EpicorClient:
             filter_expr=filter_condition
         )
 
+    def iter_quote_pages(
+        self,
+        expand_line_items: bool = False,
+        filter_condition: Optional[str] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Fetch quotes from Epicor one page at a time.
+
+        Args:
+            expand_line_items: Whether to include quote line items
+            filter_condition: Optional OData filter expression
+
+        Yields:
+            Lists of quote records (batch_size per page)
+        """
+        return self.iter_entity_pages(
+            service="Erp.BO.QuoteSvc",
+            entity_set="Quotes",
+            expand="QuoteDtls" if expand_line_items else None,
+            filter_expr=filter_condition
+        )
+
     def get_orders(
         self,
         expand_line_items: bool = False,
@@ -382,6 +510,28 @@ class EpicorClient:
             filter_expr=filter_condition
         )
 
+    def iter_order_pages(
+        self,
+        expand_line_items: bool = False,
+        filter_condition: Optional[str] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Fetch sales orders from Epicor one page at a time.
+
+        Args:
+            expand_line_items: Whether to include order line items
+            filter_condition: Optional OData filter expression
+
+        Yields:
+            Lists of order records (batch_size per page)
+        """
+        return self.iter_entity_pages(
+            service="Erp.BO.SalesOrderSvc",
+            entity_set="SalesOrders",
+            expand="OrderDtls" if expand_line_items else None,
+            filter_expr=filter_condition
+        )
+
     def get_order_by_quote(self, quote_num: int, expand_line_items: bool = True) -> Optional[Dict[str, Any]]:
         """
         Find a sales order that was created from a specific quote.
@@ -424,6 +574,59 @@ class EpicorClient:
         )
         return orders[0] if orders else None
 
+    def get_orders_by_quotes(
+        self,
+        quote_nums: List[int],
+        expand_line_items: bool = True
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Find the sales orders created from many quotes in batched queries.
+
+        Batch version of get_order_by_quote: OrderDtl searches and order
+        fetches are sent FILTER_CHUNK_SIZE numbers at a time as OR-chained
+        $filter expressions (Epicor's OData does not support the 'in' operator).
+
+        Args:
+            quote_nums: Quote numbers to search for
+            expand_line_items: Whether to include order line items (default: True)
+
+        Returns:
+            Dict mapping quote number to its order record (quotes without an order omitted)
+        """
+        quote_nums = list(dict.fromkeys(quote_nums))
+
+        # Find the order linked to each quote (first matching line wins)
+        order_num_by_quote = {}
+        for chunk in _chunked(quote_nums, self.FILTER_CHUNK_SIZE):
+            order_dtls = self.get_entity(
+                service="Erp.BO.OrderDtlSearchSvc",
+                entity_set="OrderDtlSearches",
+                filter_expr=_or_filter("QuoteNum", chunk),
+                select="OrderNum,QuoteNum"
+            )
+            for order_dtl in order_dtls:
+                order_num_by_quote.setdefault(order_dtl['QuoteNum'], order_dtl['OrderNum'])
+
+        # Fetch the full orders
+        expand = "OrderDtls" if expand_line_items else None
+        orders_by_num = {}
+        order_nums = list(dict.fromkeys(order_num_by_quote.values()))
+        for chunk in _chunked(order_nums, self.FILTER_CHUNK_SIZE):
+            orders = self.get_entity(
+                service="Erp.BO.SalesOrderSvc",
+                entity_set="SalesOrders",
+                filter_expr=_or_filter("OrderNum", chunk),
+                expand=expand
+            )
+            for order in orders:
+                orders_by_num[order['OrderNum']] = order
+
+        return {
+            quote_num: orders_by_num[order_num]
+            for quote_num, order_num in order_num_by_quote.items()
+            if order_num in orders_by_num
+        }
+
     # ========================================================================
     # Connection Test
     # ========================================================================
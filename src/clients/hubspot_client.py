@@ -5,16 +5,48 @@ This client provides a generic interface to interact with HubSpot CRM API v3/v4.
 It handles authentication (Bearer token), rate limiting, retry logic, and error handling.
 """
 
+import hashlib
 import logging
+import socket
+import threading
 import time
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partialmethod
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Any, Tuple
 import requests
+import urllib3
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from ..utils import json_utils
 from ..utils.error_handler import HubSpotAPIError, log_errors
 
 
+class _TunedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that sets TCP_NODELAY and SO_KEEPALIVE on pooled sockets."""
+
+    SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self.SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of at most `size` items."""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
 class HubSpotClient:
     """
     Generic client for HubSpot REST API v3/v4.
@@ -26,57 +58,198 @@ class HubSpotClient:
     - Error handling: Comprehensive error logging and exceptions
     - CRM Objects: Companies, Contacts, Deals, Products, Line Items
     - Associations: Creating relationships between objects
+    - Concurrency: Pooled keep-alive HTTP/1.1 connections shared by map_parallel
+
+    Transport is requests/urllib3 over HTTP/1.1. The request volume is bounded
+    by the rate limiter (10 req/sec), so a small pool of reused connections
+    already avoids repeat TLS handshakes; HTTP/2 multiplexing would need httpx
+    and would bypass the urllib3 retry handling this client relies on.
     """
 
-    def __init__(self, api_key: str, rate_limit_delay: float = 0.11):
+    # Seconds to spend on (and wait for) the connection warmup request
+    WARMUP_TIMEOUT = 2
+
+    # Max characters of a non-JSON error body kept in logs/exceptions
+    MAX_ERROR_TEXT = 2048
+
+    # Per-request headers for requests with a JSON body (shared, never mutated)
+    JSON_CONTENT_HEADERS = {"Content-Type": "application/json"}
+
+    # Properties returned by get_*_by_property lookups. Callers only need the
+    # object ID plus a few identifying fields, and HubSpot's default property
+    # set is much larger, so keep these minimal.
+    DEAL_LOOKUP_PROPERTIES = ["dealname", "dealstage", "pipeline", "amount"]
+    COMPANY_LOOKUP_PROPERTIES = ["name", "epicor_customer_number"]
+    PRODUCT_LOOKUP_PROPERTIES = ["hs_sku", "name", "price"]
+
+    # CRM object types with precomputed endpoint URLs
+    OBJECT_TYPES = ("companies", "contacts", "deals", "products", "line_items")
+
+    # Max inputs per batch request / values per IN filter
+    BATCH_SIZE = 100
+
+    # Max pooled connections to api.hubapi.com
+    POOL_MAXSIZE = 32
+
+    # Max entries in the property lookup cache before it is reset
+    LOOKUP_CACHE_SIZE = 4096
+
+    def __init__(
+        self,
+        api_key: str,
+        rate_limit_capacity: int = 100,
+        rate_limit_per_second: float = 10.0,
+        warmup: bool = False
+    ):
         """
         Initialize HubSpot API client.
 
         Args:
             api_key: HubSpot Private App Access Token
-            rate_limit_delay: Delay between requests in seconds (default: 0.11s = ~90 req/10sec)
+            rate_limit_capacity: Token bucket size, i.e. max burst (default: 100)
+            rate_limit_per_second: Token refill rate (default: 10/sec = 100 req/10sec)
+            warmup: Open a pooled connection (DNS + TLS) in a background thread
+                so the first real request doesn't pay the handshake
         """
         self.api_key = api_key
         self.base_url = "https://api.hubapi.com"
-        self.rate_limit_delay = rate_limit_delay
-        self.last_request_time = 0
+
+        # Precomputed object endpoint URLs for the CRM types this integration uses
+        self._object_urls = {
+            object_type: f"{self.base_url}/crm/v3/objects/{object_type}"
+            for object_type in self.OBJECT_TYPES
+        }
+        self._search_urls = {t: f"{url}/search" for t, url in self._object_urls.items()}
+
+        # Token bucket rate limiter (starts full so the first burst isn't delayed)
+        self.capacity = rate_limit_capacity
+        self.refill_rate = rate_limit_per_second
+        self.tokens = float(rate_limit_capacity)
+        self.last_refill = time.monotonic()
+        self._rate_limit_lock = threading.Lock()
         self.logger = logging.getLogger(__name__)
         self._association_type_cache = {}  # Cache for association type IDs
 
+        # Cache for get_*_by_property lookups: (object_type, property, value) -> object or None
+        self._lookup_cache: Dict[Tuple[str, str, str], Optional[Dict]] = {}
+
+        # Response cache for GETs and read-only POSTs, active only inside cache_scope():
+        # key -> (url, response)
+        self._request_cache: Optional[Dict[bytes, Tuple[str, requests.Response]]] = None
+
         # Create session with retry logic
         self.session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=2,
+        # Short backoff: on 429 HubSpot's Retry-After header drives the wait
+        retry_kwargs = dict(
+            total=5,
+            backoff_factor=0.25,
             status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST", "PATCH", "PUT", "DELETE"]
+            allowed_methods=frozenset(["GET", "POST", "PATCH", "PUT", "DELETE"]),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        try:
+            # Jitter spreads retries from parallel workers (urllib3 >= 2.0)
+            retry_strategy = Retry(backoff_jitter=0.1, **retry_kwargs)
+        except TypeError:
+            retry_strategy = Retry(**retry_kwargs)
+        # Single host (api.hubapi.com): one pool with room for concurrent sockets
+        # so idle keep-alive connections aren't discarded and re-handshaked
+        adapter = _TunedHTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=retry_strategy,
+            pool_block=False
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
-        # Set headers
-        self.session.headers.update({
+        # Set headers (Content-Type is only sent on requests with a body)
+        base_headers = {
             "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        })
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+            "User-Agent": "epicor-hubspot/1.0",
+            "Connection": "keep-alive"
+        }
+        self.session.headers.update(base_headers)
+
+        # Direct urllib3 pool for the hot read paths (batch search / batch read),
+        # skipping requests' per-call session/header/hook overhead
+        self._retry_strategy = retry_strategy
+        self.http = urllib3.HTTPSConnectionPool(
+            urllib3.util.parse_url(self.base_url).host,
+            maxsize=self.POOL_MAXSIZE,
+            retries=retry_strategy,
+            headers=base_headers,
+            socket_options=_TunedHTTPAdapter.SOCKET_OPTIONS
+        )
+        self._raw_json_headers = {**base_headers, **self.JSON_CONTENT_HEADERS}
+
+        # Set once the warmup request finishes (immediately if not warming up)
+        self._warmed = threading.Event()
+        if warmup:
+            threading.Thread(target=self._warmup, name="hubspot-warmup", daemon=True).start()
+        else:
+            self._warmed.set()
 
         self.logger.info("HubSpot client initialized")
 
+    def _warmup(self) -> None:
+        """Pre-open a keep-alive connection to HubSpot; failures are ignored."""
+        try:
+            self._rate_limit()
+            response = self.session.head(
+                f"{self._object_url('companies')}?limit=1", timeout=self.WARMUP_TIMEOUT
+            )
+            response.close()  # Returns the connection to the pool
+            self.logger.debug("HubSpot connection warmed up")
+        except Exception as e:
+            self.logger.debug("HubSpot warmup failed: %s", e)
+        finally:
+            self._warmed.set()
+
     def _rate_limit(self) -> None:
         """
         Implement rate limiting to avoid hitting HubSpot API limits.
 
         HubSpot limits: 100 requests per 10 seconds for most endpoints.
+        Uses a token bucket: requests go out immediately while tokens remain
+        and only sleep once the bucket is empty. Thread-safe.
+        """
+        with self._rate_limit_lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity,
+                self.tokens + (now - self.last_refill) * self.refill_rate
+            )
+            self.last_refill = now
+
+            if self.tokens < 1:
+                # Sleep holding the lock so waiting threads queue in order
+                time.sleep((1 - self.tokens) / self.refill_rate)
+                self.tokens = 0
+                self.last_refill = time.monotonic()
+            else:
+                self.tokens -= 1
+
+    def _drain_rate_limit(self, retry_after: Optional[str]) -> None:
         """
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+        Empty the token bucket after a 429 so callers back off before the next request.
 
-        if time_since_last_request < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last_request
-            time.sleep(sleep_time)
+        Args:
+            retry_after: Retry-After header value in seconds (if provided)
+        """
+        try:
+            delay = max(float(retry_after), 0.0) if retry_after else 0.0
+        except ValueError:
+            delay = 0.0
 
-        self.last_request_time = time.time()
+        with self._rate_limit_lock:
+            # Pushing last_refill into the future makes the next refill negative,
+            # so _rate_limit sleeps for the Retry-After period plus one token
+            self.tokens = 0
+            self.last_refill = time.monotonic() + delay
 
     @log_errors
     def _make_request(
@@ -99,31 +272,326 @@ class HubSpotClient:
         Raises:
             HubSpotAPIError: If request fails
         """
+        # Let an in-flight warmup finish so this request reuses its connection
+        self._warmed.wait(timeout=self.WARMUP_TIMEOUT)
+
+        cache_key = self._request_cache_key(method, url, kwargs)
+        if cache_key is not None and cache_key in self._request_cache:
+            return self._request_cache[cache_key][1]
+
         self._rate_limit()
 
+        # Serialize JSON bodies ourselves (orjson when available)
+        if 'json' in kwargs:
+            kwargs['data'] = json_utils.dumps(kwargs.pop('json'))
+        if 'data' in kwargs and 'headers' not in kwargs:
+            kwargs['headers'] = self.JSON_CONTENT_HEADERS
+
         try:
             response = self.session.request(method, url, timeout=30, **kwargs)
 
+            if response.status_code == 429:
+                self._drain_rate_limit(response.headers.get('Retry-After'))
+
             if not response.ok:
-                error_detail = ""
-                try:
-                    error_detail = response.json()
-                except:
-                    error_detail = response.text
-
-                self.logger.error(f"HubSpot API Error: {response.status_code} - {error_detail}")
-
-                raise HubSpotAPIError(
-                    f"{method} {url} failed (Status: {response.status_code}, Response: {error_detail})",
-                    status_code=response.status_code,
-                    response=str(error_detail)
+                self._raise_for_error(
+                    method, url, response.status_code,
+                    response.headers.get('Content-Type', ''), response.content
                 )
 
+            if cache_key is not None and self._request_cache is not None:
+                self._request_cache[cache_key] = (url, response)
+
             return response
 
         except requests.exceptions.RequestException as e:
             raise HubSpotAPIError(f"Request failed: {str(e)}")
     
+    def _raw_request(
+        self,
+        method: str,
+        url: str,
+        payload: Optional[Dict[str, Any]] = None
+    ) -> Dict:
+        """
+        Make a request straight through the urllib3 pool and return parsed JSON.
+
+        Used for the hot batch search/read paths. Shares the rate limiter,
+        retry policy and error handling with _make_request, but not the
+        cache_scope response cache.
+
+        Args:
+            method: HTTP method
+            url: Full URL (must be on api.hubapi.com)
+            payload: Optional JSON body
+
+        Returns:
+            Parsed response body
+
+        Raises:
+            HubSpotAPIError: If request fails
+        """
+        self._warmed.wait(timeout=self.WARMUP_TIMEOUT)
+        self._rate_limit()
+
+        path = url[len(self.base_url):] if url.startswith(self.base_url) else url
+        if payload is not None:
+            body = json_utils.dumps(payload)
+            headers = self._raw_json_headers
+        else:
+            body = None
+            headers = None
+
+        try:
+            response = self.http.urlopen(
+                method, path, body=body, headers=headers,
+                retries=self._retry_strategy, timeout=30
+            )
+        except urllib3.exceptions.HTTPError as e:
+            raise HubSpotAPIError(f"Request failed: {str(e)}")
+
+        if response.status == 429:
+            self._drain_rate_limit(response.headers.get('Retry-After'))
+
+        if response.status >= 400:
+            self._raise_for_error(
+                method, url, response.status,
+                response.headers.get('Content-Type', ''), response.data
+            )
+
+        return json_utils.loads(response.data) if response.data else {}
+
+    def _raise_for_error(
+        self,
+        method: str,
+        url: str,
+        status_code: int,
+        content_type: str,
+        content: bytes
+    ) -> None:
+        """Log and raise HubSpotAPIError for a failed response."""
+        error_detail = self._error_detail(content_type, content)
+
+        self.logger.error("HubSpot API Error: %s - %s", status_code, error_detail)
+
+        raise HubSpotAPIError(
+            f"{method} {url} failed (Status: {status_code}, Response: {error_detail})",
+            status_code=status_code,
+            response=str(error_detail)
+        )
+
+    def _error_detail(self, content_type: str, content: bytes) -> Any:
+        """
+        Extract an error body for logging.
+
+        Only JSON content types are parsed; anything else (e.g. an HTML page
+        from HubSpot's edge on 502/504) is kept as text, truncated.
+        """
+        if content_type.startswith('application/json') and content:
+            try:
+                return json_utils.loads(content)
+            except ValueError:
+                pass
+        return content[:self.MAX_ERROR_TEXT].decode('utf-8', errors='replace')
+
+    # ========================================================================
+    # Request Cache
+    # ========================================================================
+
+    @contextmanager
+    def cache_scope(self):
+        """
+        Serve repeated GETs and search/batch-read POSTs from memory for the block.
+
+        The cache starts empty on enter and is dropped on exit, so nothing
+        leaks between sync runs. Writes invalidate cached reads of the
+        mutated object type.
+
+        Example:
+            >>> with client.cache_scope():
+            ...     sync_manager.run_full_sync()
+        """
+        previous = self._request_cache
+        self._request_cache = {}
+        try:
+            yield self
+        finally:
+            self._request_cache = previous
+
+    def _request_cache_key(self, method: str, url: str, kwargs: Dict[str, Any]) -> Optional[bytes]:
+        """Cache key for a read-only request, or None if it must not be cached."""
+        if self._request_cache is None:
+            return None
+        read_only = method == "GET" or (
+            method == "POST" and url.endswith(("/search", "/batch/read"))
+        )
+        if not read_only:
+            return None
+
+        canonical = json_utils.dumps(
+            {"m": method, "u": url, "p": kwargs.get('json'), "q": kwargs.get('params')},
+            sort_keys=True
+        )
+        return hashlib.blake2b(canonical, digest_size=16).digest()
+
+    def _invalidate_requests(self, object_type: str) -> None:
+        """Drop cached responses for an object type's endpoints."""
+        if not self._request_cache:
+            return
+        prefix = self._object_url(object_type)
+        for key, (url, _) in list(self._request_cache.items()):
+            if url.startswith(prefix):
+                self._request_cache.pop(key, None)
+
+    def map_parallel(
+        self,
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        workers: int = 16
+    ) -> List[Any]:
+        """
+        Run independent API calls concurrently, preserving input order.
+
+        Calls are I/O-bound, so threads overlap HubSpot latency while the
+        shared token bucket in _rate_limit keeps the request rate in check.
+        The first exception raised by fn is re-raised to the caller.
+
+        Args:
+            fn: Callable taking one item (e.g., client.create_line_item)
+            items: Items to pass to fn
+            workers: Max concurrent calls (capped by POOL_MAXSIZE)
+
+        Returns:
+            List of fn results in the same order as items
+
+        Example:
+            >>> client.map_parallel(client.get_product_by_sku, ["SKU-1", "SKU-2"])
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [fn(item) for item in items]
+
+        max_workers = min(workers, self.POOL_MAXSIZE, len(items))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fn, items))
+
+    def _object_url(self, object_type: str) -> str:
+        """Base URL for a CRM object type (precomputed for known types)."""
+        url = self._object_urls.get(object_type)
+        if url is None:
+            url = f"{self.base_url}/crm/v3/objects/{object_type}"
+        return url
+
+    def _search_url(self, object_type: str) -> str:
+        """Search URL for a CRM object type (precomputed for known types)."""
+        url = self._search_urls.get(object_type)
+        if url is None:
+            url = f"{self._object_url(object_type)}/search"
+        return url
+
+    @staticmethod
+    def _parse(response: requests.Response) -> Dict:
+        """
+        Parse a JSON response body (empty body -> {}).
+
+        Parses response.content (bytes) directly rather than response.json(),
+        which decodes the whole body to a str before parsing it.
+        """
+        if not response.content:
+            return {}
+        return json_utils.loads(response.content)
+
+    # ========================================================================
+    # Lookup Cache
+    # ========================================================================
+
+    def _cached_lookup(
+        self,
+        object_type: str,
+        property_name: str,
+        value: Any,
+        search: Callable[[], Optional[Dict]]
+    ) -> Optional[Dict]:
+        """
+        Return a cached lookup result, running search() on a miss.
+
+        Not-found results (None) are cached too; creates invalidate them.
+        """
+        key = (object_type, property_name, str(value))
+        if key in self._lookup_cache:
+            return self._lookup_cache[key]
+
+        result = search()
+        if len(self._lookup_cache) >= self.LOOKUP_CACHE_SIZE:
+            self._lookup_cache.clear()
+        self._lookup_cache[key] = result
+        return result
+
+    def _cached_lookup_many(
+        self,
+        object_type: str,
+        property_name: str,
+        values: List[Any],
+        properties: Optional[List[str]] = None
+    ) -> Dict[str, Dict]:
+        """
+        Batch version of _cached_lookup: search only uncached values, then cache all.
+        """
+        keys = list(dict.fromkeys(str(v) for v in values))
+        found = {}
+        missing = []
+        for value in keys:
+            cache_key = (object_type, property_name, value)
+            if cache_key in self._lookup_cache:
+                if self._lookup_cache[cache_key] is not None:
+                    found[value] = self._lookup_cache[cache_key]
+            else:
+                missing.append(value)
+
+        if missing:
+            results = self.search_objects_batch(
+                object_type, property_name, missing, properties=properties
+            )
+            found.update(results)
+            if len(self._lookup_cache) + len(missing) > self.LOOKUP_CACHE_SIZE:
+                self._lookup_cache.clear()
+            for value in missing:
+                self._lookup_cache[(object_type, property_name, value)] = results.get(value)
+
+        return found
+
+    def invalidate_cache(self, object_type: Optional[str] = None) -> None:
+        """
+        Drop cached property lookups.
+
+        Args:
+            object_type: Only drop entries for this type (None drops everything)
+        """
+        if object_type is None:
+            self._lookup_cache.clear()
+            if self._request_cache:
+                self._request_cache.clear()
+            return
+        for key in [k for k in self._lookup_cache if k[0] == object_type]:
+            self._lookup_cache.pop(key, None)
+        self._invalidate_requests(object_type)
+
+    def _invalidate_misses(self, object_type: str) -> None:
+        """Drop cached not-found lookups for a type (a create can only turn misses into hits)."""
+        for key, obj in list(self._lookup_cache.items()):
+            if key[0] == object_type and obj is None:
+                self._lookup_cache.pop(key, None)
+        self._invalidate_requests(object_type)
+
+    def _invalidate_object(self, object_type: str, object_id: Any) -> None:
+        """Drop cached lookups that resolved to the given object."""
+        object_id = str(object_id)
+        for key, obj in list(self._lookup_cache.items()):
+            if key[0] == object_type and obj and str(obj.get('id')) == object_id:
+                self._lookup_cache.pop(key, None)
+        # Cached searches may include the object, so drop the type's responses
+        self._invalidate_requests(object_type)
+
     # ========================================================================
     # Generic Object Methods
     # ========================================================================
@@ -141,7 +609,9 @@ class HubSpotClient:
         Args:
             object_type: Type of object (companies, contacts, deals, products, line_items)
             filter_groups: HubSpot filter groups for search
-            properties: List of properties to return
+            properties: List of properties to return. Without it HubSpot sends
+                its (large) default property set, so pass the minimum needed;
+                for ID-only existence checks use ["hs_object_id"].
             limit: Maximum number of results per request
 
         Returns:
@@ -154,7 +624,7 @@ class HubSpotClient:
             ...     properties=["name", "city"]
             ... )
         """
-        url = f"{self.base_url}/crm/v3/objects/{object_type}/search"
+        url = self._search_url(object_type)
         payload = {
             "filterGroups": filter_groups,
             "limit": limit
@@ -164,7 +634,194 @@ class HubSpotClient:
             payload["properties"] = properties
 
         response = self._make_request("POST", url, json=payload)
-        return response.json().get('results', [])
+        return self._parse(response).get('results', [])
+
+    def iter_search(
+        self,
+        object_type: str,
+        filter_groups: List[Dict],
+        properties: Optional[List[str]] = None,
+        limit: int = 100
+    ) -> Iterator[Dict]:
+        """
+        Lazily iterate over all search results, fetching pages on demand.
+
+        The next page (paging.next.after) is only requested once the caller
+        has consumed the current one, so stopping early saves requests.
+
+        Args:
+            object_type: Type of object (companies, contacts, deals, products, line_items)
+            filter_groups: HubSpot filter groups for search
+            properties: List of properties to return
+            limit: Page size
+
+        Yields:
+            Matching objects
+
+        Example:
+            >>> for deal in client.iter_search("deals", filter_groups, properties=["dealname"]):
+            ...     print(deal["id"])
+        """
+        url = self._search_url(object_type)
+        payload = {
+            "filterGroups": filter_groups,
+            "limit": limit
+        }
+        if properties:
+            payload["properties"] = properties
+
+        while True:
+            data = self._parse(self._make_request("POST", url, json=payload))
+            yield from data.get('results', [])
+
+            after = data.get('paging', {}).get('next', {}).get('after')
+            if not after:
+                return
+            payload = {**payload, "after": after}
+
+    def _find_first(
+        self,
+        object_type: str,
+        property_name: str,
+        value: str,
+        properties: List[str]
+    ) -> Optional[Dict]:
+        """First object whose property equals value (single-result search), or None."""
+        # One request, no paging: skip iter_search's generator and build the
+        # payload in one literal. properties is a shared class constant and is
+        # only read by the serializer, never mutated, so threads can share it.
+        payload = {
+            "filterGroups": [{
+                "filters": [{"propertyName": property_name, "operator": "EQ", "value": value}]
+            }],
+            "properties": properties,
+            "limit": 1
+        }
+        results = self._parse(
+            self._make_request("POST", self._search_url(object_type), json=payload)
+        ).get('results')
+        return results[0] if results else None
+
+    def search_objects_batch(
+        self,
+        object_type: str,
+        property_name: str,
+        values: List[Any],
+        properties: Optional[List[str]] = None
+    ) -> Dict[str, Dict]:
+        """
+        Find many objects by property value with IN-filter searches.
+
+        Values are searched BATCH_SIZE at a time (HubSpot's IN-filter limit),
+        so N lookups cost ceil(N/100) requests instead of N. HubSpot only
+        matches IN values on string properties when they are lowercase, so
+        values are sent lowercased and results are matched back
+        case-insensitively.
+
+        Args:
+            object_type: Type of object (companies, contacts, deals, products, line_items)
+            property_name: Property to match on (e.g., 'epicor_line_item_id')
+            values: Values to look up (duplicates are ignored)
+            properties: List of properties to return (property_name is always included)
+
+        Returns:
+            Dict mapping each requested value (as string, original case) to its
+            object. Values with no match are absent from the dict.
+
+        Example:
+            >>> client.search_objects_batch(
+            ...     "line_items", "epicor_line_item_id", ["Q1001-1", "Q1001-2"]
+            ... )
+            {'Q1001-1': {'id': '123', 'properties': {...}}}
+        """
+        unique_values = list(dict.fromkeys(str(v) for v in values))
+        if not unique_values:
+            return {}
+
+        # Lowercased value -> requested values (e.g. SKUs differing only in case)
+        requested: Dict[str, List[str]] = {}
+        for value in unique_values:
+            requested.setdefault(value.lower(), []).append(value)
+        # Same sanitizing as get_product_by_sku: search rejects unescaped quotes
+        search_values = [value.replace('"', '\\"') for value in requested]
+
+        url = self._search_url(object_type)
+        return_properties = list(properties or [])
+        if property_name not in return_properties:
+            return_properties.append(property_name)
+
+        found = {}
+        for chunk in _chunked(search_values, self.BATCH_SIZE):
+            payload = {
+                "filterGroups": [{
+                    "filters": [{
+                        "propertyName": property_name,
+                        "operator": "IN",
+                        "values": chunk
+                    }]
+                }],
+                "properties": return_properties,
+                "limit": self.BATCH_SIZE
+            }
+
+            # Paginate in case a value matches more than one object
+            while True:
+                data = self._raw_request("POST", url, payload)
+                for obj in data.get('results', []):
+                    value = obj.get('properties', {}).get(property_name)
+                    if value is None:
+                        continue
+                    for requested_value in requested.get(str(value).lower(), ()):
+                        found.setdefault(requested_value, obj)
+
+                after = data.get('paging', {}).get('next', {}).get('after')
+                if not after:
+                    break
+                payload["after"] = after
+
+        self.logger.debug(
+            "Batch search %s.%s: %d/%d found",
+            object_type, property_name, len(found), len(unique_values)
+        )
+        return found
+
+    def batch_read_objects(
+        self,
+        object_type: str,
+        ids: List[Any],
+        properties: Optional[List[str]] = None,
+        id_property: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Fetch many objects by ID using the batch read endpoint.
+
+        Args:
+            object_type: Type of object (companies, contacts, deals, products, line_items)
+            ids: HubSpot object IDs, or values of id_property if given
+            properties: List of properties to return
+            id_property: Optional unique property to look up by instead of hs_object_id
+
+        Returns:
+            List of found objects (IDs that don't exist are omitted)
+
+        Example:
+            >>> client.batch_read_objects("deals", ["123", "456"], properties=["dealstage"])
+        """
+        url = f"{self._object_url(object_type)}/batch/read"
+        unique_ids = list(dict.fromkeys(str(i) for i in ids))
+
+        results = []
+        for chunk in _chunked(unique_ids, self.BATCH_SIZE):
+            payload = {
+                "properties": properties or [],
+                "inputs": [{"id": object_id} for object_id in chunk]
+            }
+            if id_property:
+                payload["idProperty"] = id_property
+
+            results.extend(self._raw_request("POST", url, payload).get('results', []))
+
+        return results
 
     def create_object(
         self,
@@ -184,13 +841,14 @@ class HubSpotClient:
         Example:
             >>> client.create_object("companies", {"name": "ACME Corp", "city": "Toronto"})
         """
-        url = f"{self.base_url}/crm/v3/objects/{object_type}"
+        url = self._object_url(object_type)
         payload = {"properties": properties}
 
         response = self._make_request("POST", url, json=payload)
-        result = response.json()
+        result = self._parse(response)
+        self._invalidate_misses(object_type)
 
-        self.logger.debug(f"Created {object_type} with ID {result.get('id')}")
+        self.logger.debug("Created %s with ID %s", object_type, result.get('id'))
         return result
 
     def update_object(
@@ -213,15 +871,107 @@ class HubSpotClient:
         Example:
             >>> client.update_object("companies", "123456", {"city": "Montreal"})
         """
-        url = f"{self.base_url}/crm/v3/objects/{object_type}/{object_id}"
+        url = f"{self._object_url(object_type)}/{object_id}"
         payload = {"properties": properties}
 
         response = self._make_request("PATCH", url, json=payload)
-        result = response.json()
+        result = self._parse(response)
+        self._invalidate_object(object_type, object_id)
 
-        self.logger.debug(f"Updated {object_type} ID {object_id}")
+        self.logger.debug("Updated %s ID %s", object_type, object_id)
         return result
 
+    def create_objects_batch(
+        self,
+        object_type: str,
+        properties_list: List[Dict[str, Any]]
+    ) -> List[Dict]:
+        """
+        Create many HubSpot objects with the batch create endpoint.
+
+        Inputs are sent BATCH_SIZE per request.
+
+        Args:
+            object_type: Type of object (companies, contacts, deals, products, line_items)
+            properties_list: One properties dict per object to create
+
+        Returns:
+            Created objects with IDs (concatenated across chunks)
+
+        Example:
+            >>> client.create_objects_batch("line_items", [{"name": "A"}, {"name": "B"}])
+        """
+        url = f"{self._object_url(object_type)}/batch/create"
+
+        results = []
+        for chunk in _chunked(properties_list, self.BATCH_SIZE):
+            payload = {"inputs": [{"properties": properties} for properties in chunk]}
+            response = self._make_request("POST", url, json=payload)
+            data = self._parse(response)
+            results.extend(data.get('results', []))
+            self._log_batch_errors("create", object_type, data)
+
+        if results:
+            self._invalidate_misses(object_type)
+        self.logger.debug("Batch created %d %s", len(results), object_type)
+        return results
+
+    def _log_batch_errors(self, operation: str, object_type: str, data: Dict) -> None:
+        """
+        Log per-record failures from a batch response (HTTP 207 Multi-Status).
+
+        Args:
+            operation: Batch operation name (create, update)
+            object_type: Type of object written
+            data: Parsed batch response
+        """
+        errors = data.get('errors')
+        if errors:
+            self.logger.warning(
+                "Batch %s of %s had %d failed records: %s",
+                operation, object_type, len(errors), errors[0].get('message')
+            )
+
+    def update_objects_batch(
+        self,
+        object_type: str,
+        updates: List[Dict[str, Any]]
+    ) -> List[Dict]:
+        """
+        Update many HubSpot objects with the batch update endpoint.
+
+        Inputs are sent BATCH_SIZE per request.
+
+        Args:
+            object_type: Type of object (companies, contacts, deals, products, line_items)
+            updates: List of {"id": ..., "properties": {...}} dicts
+
+        Returns:
+            Updated objects (concatenated across chunks)
+
+        Example:
+            >>> client.update_objects_batch("deals", [{"id": "123", "properties": {"amount": "10"}}])
+        """
+        url = f"{self._object_url(object_type)}/batch/update"
+
+        results = []
+        for chunk in _chunked(updates, self.BATCH_SIZE):
+            payload = {
+                "inputs": [
+                    {"id": str(update['id']), "properties": update['properties']}
+                    for update in chunk
+                ]
+            }
+            response = self._make_request("POST", url, json=payload)
+            data = self._parse(response)
+            results.extend(data.get('results', []))
+            self._log_batch_errors("update", object_type, data)
+
+        for update in updates:
+            self._invalidate_object(object_type, update['id'])
+        self.logger.debug("Batch updated %d %s", len(results), object_type)
+        return results
+
     def delete_object(
         self,
         object_type: str,
@@ -240,10 +990,11 @@ class HubSpotClient:
         Example:
             >>> client.delete_object("companies", "123456")
         """
-        url = f"{self.base_url}/crm/v3/objects/{object_type}/{object_id}"
+        url = f"{self._object_url(object_type)}/{object_id}"
 
         self._make_request("DELETE", url)
-        self.logger.debug(f"Deleted {object_type} ID {object_id}")
+        self._invalidate_object(object_type, object_id)
+        self.logger.debug("Deleted %s ID %s", object_type, object_id)
         return True
 
     # ========================================================================
@@ -273,9 +1024,9 @@ class HubSpotClient:
 
         url = f"{self.base_url}/crm/v4/associations/{from_object}/{to_object}/labels"
         response = self._make_request("GET", url)
-        labels = response.json().get('results', [])
+        labels = self._parse(response).get('results', [])
 
-        self.logger.debug(f"Association labels for {from_object} -> {to_object}: {labels}")
+        self.logger.debug("Association labels for %s -> %s: %s", from_object, to_object, labels)
 
         type_id = None
         for assoc in labels:
@@ -296,7 +1047,7 @@ class HubSpotClient:
             raise HubSpotAPIError(f"No association type found for {from_object} -> {to_object}")
 
         self._association_type_cache[cache_key] = type_id
-        self.logger.info(f"Association type ID for {from_object} -> {to_object}: {type_id}")
+        self.logger.info("Association type ID for %s -> %s: %s", from_object, to_object, type_id)
         return type_id
 
     def create_association(
@@ -323,6 +1074,83 @@ class HubSpotClient:
         Returns:
             True if successful
         """
+        type_name = self._v3_association_type_name(from_object, to_object, association_type_id)
+
+        url = (
+            f"{self._object_url(from_object)}/{from_id}/"
+            f"associations/{to_object}/{to_id}/{type_name}"
+        )
+
+        self._make_request("PUT", url)
+        self.logger.debug(
+            "Created association: %s/%s -> %s/%s (%s)",
+            from_object, from_id, to_object, to_id, type_name
+        )
+        return True
+
+    def create_associations_batch(
+        self,
+        from_object: str,
+        to_object: str,
+        pairs: List[Tuple[str, str]],
+        association_type_id: int
+    ) -> Dict[str, bool]:
+        """
+        Create many associations between two object types using the v3 batch API.
+
+        Uses v3 for the same reason as create_association (v4 does not persist
+        associations reliably). Pairs are sent BATCH_SIZE per request.
+
+        Args:
+            from_object: Source object type (e.g., "line_items")
+            to_object: Target object type (e.g., "deals")
+            pairs: List of (from_id, to_id) tuples
+            association_type_id: HubSpot association type ID (used to derive v3 type name)
+
+        Returns:
+            Dict mapping each from_id to True if associated, False if HubSpot
+            reported it as failed
+        """
+        type_name = self._v3_association_type_name(from_object, to_object, association_type_id)
+        url = f"{self.base_url}/crm/v3/associations/{from_object}/{to_object}/batch/create"
+
+        status = {}
+        for chunk in _chunked(pairs, self.BATCH_SIZE):
+            payload = {
+                "inputs": [
+                    {"from": {"id": str(from_id)}, "to": {"id": str(to_id)}, "type": type_name}
+                    for from_id, to_id in chunk
+                ]
+            }
+            data = self._parse(self._make_request("POST", url, json=payload))
+
+            # Partial failures come back as 207 with an "errors" list; only
+            # inputs echoed in "results" succeeded in that case
+            if data.get('errors'):
+                associated = {
+                    str(result.get('from', {}).get('id'))
+                    for result in data.get('results', [])
+                }
+                for from_id, _ in chunk:
+                    status[str(from_id)] = str(from_id) in associated
+            else:
+                for from_id, _ in chunk:
+                    status[str(from_id)] = True
+
+        failed = sum(1 for ok in status.values() if not ok)
+        self.logger.debug(
+            "Batch created %d associations: %s -> %s (%s), %d failed",
+            len(pairs) - failed, from_object, to_object, type_name, failed
+        )
+        return status
+
+    @staticmethod
+    def _v3_association_type_name(
+        from_object: str,
+        to_object: str,
+        association_type_id: int
+    ) -> str:
+        """Map a v4 association type ID (or object pair) to its v3 type name."""
         # Map from v4 type IDs to v3 association type names
         v3_type_names = {
             341: "deal_to_company",
@@ -339,17 +1167,7 @@ class HubSpotClient:
             from_singular = from_object.rstrip('s').replace('line_item', 'line_item')
             to_singular = to_object.rstrip('s').replace('ie', 'y')
             type_name = f"{from_singular}_to_{to_singular}"
-
-        url = (
-            f"{self.base_url}/crm/v3/objects/{from_object}/{from_id}/"
-            f"associations/{to_object}/{to_id}/{type_name}"
-        )
-
-        self._make_request("PUT", url)
-        self.logger.debug(
-            f"Created association: {from_object}/{from_id} -> {to_object}/{to_id} ({type_name})"
-        )
-        return True
+        return type_name
 
     # ========================================================================
     # Convenience Methods for Common Operations
@@ -370,12 +1188,10 @@ class HubSpotClient:
         Returns:
             Deal object if found, None otherwise
         """
-        results = self.search_objects(
-            "deals",
-            [{"filters": [{"propertyName": property_name, "operator": "EQ", "value": str(value)}]}],
-            properties=["dealname", "dealstage", "pipeline", "amount"]
-        )
-        return results[0] if results else None
+        def search():
+            return self._find_first("deals", property_name, str(value), self.DEAL_LOOKUP_PROPERTIES)
+
+        return self._cached_lookup("deals", property_name, value, search)
 
     def get_company_by_property(
         self,
@@ -392,27 +1208,77 @@ class HubSpotClient:
         Returns:
             Company object if found, None otherwise
         """
-        results = self.search_objects(
-            "companies",
-            [{"filters": [{"propertyName": property_name, "operator": "EQ", "value": str(value)}]}]
+        def search():
+            return self._find_first(
+                "companies", property_name, str(value), self.COMPANY_LOOKUP_PROPERTIES
+            )
+
+        return self._cached_lookup("companies", property_name, value, search)
+
+    def get_deals_by_property(
+        self,
+        property_name: str,
+        values: List[Any],
+        properties: Optional[List[str]] = None
+    ) -> Dict[str, Dict]:
+        """
+        Find many deals by property value in batched IN-filter searches.
+
+        Results (including misses) seed the lookup cache used by
+        get_deal_by_property.
+
+        Args:
+            property_name: Property to search by (e.g., 'epicor_quote_number')
+            values: Values to match
+            properties: Properties to return (defaults to DEAL_LOOKUP_PROPERTIES)
+
+        Returns:
+            Dict mapping value (as string) to deal object (missing values omitted)
+        """
+        return self._cached_lookup_many(
+            "deals", property_name, values,
+            properties=properties or self.DEAL_LOOKUP_PROPERTIES
+        )
+
+    def get_companies_by_property(
+        self,
+        property_name: str,
+        values: List[Any]
+    ) -> Dict[str, Dict]:
+        """
+        Find many companies by property value in batched IN-filter searches.
+
+        Results (including misses) seed the lookup cache used by
+        get_company_by_property.
+
+        Args:
+            property_name: Property to search by (e.g., 'epicor_customer_number')
+            values: Values to match
+
+        Returns:
+            Dict mapping value (as string) to company object (missing values omitted)
+        """
+        return self._cached_lookup_many(
+            "companies", property_name, values, properties=self.COMPANY_LOOKUP_PROPERTIES
         )
-        return results[0] if results else None
 
-    def create_deal(self, properties: Dict[str, Any]) -> Optional[Dict]:
-        """Create a deal. Convenience wrapper around create_object."""
-        return self.create_object("deals", properties)
+    # Create a deal. Convenience wrapper around create_object.
+    create_deal = partialmethod(create_object, "deals")
 
-    def update_deal(self, deal_id: str, properties: Dict[str, Any]) -> Optional[Dict]:
-        """Update a deal. Convenience wrapper around update_object."""
-        return self.update_object("deals", deal_id, properties)
+    # Update a deal. Convenience wrapper around update_object.
+    update_deal = partialmethod(update_object, "deals")
 
-    def create_company(self, properties: Dict[str, Any]) -> Optional[Dict]:
-        """Create a company. Convenience wrapper around create_object."""
-        return self.create_object("companies", properties)
+    # Create a company. Convenience wrapper around create_object.
+    create_company = partialmethod(create_object, "companies")
 
-    def update_company(self, company_id: str, properties: Dict[str, Any]) -> Optional[Dict]:
-        """Update a company. Convenience wrapper around update_object."""
-        return self.update_object("companies", company_id, properties)
+    # Update a company. Convenience wrapper around update_object.
+    update_company = partialmethod(update_object, "companies")
+
+    # Create many companies. Convenience wrapper around create_objects_batch.
+    create_companies_batch = partialmethod(create_objects_batch, "companies")
+
+    # Update many companies. Convenience wrapper around update_objects_batch.
+    update_companies_batch = partialmethod(update_objects_batch, "companies")
 
     def associate_deal_to_company(self, deal_id: str, company_id: str) -> bool:
         """
@@ -435,6 +1301,26 @@ class HubSpotClient:
             association_type_id=type_id
         )
 
+    def associate_deals_to_companies(self, pairs: List[Tuple[str, str]]) -> Dict[str, bool]:
+        """
+        Associate many deals with their companies in batch.
+
+        Args:
+            pairs: List of (deal_id, company_id) tuples
+
+        Returns:
+            Dict mapping deal ID to whether it was associated
+        """
+        if not pairs:
+            return {}
+        type_id = self.get_association_type_id("deals", "companies")
+        return self.create_associations_batch(
+            from_object="deals",
+            to_object="companies",
+            pairs=pairs,
+            association_type_id=type_id
+        )
+
     def associate_deal_to_deal(self, from_deal_id: str, to_deal_id: str) -> bool:
         """
         Associate two deals together (e.g., Quote deal to Order deal).
@@ -459,9 +1345,8 @@ class HubSpotClient:
     # Line Item Methods
     # ========================================================================
 
-    def create_line_item(self, properties: Dict[str, Any]) -> Optional[Dict]:
-        """Create a line item. Convenience wrapper around create_object."""
-        return self.create_object("line_items", properties)
+    # Create a line item. Convenience wrapper around create_object.
+    create_line_item = partialmethod(create_object, "line_items")
 
     def associate_line_item_to_deal(self, line_item_id: str, deal_id: str) -> bool:
         """
@@ -483,6 +1368,33 @@ class HubSpotClient:
             association_type_id=type_id
         )
 
+    # Create many line items. Convenience wrapper around create_objects_batch.
+    create_line_items_batch = partialmethod(create_objects_batch, "line_items")
+
+    # Update many line items. Convenience wrapper around update_objects_batch.
+    update_line_items_batch = partialmethod(update_objects_batch, "line_items")
+
+    def associate_line_items_to_deal(self, line_item_ids: List[str], deal_id: str) -> Dict[str, bool]:
+        """
+        Associate many line items with a single deal in batch.
+
+        Args:
+            line_item_ids: HubSpot line item IDs
+            deal_id: HubSpot deal ID
+
+        Returns:
+            Dict mapping line item ID to whether it was associated
+        """
+        if not line_item_ids:
+            return {}
+        type_id = self.get_association_type_id("line_items", "deals")
+        return self.create_associations_batch(
+            from_object="line_items",
+            to_object="deals",
+            pairs=[(line_item_id, deal_id) for line_item_id in line_item_ids],
+            association_type_id=type_id
+        )
+
     def get_line_item_by_epicor_id(self, epicor_line_item_id: str) -> Optional[Dict]:
         """
         Find a line item by its Epicor unique identifier.
@@ -493,16 +1405,32 @@ class HubSpotClient:
         Returns:
             Line item object if found, None otherwise
         """
-        results = self.search_objects(
+        return self._find_first(
             "line_items",
-            [{"filters": [{"propertyName": "epicor_line_item_id", "operator": "EQ", "value": epicor_line_item_id}]}],
+            "epicor_line_item_id",
+            epicor_line_item_id,
+            ["name", "sku", "quantity", "price", "amount", "epicor_line_item_id"]
+        )
+
+    def get_line_items_by_epicor_ids(self, epicor_line_item_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Find many line items by Epicor unique identifier in batched searches.
+
+        Args:
+            epicor_line_item_ids: Unique IDs (e.g., ['Q1234-1', 'Q1234-2'])
+
+        Returns:
+            Dict mapping epicor_line_item_id to line item object (missing IDs omitted)
+        """
+        return self.search_objects_batch(
+            "line_items",
+            "epicor_line_item_id",
+            epicor_line_item_ids,
             properties=["name", "sku", "quantity", "price", "amount", "epicor_line_item_id"]
         )
-        return results[0] if results else None
 
-    def update_line_item(self, line_item_id: str, properties: Dict[str, Any]) -> Optional[Dict]:
-        """Update a line item. Convenience wrapper around update_object."""
-        return self.update_object("line_items", line_item_id, properties)
+    # Update a line item. Convenience wrapper around update_object.
+    update_line_item = partialmethod(update_object, "line_items")
 
     # ========================================================================
     # Product Methods
@@ -518,21 +1446,42 @@ class HubSpotClient:
         Returns:
             Product object if found, None otherwise
         """
-        # Sanitize SKU: HubSpot search API rejects values with unescaped quotes
-        sanitized_sku = sku.replace('"', '\\"')
-        results = self.search_objects(
-            "products",
-            [{"filters": [{"propertyName": "hs_sku", "operator": "EQ", "value": sanitized_sku}]}]
+        def search():
+            # Sanitize SKU: HubSpot search API rejects values with unescaped quotes
+            sanitized_sku = sku.replace('"', '\\"')
+            return self._find_first(
+                "products", "hs_sku", sanitized_sku, self.PRODUCT_LOOKUP_PROPERTIES
+            )
+
+        return self._cached_lookup("products", "hs_sku", sku, search)
+
+    def get_products_by_skus(self, skus: List[str]) -> Dict[str, Dict]:
+        """
+        Find many products by SKU in batched IN-filter searches.
+
+        Results (including misses) seed the lookup cache used by get_product_by_sku.
+
+        Args:
+            skus: Product SKUs (hs_sku in HubSpot)
+
+        Returns:
+            Dict mapping SKU to product object (missing SKUs omitted)
+        """
+        return self._cached_lookup_many(
+            "products", "hs_sku", skus, properties=self.PRODUCT_LOOKUP_PROPERTIES
         )
-        return results[0] if results else None
 
-    def create_product(self, properties: Dict[str, Any]) -> Optional[Dict]:
-        """Create a product. Convenience wrapper around create_object."""
-        return self.create_object("products", properties)
+    # Create a product. Convenience wrapper around create_object.
+    create_product = partialmethod(create_object, "products")
+
+    # Update a product. Convenience wrapper around update_object.
+    update_product = partialmethod(update_object, "products")
+
+    # Create many products. Convenience wrapper around create_objects_batch.
+    create_products_batch = partialmethod(create_objects_batch, "products")
 
-    def update_product(self, product_id: str, properties: Dict[str, Any]) -> Optional[Dict]:
-        """Update a product. Convenience wrapper around update_object."""
-        return self.update_object("products", product_id, properties)
+    # Update many products. Convenience wrapper around update_objects_batch.
+    update_products_batch = partialmethod(update_objects_batch, "products")
 
     # ========================================================================
     # Connection Test
@@ -551,5 +1500,5 @@ class HubSpotClient:
             self.logger.info("✓ HubSpot connection successful")
             return True
         except Exception as e:
-            self.logger.error(f"✗ HubSpot connection failed: {e}")
+            self.logger.error("✗ HubSpot connection failed: %s", e)
             return False
\ No newline at end of file
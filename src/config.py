@@ -9,49 +9,184 @@ For local development, credentials are loaded from .env file.
 """
 
 import os
-import json
-from typing import Optional, Dict, Any
-from pydantic import Field, field_validator
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Literal
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, field_validator
 from pydantic_settings import BaseSettings
 import logging
+from dotenv import load_dotenv
+
+from .utils import json_utils
 
 logger = logging.getLogger(__name__)
 
+# Azure SDK classes, imported on first use: the SDK is slow to import and only needed
+# when secrets are fetched from Key Vault (not installed in all local setups)
+DefaultAzureCredential = None
+SecretClient = None
+
 
 # =============================================================================
 # Azure Key Vault Integration
 # =============================================================================
 
-def load_secrets_from_cloud(vault_url: Optional[str] = None) -> bool:
+# Key Vault client reused across warm Function invocations: building the
+# credential and client (token acquisition, TLS session) is the slow part
+_SECRET_CLIENT: Optional[Any] = None
+_SECRET_CLIENT_VAULT_URL: Optional[str] = None
+
+
+def _import_azure_sdk() -> None:
+    """
+    Import the Key Vault SDK classes into module scope if not already loaded.
+
+    Raises:
+        ImportError: If azure-identity or azure-keyvault-secrets is not installed
+    """
+    global DefaultAzureCredential, SecretClient
+
+    if SecretClient is None or DefaultAzureCredential is None:
+        try:
+            from azure.identity import DefaultAzureCredential
+            from azure.keyvault.secrets import SecretClient
+        except ImportError as e:
+            raise ImportError("azure-identity or azure-keyvault-secrets not installed") from e
+
+
+def _get_secret_client(vault_url: str) -> Any:
+    """
+    Get the cached Key Vault SecretClient, creating it on first use.
+
+    Args:
+        vault_url: URL of the Azure Key Vault
+
+    Returns:
+        SecretClient for vault_url
+
+    Raises:
+        ImportError: If azure-identity or azure-keyvault-secrets is not installed
+    """
+    global _SECRET_CLIENT, _SECRET_CLIENT_VAULT_URL
+
+    _import_azure_sdk()
+
+    if _SECRET_CLIENT is None or _SECRET_CLIENT_VAULT_URL != vault_url:
+        _SECRET_CLIENT = SecretClient(vault_url=vault_url, credential=DefaultAzureCredential())
+        _SECRET_CLIENT_VAULT_URL = vault_url
+
+    return _SECRET_CLIENT
+
+
+# Map Key Vault secret names (hyphenated) to environment variable names (underscored)
+SECRET_ENV_MAPPING = {
+    "epicor-base-url": "EPICOR_BASE_URL",
+    "epicor-company": "EPICOR_COMPANY",
+    "epicor-username": "EPICOR_USERNAME",
+    "epicor-password": "EPICOR_PASSWORD",
+    "epicor-api-key": "EPICOR_API_KEY",
+    "hubspot-api-key": "HUBSPOT_API_KEY",
+    "hubspot-quotes-pipeline-id": "HUBSPOT_QUOTES_PIPELINE_ID",
+    "hubspot-orders-pipeline-id": "HUBSPOT_ORDERS_PIPELINE_ID",
+}
+
+# App setting values that the platform failed to resolve keep this literal prefix
+KEY_VAULT_REFERENCE_PREFIX = "@Microsoft.KeyVault("
+
+# Set once secrets have been loaded into the environment for this process
+_SECRETS_LOADED = False
+_SECRETS_LOCK = threading.Lock()
+
+
+def _fetch_secrets(client: Any, secret_names: List[str]) -> Dict[str, Optional[str]]:
+    """
+    Fetch several Key Vault secrets in parallel.
+
+    Args:
+        client: Key Vault SecretClient (thread-safe)
+        secret_names: Names of the secrets to fetch
+
+    Returns:
+        Dict mapping secret name to value (None if it could not be loaded)
+    """
+    def fetch(secret_name: str) -> Optional[str]:
+        try:
+            return client.get_secret(secret_name).value
+        except Exception as e:
+            logger.warning("Could not load secret '%s': %s", secret_name, e)
+            return None
+
+    if not secret_names:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=len(secret_names)) as executor:
+        return dict(zip(secret_names, executor.map(fetch, secret_names)))
+
+
+def load_secrets_from_cloud(
+    vault_url: Optional[str] = None,
+    bundle_secret_name: Optional[str] = None
+) -> bool:
     """
     Load secrets from Azure Key Vault and set as environment variables.
 
     This function should be called BEFORE Settings() is instantiated.
     It detects if running in Azure Functions and loads credentials from Key Vault.
+    Only secrets whose environment variable is not already set are fetched.
 
     Args:
         vault_url: URL of the Azure Key Vault.
                    Defaults to env var AZURE_KEYVAULT_URL.
+        bundle_secret_name: Optional single secret whose value is a JSON object
+                   of environment variable names to values, fetched in one call.
+                   Defaults to env var AZURE_KEYVAULT_BUNDLE_SECRET; when unset the
+                   individual secrets below are fetched concurrently.
 
     Returns:
-        True if secrets were loaded, False if skipped (local development)
+        True if secrets were loaded (now or by an earlier call), False if skipped
+        (local development)
 
     Expected Key Vault secrets (stored individually, names use hyphens):
         epicor-base-url, epicor-company, epicor-username, epicor-password,
         epicor-api-key, hubspot-api-key, hubspot-quotes-pipeline-id,
         hubspot-orders-pipeline-id
     """
+    global _SECRETS_LOADED
+
+    if _SECRETS_LOADED:
+        return True
+
+    # Serialize concurrent callers so Key Vault is only queried once per process
+    with _SECRETS_LOCK:
+        if not _SECRETS_LOADED:
+            _SECRETS_LOADED = _load_secrets_from_cloud(vault_url, bundle_secret_name)
+        return _SECRETS_LOADED
+
+
+def _load_secrets_from_cloud(
+    vault_url: Optional[str],
+    bundle_secret_name: Optional[str]
+) -> bool:
+    """Load secrets from Key Vault; see load_secrets_from_cloud()."""
     # Check if running in Azure Functions (set by Azure runtime)
     is_azure = os.environ.get('AZURE_FUNCTIONS_ENVIRONMENT') is not None
 
-    # Also check if secrets are already present (e.g., from .env in local dev)
-    has_credentials = os.environ.get('EPICOR_BASE_URL') is not None
-
     if not is_azure:
         logger.info("Not running in Azure Functions - skipping Key Vault")
         return False
 
-    if has_credentials:
+    # Only fetch secrets that are not already present (e.g., resolved by the platform
+    # from Key Vault references in app settings). An unresolved reference is left as
+    # its literal text, so it still counts as missing.
+    secret_mapping = {
+        secret_name: env_key
+        for secret_name, env_key in SECRET_ENV_MAPPING.items()
+        if not os.environ.get(env_key, '') or
+        os.environ[env_key].startswith(KEY_VAULT_REFERENCE_PREFIX)
+    }
+
+    if not secret_mapping:
         logger.info("Credentials already set in environment - skipping Key Vault")
         return False
 
@@ -61,39 +196,38 @@ def load_secrets_from_cloud(vault_url: Optional[str] = None) -> bool:
         logger.error("AZURE_KEYVAULT_URL not set - cannot load secrets from Key Vault")
         raise ValueError("AZURE_KEYVAULT_URL environment variable is required")
 
-    logger.info(f"Loading secrets from Azure Key Vault: {vault_url}")
-
-    # Map Key Vault secret names (hyphenated) to environment variable names (underscored)
-    secret_mapping = {
-        "epicor-base-url": "EPICOR_BASE_URL",
-        "epicor-company": "EPICOR_COMPANY",
-        "epicor-username": "EPICOR_USERNAME",
-        "epicor-password": "EPICOR_PASSWORD",
-        "epicor-api-key": "EPICOR_API_KEY",
-        "hubspot-api-key": "HUBSPOT_API_KEY",
-        "hubspot-quotes-pipeline-id": "HUBSPOT_QUOTES_PIPELINE_ID",
-        "hubspot-orders-pipeline-id": "HUBSPOT_ORDERS_PIPELINE_ID",
-    }
+    logger.info("Loading secrets from Azure Key Vault: %s", vault_url)
 
     try:
-        from azure.identity import DefaultAzureCredential
-        from azure.keyvault.secrets import SecretClient
-
-        credential = DefaultAzureCredential()
-        client = SecretClient(vault_url=vault_url, credential=credential)
+        client = _get_secret_client(vault_url)
+
+        bundle_name = bundle_secret_name or os.environ.get('AZURE_KEYVAULT_BUNDLE_SECRET')
+        if bundle_name:
+            # Single secret holding a JSON object of ENV_KEY -> value: one round trip
+            bundle = json_utils.loads(client.get_secret(bundle_name).value or "{}")
+            # Keep only the known credentials that are missing, so values already set
+            # in the environment are never overwritten by the bundle
+            missing_keys = set(secret_mapping.values())
+            env_values = {
+                env_key.upper(): value if isinstance(value, str) else str(value)
+                for env_key, value in bundle.items()
+                if value and env_key.upper() in missing_keys
+            }
+        else:
+            # Key Vault has no batch get, so fetch the individual secrets concurrently
+            values = _fetch_secrets(client, list(secret_mapping))
+            env_values = {
+                env_key: values[secret_name]
+                for secret_name, env_key in secret_mapping.items()
+                if values.get(secret_name)
+            }
 
-        loaded_keys = []
-        for secret_name, env_key in secret_mapping.items():
-            try:
-                secret = client.get_secret(secret_name)
-                if secret.value:
-                    os.environ[env_key] = secret.value
-                    loaded_keys.append(env_key)
-            except Exception as e:
-                logger.warning(f"Could not load secret '{secret_name}': {e}")
+        os.environ.update(env_values)
+        loaded_keys = list(env_values)
 
-        logger.info(f"Successfully loaded {len(loaded_keys)} secrets from Azure Key Vault")
-        logger.debug(f"Loaded keys: {', '.join(loaded_keys)}")
+        logger.info("Successfully loaded %d secrets from Azure Key Vault", len(loaded_keys))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Loaded keys: %s", ', '.join(loaded_keys))
 
         return True
 
@@ -101,10 +235,31 @@ def load_secrets_from_cloud(vault_url: Optional[str] = None) -> bool:
         logger.error("azure-identity or azure-keyvault-secrets not installed")
         raise
     except Exception as e:
-        logger.error(f"Failed to load secrets from Key Vault: {e}")
+        logger.error("Failed to load secrets from Key Vault: %s", e)
         raise
 
 
+class SalesRepMapping(BaseModel):
+    """Schema of the sales rep mapping file (Epicor rep code -> HubSpot owner ID)."""
+
+    default_owner_id: Optional[str] = None
+    mappings: Dict[str, str] = {}
+
+    @field_validator("default_owner_id", "mappings", mode="before")
+    @classmethod
+    def coerce_owner_ids(cls, v: Any) -> Any:
+        """Accept numeric owner IDs as written by hand in the JSON file."""
+        if isinstance(v, int):
+            return str(v)
+        if isinstance(v, dict):
+            return {k: str(o) if isinstance(o, int) else o for k, o in v.items()}
+        return v
+
+
+# Built once so the compiled validator is reused for every load
+_SALES_REP_ADAPTER = TypeAdapter(SalesRepMapping)
+
+
 class Settings(BaseSettings):
     """
     Application settings loaded from environment variables.
@@ -174,13 +329,13 @@ class Settings(BaseSettings):
         le=10,
         description="Maximum number of retry attempts for failed operations"
     )
-    log_level: str = Field(
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
         default="INFO",
         description="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)"
     )
 
     # Environment
-    environment: str = Field(
+    environment: Literal["development", "staging", "production"] = Field(
         default="development",
         description="Environment name (development, staging, production)"
     )
@@ -205,17 +360,11 @@ class Settings(BaseSettings):
         description="Path to sales rep mapping JSON file"
     )
 
-    @field_validator("log_level")
+    @field_validator("log_level", mode="before")
     @classmethod
-    def validate_log_level(cls, v: str) -> str:
-        """Validate log level is one of the standard Python logging levels."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        v_upper = v.upper()
-        if v_upper not in valid_levels:
-            raise ValueError(
-                f"log_level must be one of {valid_levels}, got '{v}'"
-            )
-        return v_upper
+    def normalize_log_level(cls, v: Any) -> Any:
+        """Upper-case the log level before it is matched against the allowed values."""
+        return v.upper() if isinstance(v, str) else v
 
     @field_validator("epicor_base_url")
     @classmethod
@@ -223,20 +372,16 @@ class Settings(BaseSettings):
         """Ensure Epicor base URL doesn't end with trailing slash."""
         return v.rstrip("/")
 
-    @field_validator("environment")
+    @field_validator("environment", mode="before")
     @classmethod
-    def validate_environment(cls, v: str) -> str:
-        """Validate environment is one of the expected values."""
-        valid_envs = ["development", "staging", "production"]
-        v_lower = v.lower()
-        if v_lower not in valid_envs:
-            raise ValueError(
-                f"environment must be one of {valid_envs}, got '{v}'"
-            )
-        return v_lower
+    def normalize_environment(cls, v: Any) -> Any:
+        """Lower-case the environment before it is matched against the allowed values."""
+        return v.lower() if isinstance(v, str) else v
 
-    # Cache for sales rep mapping
-    _sales_rep_mapping: Optional[Dict[str, Any]] = None
+    # Cache for sales rep mapping (lookup fields are flattened once at load)
+    _sales_rep_mapping: Optional["SalesRepMapping"] = None
+    _mappings: Dict[str, str] = {}
+    _default_owner: Optional[str] = None
 
     def get_hubspot_owner(self, sales_rep_code: Optional[str]) -> Optional[str]:
         """
@@ -267,61 +412,51 @@ class Settings(BaseSettings):
         # Load mapping if not cached
         if self._sales_rep_mapping is None:
             try:
-                if os.path.exists(self.sales_rep_mapping_file):
-                    with open(self.sales_rep_mapping_file, 'r') as f:
-                        self._sales_rep_mapping = json.load(f)
-
-                    # Validate structure
-                    if not isinstance(self._sales_rep_mapping, dict):
-                        logger.error("Sales rep mapping file is not a valid JSON object")
-                        self._sales_rep_mapping = {"mappings": {}, "default_owner_id": None}
-
-                    # Ensure required keys exist
-                    if "mappings" not in self._sales_rep_mapping:
-                        logger.warning("Sales rep mapping file missing 'mappings' key")
-                        self._sales_rep_mapping["mappings"] = {}
+                with open(self.sales_rep_mapping_file, 'rb') as f:
+                    self._sales_rep_mapping = _SALES_REP_ADAPTER.validate_json(f.read())
 
-                    if "default_owner_id" not in self._sales_rep_mapping:
-                        self._sales_rep_mapping["default_owner_id"] = None
+                if "mappings" not in self._sales_rep_mapping.model_fields_set:
+                    logger.warning("Sales rep mapping file missing 'mappings' key")
 
-                    logger.info(f"Loaded sales rep mapping from {self.sales_rep_mapping_file}")
-
-                    # Log fallback configuration
-                    default_owner = self._sales_rep_mapping.get("default_owner_id")
-                    if default_owner:
-                        logger.info(f"Default owner configured: {default_owner}")
-                    else:
-                        logger.info("No default owner - unmapped reps will be unassigned")
+                logger.info("Loaded sales rep mapping from %s", self.sales_rep_mapping_file)
 
+                # Log fallback configuration
+                default_owner = self._sales_rep_mapping.default_owner_id
+                if default_owner:
+                    logger.info("Default owner configured: %s", default_owner)
                 else:
-                    logger.warning(
-                        f"Sales rep mapping file not found: {self.sales_rep_mapping_file}. "
-                        f"All deals will be unassigned."
-                    )
-                    self._sales_rep_mapping = {"mappings": {}, "default_owner_id": None}
+                    logger.info("No default owner - unmapped reps will be unassigned")
+
+            except FileNotFoundError:
+                logger.warning(
+                    "Sales rep mapping file not found: %s. All deals will be unassigned.",
+                    self.sales_rep_mapping_file
+                )
+                self._sales_rep_mapping = SalesRepMapping()
+            except ValidationError as e:
+                logger.error("Sales rep mapping file is not a valid mapping object: %s", e)
+                self._sales_rep_mapping = SalesRepMapping()
             except Exception as e:
-                logger.error(f"Failed to load sales rep mapping: {e}")
-                self._sales_rep_mapping = {"mappings": {}, "default_owner_id": None}
+                logger.error("Failed to load sales rep mapping: %s", e)
+                self._sales_rep_mapping = SalesRepMapping()
 
-        # Look up mapping
-        mappings = self._sales_rep_mapping.get("mappings", {})
-        owner_id = mappings.get(sales_rep_code)
+            self._mappings = self._sales_rep_mapping.mappings
+            self._default_owner = self._sales_rep_mapping.default_owner_id
 
+        # Look up mapping
+        owner_id = self._mappings.get(sales_rep_code)
         if owner_id:
             # Found specific mapping
             return owner_id
+
+        # Use fallback default owner
+        if self._default_owner:
+            logger.debug(
+                "Rep '%s' not mapped, using default owner: %s", sales_rep_code, self._default_owner
+            )
         else:
-            # Use fallback default owner
-            default_owner = self._sales_rep_mapping.get("default_owner_id")
-            if default_owner:
-                logger.debug(
-                    f"Rep '{sales_rep_code}' not mapped, using default owner: {default_owner}"
-                )
-            else:
-                logger.debug(
-                    f"Rep '{sales_rep_code}' not mapped and no default owner configured"
-                )
-            return default_owner
+            logger.debug("Rep '%s' not mapped and no default owner configured", sales_rep_code)
+        return self._default_owner
 
     class Config:
         """Pydantic configuration."""
@@ -334,13 +469,24 @@ class Settings(BaseSettings):
 # Global settings instance
 _settings: Optional[Settings] = None
 
+# Environment values the cached settings instance was built from, and its field values
+# at that point (callers such as manual_sync toggle fields on the shared instance)
+_settings_env: Optional[Dict[str, Optional[str]]] = None
+_settings_fields: Optional[Dict[str, Any]] = None
+
+
+def _settings_env_snapshot() -> Dict[str, Optional[str]]:
+    """Return the current environment values for every Settings field."""
+    return {name: os.environ.get(name.upper()) for name in Settings.model_fields}
+
 
 def get_settings(force_reload: bool = False) -> Settings:
     """
     Get the application settings singleton.
 
     Args:
-        force_reload: If True, reload settings from environment/files
+        force_reload: If True, reload settings from environment/files.
+                      The cached instance is kept if no setting changed.
 
     Returns:
         Settings: The application settings instance
@@ -349,18 +495,69 @@ def get_settings(force_reload: bool = False) -> Settings:
         >>> settings = get_settings()
         >>> print(settings.epicor_company)
     """
-    global _settings
+    global _settings, _settings_env, _settings_fields
 
     if _settings is None or force_reload:
         # Load .env file if it exists
-        from dotenv import load_dotenv
         load_dotenv()
 
-        _settings = Settings()
+        # Warm invocations reload on every run; skip rebuilding if nothing changed
+        env = _settings_env_snapshot()
+        if (
+            _settings is not None and env == _settings_env and
+            _settings.model_dump() == _settings_fields
+        ):
+            return _settings
+
+        if os.environ.get('SKIP_SETTINGS_VALIDATION') == '1':
+            _settings = _construct_settings_from_env()
+        else:
+            _settings = Settings()
+        _settings_env = env
+        _settings_fields = _settings.model_dump()
+        Pipelines._reset()
 
     return _settings
 
 
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+
+
+def _construct_settings_from_env() -> Settings:
+    """
+    Build Settings from environment variables without Pydantic validation.
+
+    Only used when SKIP_SETTINGS_VALIDATION=1, i.e. when the values come from a
+    trusted source (Key Vault) that has already been validated. Falls back to the
+    validated path if a required field is missing so the usual error is raised.
+
+    Returns:
+        Settings: The application settings instance
+    """
+    values: Dict[str, Any] = {}
+    for name, field in Settings.model_fields.items():
+        raw = os.environ.get(name.upper())
+        if raw is None:
+            if field.is_required():
+                return Settings()
+            continue
+        if field.annotation is bool:
+            values[name] = raw.strip().lower() in _TRUE_VALUES
+        elif field.annotation is int:
+            values[name] = int(raw)
+        else:
+            values[name] = raw
+
+    # Same normalization the field validators apply
+    values["epicor_base_url"] = values["epicor_base_url"].rstrip("/")
+    if "log_level" in values:
+        values["log_level"] = values["log_level"].upper()
+    if "environment" in values:
+        values["environment"] = values["environment"].lower()
+
+    return Settings.model_construct(**values)
+
+
 def load_settings_from_file(file_path: str) -> Settings:
     """
     Load settings from a specific .env file.
@@ -374,8 +571,6 @@ def load_settings_from_file(file_path: str) -> Settings:
     Example:
         >>> settings = load_settings_from_file("config/prod.env")
     """
-    from dotenv import load_dotenv
-
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"Settings file not found: {file_path}")
 
@@ -387,9 +582,11 @@ class Pipelines:
     """
     Helper class for HubSpot pipeline IDs.
     Provides static methods to access pipeline IDs from settings.
+    Values are cached until settings are rebuilt.
     """
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_quotes_pipeline_id() -> str:
         """
         Get the HubSpot pipeline ID for quotes.
@@ -400,6 +597,7 @@ class Pipelines:
         return get_settings().hubspot_quotes_pipeline_id
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_orders_pipeline_id() -> str:
         """
         Get the HubSpot pipeline ID for orders.
@@ -409,6 +607,12 @@ class Pipelines:
         """
         return get_settings().hubspot_orders_pipeline_id
 
+    @staticmethod
+    def _reset() -> None:
+        """Clear cached pipeline IDs (called whenever settings are rebuilt)."""
+        Pipelines.get_quotes_pipeline_id.cache_clear()
+        Pipelines.get_orders_pipeline_id.cache_clear()
+
 
 # Lazy convenience alias for settings singleton
 # Cannot call get_settings() at import time in Azure Functions because
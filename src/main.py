@@ -11,7 +11,9 @@ For local development:
 """
 
 import logging
+import os
 from datetime import datetime
+from typing import Any, Dict, Tuple
 
 from src.clients.epicor_client import EpicorClient
 from src.clients.hubspot_client import HubSpotClient
@@ -23,6 +25,71 @@ from src.utils.logger import setup_logging
 # Module-level logger (basic until settings are loaded)
 logger = logging.getLogger(__name__)
 
+# API clients reused across warm Azure Functions invocations (keyed on the settings instance)
+_CLIENTS: Dict[str, Any] = {}
+
+
+def _get_clients(settings) -> Tuple[EpicorClient, HubSpotClient]:
+    """
+    Get the Epicor and HubSpot clients, creating them on first use.
+
+    Clients (and their pooled connections) are kept for the life of the worker
+    process and rebuilt only when the settings instance changes. Connections are
+    tested when the clients are created, or on every call if RUN_HEALTHCHECK=1.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Tuple of (epicor_client, hubspot_client)
+    """
+    if _CLIENTS.get('settings') is not settings:
+        logger.info("Initializing API clients...")
+        try:
+            epicor_client = EpicorClient(
+                base_url=settings.epicor_base_url,
+                company=settings.epicor_company,
+                username=settings.epicor_username,
+                password=settings.epicor_password,
+                api_key=settings.epicor_api_key,
+                batch_size=settings.sync_batch_size,
+            )
+            logger.info("✅ Epicor client initialized")
+
+            # Warm the HubSpot connection while the Epicor connection is tested
+            hubspot_client = HubSpotClient(api_key=settings.hubspot_api_key, warmup=True)
+            logger.info("✅ HubSpot client initialized")
+
+        except Exception as e:
+            logger.error(f"Failed to initialize clients: {e}")
+            raise
+
+        _test_connections(epicor_client, hubspot_client)
+        _CLIENTS.update(settings=settings, epicor=epicor_client, hubspot=hubspot_client)
+
+    elif os.environ.get('RUN_HEALTHCHECK') == '1':
+        _test_connections(_CLIENTS['epicor'], _CLIENTS['hubspot'])
+
+    return _CLIENTS['epicor'], _CLIENTS['hubspot']
+
+
+def _test_connections(epicor_client: EpicorClient, hubspot_client: HubSpotClient) -> None:
+    """
+    Test both API connections.
+
+    Raises:
+        RuntimeError: If either connection test fails
+    """
+    logger.info("Testing API connections...")
+
+    if not epicor_client.test_connection():
+        raise RuntimeError("Epicor connection test failed")
+
+    if not hubspot_client.test_connection():
+        raise RuntimeError("HubSpot connection test failed")
+
+    logger.info("✅ All connections successful")
+
 
 def main(full_sync: bool = False, delta_hours: int = 16, filter_condition: str = None):
     """
@@ -42,50 +109,25 @@ def main(full_sync: bool = False, delta_hours: int = 16, filter_condition: str =
     logger.info(f"Time: {datetime.now().isoformat()}")
     logger.info("=" * 80)
 
-    # Initialize clients
-    logger.info("Initializing API clients...")
+    # Initialize clients (reused across warm invocations)
     settings = get_settings()
+    epicor_client, hubspot_client = _get_clients(settings)
 
-    try:
-        epicor_client = EpicorClient(
-            base_url=settings.epicor_base_url,
-            company=settings.epicor_company,
-            username=settings.epicor_username,
-            password=settings.epicor_password,
-            api_key=settings.epicor_api_key,
-            batch_size=settings.sync_batch_size,
-        )
-        logger.info("✅ Epicor client initialized")
-
-        hubspot_client = HubSpotClient(api_key=settings.hubspot_api_key)
-        logger.info("✅ HubSpot client initialized")
-
-    except Exception as e:
-        logger.error(f"Failed to initialize clients: {e}")
-        raise
-
-    # Test connections
-    logger.info("Testing API connections...")
-
-    if not epicor_client.test_connection():
-        raise RuntimeError("Epicor connection test failed")
-
-    if not hubspot_client.test_connection():
-        raise RuntimeError("HubSpot connection test failed")
-
-    logger.info("✅ All connections successful")
+    # A warm client still holds last run's lookups; HubSpot may have changed since
+    hubspot_client.invalidate_cache()
 
     # Initialize sync manager
     sync_manager = SyncManager(epicor_client, hubspot_client)
 
-    # Run sync
+    # Run sync (repeated HubSpot reads within this run are served from memory)
     try:
-        if full_sync:
-            logger.info("Running FULL sync (all records)")
-            result = sync_manager.run_full_sync(filter_condition=filter_condition)
-        else:
-            logger.info(f"Running DELTA sync (last {delta_hours} hours)")
-            result = sync_manager.run_delta_sync(delta_hours=delta_hours)
+        with hubspot_client.cache_scope():
+            if full_sync:
+                logger.info("Running FULL sync (all records)")
+                result = sync_manager.run_full_sync(filter_condition=filter_condition)
+            else:
+                logger.info(f"Running DELTA sync (last {delta_hours} hours)")
+                result = sync_manager.run_delta_sync(delta_hours=delta_hours)
 
         logger.info("\n" + "=" * 80)
         logger.info("SYNC SUMMARY:")
@@ -115,6 +157,10 @@ def main(full_sync: bool = False, delta_hours: int = 16, filter_condition: str =
         logger.error(f"Sync failed: {e}", exc_info=True)
         raise
 
+    finally:
+        # Keep buffered failed records even if the sync crashed
+        sync_manager.failed_tracker.flush()
+
 
 if __name__ == "__main__":
     # For local development, load .env file
@@ -4,12 +4,13 @@ Syncs Epicor Customers to HubSpot Companies.
 """
 
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 from src.clients.epicor_client import EpicorClient
 from src.clients.hubspot_client import HubSpotClient
 from src.transformers.customer_transformer import CustomerTransformer
 from src.utils.error_handler import ErrorTracker, FailedRecordTracker
+from src.utils.prefetch import prefetched
 
 
 logger = logging.getLogger(__name__)
@@ -18,6 +19,11 @@ logger = logging.getLogger(__name__)
 class CustomerSync:
     """Handles customer to company synchronization."""
 
+    # Companies sent per HubSpot batch create/update request (API maximum is 100)
+    WRITE_BATCH_SIZE = 100
+    # Batch requests in flight at once
+    WRITE_WORKERS = 4
+
     def __init__(
         self,
         epicor_client: EpicorClient,
@@ -42,6 +48,11 @@ class CustomerSync:
         """
         Sync all customers from Epicor to HubSpot.
 
+        Customers are streamed from Epicor a page at a time, and the next page
+        is fetched while the current one is written to HubSpot. Each page's
+        existing companies are looked up in one batched search and written with
+        batch create/update requests.
+
         Returns:
             Sync summary with counts and errors
         """
@@ -49,50 +60,41 @@ class CustomerSync:
         logger.info("STARTING CUSTOMER SYNC")
         logger.info("=" * 60)
 
-        # Fetch customers from Epicor
+        total = created_count = updated_count = 0
+
+        # Page N+1 is fetched in the background while page N is synced
         try:
-            customers = self.epicor.get_customers()
-            logger.info(f"Fetched {len(customers)} customers from Epicor")
+            for customers in prefetched(self.epicor.iter_customer_pages()):
+                total += len(customers)
+                created, updated = self._sync_page(customers)
+                created_count += created
+                updated_count += updated
         except Exception as e:
             logger.error(f"Failed to fetch customers: {e}")
             return {
                 'success': False,
                 'error': str(e),
-                'total': 0,
-                'created': 0,
-                'updated': 0,
-                'errors': 0
+                'total': total,
+                'created': created_count,
+                'updated': updated_count,
+                'errors': self.error_tracker.error_count
             }
+        finally:
+            # Write this phase's failed records in one append
+            if self.failed_tracker:
+                self.failed_tracker.flush()
 
-        # Sync each customer
-        created_count = 0
-        updated_count = 0
-
-        for customer in customers:
-            try:
-                result = self.sync_customer(customer)
-                if result == 'created':
-                    created_count += 1
-                elif result == 'updated':
-                    updated_count += 1
-            except Exception as e:
-                cust_num = customer.get('CustNum', 'unknown')
-                logger.error(f"Error syncing customer {cust_num}: {e}")
-                self.error_tracker.add_error('customer', cust_num, str(e))
-                if self.failed_tracker:
-                    self.failed_tracker.add_failed_record(
-                        entity_type='customer', entity_id=cust_num, operation='sync',
-                        error_message=str(e), error_type=type(e).__name__, source_data=customer
-                    )
+        if not total:
+            logger.info("No customers to sync")
 
         # Summary
         summary = {
             'success': True,
-            'total': len(customers),
+            'total': total,
             'created': created_count,
             'updated': updated_count,
-            'errors': len(self.error_tracker.errors),
-            'error_details': self.error_tracker.errors if self.error_tracker.has_errors() else None
+            'errors': self.error_tracker.error_count,
+            'error_details': self.error_tracker.error_details() if self.error_tracker.has_errors() else None
         }
 
         logger.info("=" * 60)
@@ -102,6 +104,173 @@ class CustomerSync:
 
         return summary
 
+    def _sync_page(self, customers: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Transform, look up and write one page of Epicor customers.
+
+        Args:
+            customers: Epicor customer records
+
+        Returns:
+            Tuple of (created_count, updated_count)
+        """
+        logger.info("Syncing %s customers from Epicor", len(customers))
+
+        # Transform everything first so HubSpot can be read and written in batches
+        transformed = []
+        for customer in customers:
+            cust_num = customer.get('CustNum', 'unknown')
+            try:
+                transformed.append((customer, self.transformer.transform(customer)))
+            except Exception as e:
+                logger.error(f"Transformation error for customer {cust_num}: {e}")
+                self._record_failure(customer, 'transform', f"Transform error: {e}", e)
+
+        # One batched search instead of a lookup per customer
+        try:
+            existing_map = self._prefetch_existing_companies(
+                [customer['CustNum'] for customer, _ in transformed]
+            )
+        except Exception as e:
+            logger.error(f"Failed to look up existing companies: {e}")
+            for customer, _ in transformed:
+                self._record_failure(customer, 'sync', str(e), e)
+            return 0, 0
+
+        to_create = []
+        to_update = []
+        for customer, properties in transformed:
+            company_id = existing_map.get(str(customer['CustNum']))
+            if company_id:
+                to_update.append((customer, company_id, properties))
+            else:
+                to_create.append((customer, properties))
+
+        return self._flush_companies(to_create, to_update)
+
+    def _prefetch_existing_companies(self, cust_nums: List[Any]) -> Dict[str, str]:
+        """
+        Look up existing HubSpot companies for many customers at once.
+
+        Args:
+            cust_nums: Epicor customer numbers
+
+        Returns:
+            Dict mapping customer number (as string) to HubSpot company ID
+        """
+        if not cust_nums:
+            return {}
+
+        companies = self.hubspot.get_companies_by_property('epicor_customer_number', cust_nums)
+        return {cust_num: company['id'] for cust_num, company in companies.items()}
+
+    def _flush_companies(
+        self,
+        to_create: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+        to_update: List[Tuple[Dict[str, Any], str, Dict[str, Any]]]
+    ) -> Tuple[int, int]:
+        """
+        Write queued companies with batch create/update.
+
+        Chunks are independent requests, so they are sent concurrently (the client's
+        shared rate limiter paces them). A failure only affects that chunk's customers.
+
+        Args:
+            to_create: List of (customer, properties) tuples
+            to_update: List of (customer, company_id, properties) tuples
+
+        Returns:
+            Tuple of (created_count, updated_count)
+        """
+        size = self.WRITE_BATCH_SIZE
+        jobs = (
+            [('update', to_update[i:i + size]) for i in range(0, len(to_update), size)] +
+            [('create', to_create[i:i + size]) for i in range(0, len(to_create), size)]
+        )
+
+        def write(job):
+            operation, chunk = job
+            try:
+                if operation == 'update':
+                    return self.hubspot.update_companies_batch([
+                        {'id': company_id, 'properties': properties}
+                        for _, company_id, properties in chunk
+                    ]), None
+                return self.hubspot.create_companies_batch(
+                    [properties for _, properties in chunk]
+                ), None
+            except Exception as e:
+                return None, e
+
+        outcomes = self.hubspot.map_parallel(write, jobs, workers=self.WRITE_WORKERS)
+
+        # Tally on this thread so the trackers are never touched concurrently
+        counts = {'create': 0, 'update': 0}
+        for (operation, chunk), (results, error) in zip(jobs, outcomes):
+            if error is not None:
+                logger.error(f"Error in batch {operation} of companies: {error}")
+                for item in chunk:
+                    self._record_failure(
+                        item[0], operation, f"HubSpot {operation} failed: {error}", error
+                    )
+                continue
+
+            # A 207 response can omit records; batch results are not in input order
+            if operation == 'update':
+                written = {str(result.get('id')) for result in results}
+                keys = [str(company_id) for _, company_id, _ in chunk]
+            else:
+                written = {
+                    str(result.get('properties', {}).get('epicor_customer_number'))
+                    for result in results
+                }
+                keys = [str(customer.get('CustNum')) for customer, _ in chunk]
+
+            for item, key in zip(chunk, keys):
+                if key in written:
+                    counts[operation] += 1
+                else:
+                    self._record_missing(item[0], operation)
+            logger.info("Batch %s wrote %s companies", operation, len(results))
+
+        return counts['create'], counts['update']
+
+    def _record_missing(self, customer_data: Dict[str, Any], operation: str) -> None:
+        """
+        Record a customer left out of a partially successful batch response.
+
+        Args:
+            customer_data: Epicor customer record
+            operation: Batch operation that dropped it (create or update)
+        """
+        error = RuntimeError(f"missing from batch {operation} response")
+        self._record_failure(customer_data, operation, f"HubSpot {operation} failed: {error}", error)
+
+    def _record_failure(
+        self,
+        customer_data: Dict[str, Any],
+        operation: str,
+        message: str,
+        error: Exception
+    ) -> None:
+        """
+        Record a failed customer in the error tracker and failed record CSV.
+
+        Args:
+            customer_data: Epicor customer record
+            operation: Operation that failed (transform, create, update, sync)
+            message: Error description for the error tracker
+            error: The exception raised
+        """
+        cust_num = customer_data.get('CustNum', 'unknown')
+        self.error_tracker.add_error('customer', cust_num, message)
+        if self.failed_tracker:
+            self.failed_tracker.add_failed_record(
+                entity_type='customer', entity_id=cust_num, operation=operation,
+                error_message=str(error), error_type=type(error).__name__,
+                source_data=customer_data
+            )
+
     def sync_customer(self, customer_data: Dict[str, Any]) -> str:
         """
         Sync a single customer.
@@ -115,7 +284,7 @@ class CustomerSync:
         cust_num = customer_data['CustNum']
         cust_name = customer_data.get('Name', 'Unknown')
 
-        logger.debug(f"Syncing customer {cust_num}: {cust_name}")
+        logger.debug("Syncing customer %s: %s", cust_num, cust_name)
 
         # Transform data
         try:
@@ -141,7 +310,7 @@ class CustomerSync:
             company_id = existing_company['id']
             result = self.hubspot.update_company(company_id, properties)
             if result:
-                logger.info(f"Updated company {cust_num}: {cust_name}")
+                logger.info("Updated company %s: %s", cust_num, cust_name)
                 return 'updated'
             else:
                 logger.error(f"Failed to update company {cust_num}")
@@ -157,7 +326,7 @@ class CustomerSync:
             # Create new company
             result = self.hubspot.create_company(properties)
             if result:
-                logger.info(f"Created company {cust_num}: {cust_name}")
+                logger.info("Created company %s: %s", cust_num, cust_name)
                 return 'created'
             else:
                 logger.error(f"Failed to create company {cust_num}")
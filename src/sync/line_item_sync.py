@@ -4,7 +4,8 @@ Syncs Epicor line items to HubSpot with automatic product creation.
 """
 
 import logging
-from typing import List, Dict, Any
+import time
+from typing import Callable, List, Dict, Any, Optional, Tuple
 
 from src.clients.hubspot_client import HubSpotClient
 from src.transformers.line_item_transformer import LineItemTransformer
@@ -13,16 +14,63 @@ from src.utils.error_handler import ErrorTracker
 
 logger = logging.getLogger(__name__)
 
+# SKU -> HubSpot product ID, shared by every LineItemSync in the worker process so warm
+# invocations skip product lookups. Dropped after PRODUCT_CACHE_TTL_SECONDS so product
+# details are refreshed and deleted products are noticed.
+PRODUCT_CACHE_TTL_SECONDS = 6 * 3600
+_PRODUCT_CACHE: Dict[str, str] = {}
+_product_cache_started = time.monotonic()
+
+
+def _shared_product_cache() -> Dict[str, str]:
+    """Return the process-wide product cache, clearing it first if it has expired."""
+    global _product_cache_started
+
+    if time.monotonic() - _product_cache_started > PRODUCT_CACHE_TTL_SECONDS:
+        _PRODUCT_CACHE.clear()
+        _product_cache_started = time.monotonic()
+    return _PRODUCT_CACHE
+
+
+def _line_ref(line_item: Dict[str, Any]) -> str:
+    """
+    Compact identifier for a line in error reports (e.g., 'Q1001-2').
+
+    Used instead of str(line_item), which would copy the whole Epicor record
+    into every error entry.
+    """
+    if line_item.get('QuoteLine') is not None:
+        return f"Q{line_item.get('QuoteNum')}-{line_item['QuoteLine']}"
+    if line_item.get('OrderLine') is not None:
+        return f"O{line_item.get('OrderNum')}-{line_item['OrderLine']}"
+    return str(line_item.get('PartNum', 'unknown'))
+
+
+def _dedupe_by_line_id(transformed: List[tuple]) -> List[tuple]:
+    """
+    Collapse (line_item, properties) pairs that share an epicor_line_item_id.
+
+    The last occurrence wins, so a detail row Epicor returns twice is written
+    once. Lines without an ID are kept as-is.
+    """
+    by_id = {}
+    for entry in transformed:
+        epicor_id = entry[1].get('epicor_line_item_id')
+        by_id[epicor_id if epicor_id else id(entry)] = entry
+    if len(by_id) < len(transformed):
+        logger.warning("Dropped %s duplicate line items", len(transformed) - len(by_id))
+    return list(by_id.values())
+
 
 class LineItemSync:
     """
     Handles line item synchronization with auto-product creation.
 
     STRATEGY:
-    1. Check if product (SKU) exists in HubSpot
+    1. Check if products (SKUs) exist in HubSpot (batched IN-filter searches)
     2. If not, create minimal product automatically
-    3. Create line item
-    4. Associate line item to deal
+    3. Create/update line items in batch
+    4. Associate new line items to deal in batch
     """
 
     def __init__(self, hubspot_client: HubSpotClient):
@@ -36,8 +84,8 @@ class LineItemSync:
         self.transformer = LineItemTransformer()
         self.error_tracker = ErrorTracker()
 
-        # Cache for products to avoid repeated lookups
-        self.product_cache = {}
+        # Cache for products to avoid repeated lookups (shared across instances)
+        self.product_cache = _shared_product_cache()
 
     def sync_quote_line_items(
         self,
@@ -56,172 +104,353 @@ class LineItemSync:
         Returns:
             Sync summary
         """
-        logger.info(f"Syncing {len(line_items)} quote line items for deal {deal_id}")
+        logger.info("Syncing %s quote line items for deal %s", len(line_items), deal_id)
+        return self._sync_line_items(
+            deal_id, line_items, quote_num, self.transformer.transform_quote_line
+        )
 
-        created_count = 0
-        updated_count = 0
-        product_created_count = 0
+    def sync_order_line_items(
+        self,
+        deal_id: str,
+        line_items: List[Dict[str, Any]],
+        order_num: int = None
+    ) -> Dict[str, Any]:
+        """
+        Sync order line items to a deal (upsert logic).
+
+        Args:
+            deal_id: HubSpot deal ID
+            line_items: List of OrderDtl records from Epicor
+            order_num: Order number (for building epicor_line_item_id)
+
+        Returns:
+            Sync summary
+        """
+        logger.info("Syncing %s order line items for deal %s", len(line_items), deal_id)
+        return self._sync_line_items(
+            deal_id, line_items, order_num, self.transformer.transform_order_line
+        )
+
+    def _sync_line_items(
+        self,
+        deal_id: str,
+        line_items: List[Dict[str, Any]],
+        parent_num: Optional[int],
+        transform: Callable[[Dict[str, Any], Optional[int]], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Upsert a deal's quote or order line items.
+
+        Args:
+            deal_id: HubSpot deal ID
+            line_items: QuoteDtl or OrderDtl records from Epicor
+            parent_num: Quote or order number (for building epicor_line_item_id)
+            transform: transform_quote_line or transform_order_line
 
+        Returns:
+            Sync summary
+        """
+        # Transform all lines first so existing line items can be fetched in one batch
+        transformed = []
         for line_item in line_items:
             try:
-                # Transform line item (pass quote_num for unique ID)
-                properties = self.transformer.transform_quote_line(line_item, quote_num)
-                sku = properties.get('sku')
-                epicor_id = properties.get('epicor_line_item_id')
+                # Transform line item (pass parent_num for unique ID)
+                properties = transform(line_item, parent_num)
+            except Exception as e:
+                logger.error(f"Error transforming line item: {e}")
+                self.error_tracker.add_error('line_item', _line_ref(line_item), str(e))
+                continue
 
-                if not sku:
-                    logger.warning("Line item missing SKU, skipping")
-                    continue
+            # Lines without a SKU are dropped before any HubSpot lookups
+            if properties.get('sku'):
+                transformed.append((line_item, properties))
+            else:
+                logger.warning("Line item missing SKU, skipping")
+        transformed = _dedupe_by_line_id(transformed)
 
-                # Ensure product exists (create if needed)
-                # Pass cost (hs_cost_of_goods_sold) so product also gets the unit cost
-                product_created = self.ensure_product_exists(
-                    sku,
-                    properties.get('description'),
-                    properties.get('price'),
-                    properties.get('hs_cost_of_goods_sold')
-                )
-                if product_created:
-                    product_created_count += 1
+        existing_line_items = self.hubspot.get_line_items_by_epicor_ids([
+            properties['epicor_line_item_id']
+            for _, properties in transformed
+            if properties.get('epicor_line_item_id')
+        ])
+
+        # Ensure products exist (create if needed), batched across unique SKUs
+        product_created_count, product_errors = self._ensure_products(transformed)
+
+        # Creates/updates are accumulated and flushed through the batch endpoints
+        to_create = []
+        to_update = []
+        cached_product_id = self.product_cache.get
+
+        for line_item, properties in transformed:
+            try:
+                sku = properties['sku']
+                epicor_id = properties.get('epicor_line_item_id')
+
+                # Surface product lookup/creation failure for this line
+                if sku in product_errors:
+                    raise product_errors[sku]
 
                 # Link line item to product via hs_product_id
-                product_id = self.product_cache.get(sku)
+                product_id = cached_product_id(sku)
                 if product_id:
                     properties['hs_product_id'] = product_id
 
-                # Check if line item already exists (by epicor_line_item_id)
-                existing_line_item = None
-                if epicor_id:
-                    existing_line_item = self.hubspot.get_line_item_by_epicor_id(epicor_id)
+                # Queue update or create (by epicor_line_item_id)
+                existing_line_item = existing_line_items.get(epicor_id) if epicor_id else None
 
                 if existing_line_item:
-                    # Update existing line item
-                    line_item_id = existing_line_item['id']
-                    result = self.hubspot.update_line_item(line_item_id, properties)
-                    if result:
-                        updated_count += 1
-                        logger.debug(f"Updated line item {epicor_id}")
+                    to_update.append((line_item, existing_line_item['id'], properties))
                 else:
-                    # Create new line item
-                    result = self.hubspot.create_line_item(properties)
-                    if result:
-                        line_item_id = result['id']
-
-                        # Associate to deal
-                        self.hubspot.associate_line_item_to_deal(line_item_id, deal_id)
-                        created_count += 1
-                        logger.debug(f"Created line item {epicor_id}")
+                    to_create.append((line_item, properties))
 
             except Exception as e:
                 logger.error(f"Error syncing line item: {e}")
-                self.error_tracker.add_error('line_item', str(line_item), str(e))
+                self.error_tracker.add_error('line_item', _line_ref(line_item), str(e))
+
+        created_count, updated_count = self._flush_line_items(deal_id, to_create, to_update)
 
         summary = {
             'total': len(line_items),
             'created': created_count,
             'updated': updated_count,
             'products_created': product_created_count,
-            'errors': len(self.error_tracker.errors)
+            'errors': self.error_tracker.error_count
         }
 
         logger.info(
-            f"Line items: {created_count} created, {updated_count} updated, "
-            f"{product_created_count} products auto-created"
+            "Line items: %s created, %s updated, %s products auto-created",
+            created_count, updated_count, product_created_count
         )
 
         return summary
 
-    def sync_order_line_items(
+    def prewarm_products(
         self,
-        deal_id: str,
         line_items: List[Dict[str, Any]],
-        order_num: int = None
-    ) -> Dict[str, Any]:
+        transform: Callable[[Dict[str, Any]], Dict[str, Any]]
+    ) -> int:
         """
-        Sync order line items to a deal (upsert logic).
+        Look up or create the products for many deals' line items at once.
+
+        Called once per run with every fetched line so the per-deal syncs
+        find their SKUs in the product cache. Lines that fail to transform
+        and SKUs that fail here are left to the per-deal sync, which retries
+        them and records the error against the line.
 
         Args:
-            deal_id: HubSpot deal ID
-            line_items: List of OrderDtl records from Epicor
-            order_num: Order number (for building epicor_line_item_id)
+            line_items: Epicor QuoteDtl or OrderDtl records across all deals
+            transform: transform_quote_line or transform_order_line
 
         Returns:
-            Sync summary
+            Number of products created
         """
-        logger.info(f"Syncing {len(line_items)} order line items for deal {deal_id}")
-
-        created_count = 0
-        updated_count = 0
-        product_created_count = 0
-
+        transformed = []
         for line_item in line_items:
             try:
-                # Transform line item (pass order_num for unique ID)
-                properties = self.transformer.transform_order_line(line_item, order_num)
-                sku = properties.get('sku')
-                epicor_id = properties.get('epicor_line_item_id')
+                transformed.append((line_item, transform(line_item)))
+            except Exception:
+                continue
 
-                if not sku:
-                    logger.warning("Line item missing SKU, skipping")
-                    continue
+        created_count, product_errors = self._ensure_products(transformed)
+        logger.info(
+            "Prewarmed products for %s line items: %s created, %s failed",
+            len(transformed), created_count, len(product_errors)
+        )
+        return created_count
+
+    def _ensure_products(
+        self,
+        transformed: List[tuple]
+    ) -> Tuple[int, Dict[str, Exception]]:
+        """
+        Ensure products exist for every SKU in the transformed lines.
 
-                # Ensure product exists (create if needed)
-                # Pass cost if available (orders may not have cost mapped)
-                product_created = self.ensure_product_exists(
+        Each unique SKU is handled once (first line wins for description,
+        price and cost), with HubSpot lookups and writes batched.
+
+        Args:
+            transformed: List of (source_line, properties) tuples
+
+        Returns:
+            Tuple of (products_created_count, {sku: exception} for failed SKUs)
+        """
+        products = {}
+        for _, properties in transformed:
+            sku = properties.get('sku')
+            if sku and sku not in products:
+                # Pass cost (hs_cost_of_goods_sold) so product also gets the unit cost
+                products[sku] = (
                     sku,
                     properties.get('description'),
                     properties.get('price'),
                     properties.get('hs_cost_of_goods_sold')
                 )
-                if product_created:
-                    product_created_count += 1
 
-                # Link line item to product via hs_product_id
-                product_id = self.product_cache.get(sku)
-                if product_id:
-                    properties['hs_product_id'] = product_id
+        return self.ensure_products_exist(list(products.values()))
 
-                # Check if line item already exists (by epicor_line_item_id)
-                existing_line_item = None
-                if epicor_id:
-                    existing_line_item = self.hubspot.get_line_item_by_epicor_id(epicor_id)
+    def _flush_line_items(
+        self,
+        deal_id: str,
+        to_create: List[tuple],
+        to_update: List[tuple]
+    ) -> Tuple[int, int]:
+        """
+        Write queued line items with batch create/update and associate new ones to the deal.
 
-                if existing_line_item:
-                    # Update existing line item
-                    line_item_id = existing_line_item['id']
-                    result = self.hubspot.update_line_item(line_item_id, properties)
-                    if result:
-                        updated_count += 1
-                        logger.debug(f"Updated line item {epicor_id}")
-                else:
-                    # Create new line item
-                    result = self.hubspot.create_line_item(properties)
-                    if result:
-                        line_item_id = result['id']
+        Args:
+            deal_id: HubSpot deal ID
+            to_create: List of (source_line, properties) tuples
+            to_update: List of (source_line, line_item_id, properties) tuples
 
-                        # Associate to deal
-                        self.hubspot.associate_line_item_to_deal(line_item_id, deal_id)
-                        created_count += 1
-                        logger.debug(f"Created line item {epicor_id}")
+        Returns:
+            Tuple of (created_count, updated_count)
+        """
+        created_count = 0
+        updated_count = 0
 
+        def write(job):
+            try:
+                if job == 'update':
+                    return self.hubspot.update_line_items_batch([
+                        {'id': line_item_id, 'properties': properties}
+                        for _, line_item_id, properties in to_update
+                    ]), None
+                return self.hubspot.create_line_items_batch(
+                    [properties for _, properties in to_create]
+                ), None
             except Exception as e:
-                logger.error(f"Error syncing line item: {e}")
-                self.error_tracker.add_error('line_item', str(line_item), str(e))
+                return None, e
 
-        summary = {
-            'total': len(line_items),
-            'created': created_count,
-            'updated': updated_count,
-            'products_created': product_created_count,
-            'errors': len(self.error_tracker.errors)
+        # The update and create batches are independent, so send them concurrently;
+        # results are handled here so the error tracker is only touched on this thread
+        jobs = [job for job, queued in (('update', to_update), ('create', to_create)) if queued]
+        outcomes = dict(zip(jobs, self.hubspot.map_parallel(write, jobs, workers=2)))
+
+        if to_update:
+            results, error = outcomes['update']
+            try:
+                if error is not None:
+                    raise error
+                updated_count = len(results)
+                logger.debug("Batch updated %s line items", updated_count)
+                # Failed records are missing from a 207 response's results
+                updated_ids = {str(result['id']) for result in results}
+                for line_item, line_item_id, _ in to_update:
+                    if str(line_item_id) not in updated_ids:
+                        self.error_tracker.add_error(
+                            'line_item', _line_ref(line_item), f"Batch update of {line_item_id} failed"
+                        )
+            except Exception as e:
+                logger.error(f"Error batch updating line items: {e}")
+                for line_item, _, _ in to_update:
+                    self.error_tracker.add_error('line_item', _line_ref(line_item), str(e))
+
+        if to_create:
+            results, error = outcomes['create']
+            try:
+                if error is not None:
+                    raise error
+                # Associate to deal
+                association_status = self.hubspot.associate_line_items_to_deal(
+                    [result['id'] for result in results], deal_id
+                )
+                for line_item_id, associated in association_status.items():
+                    if not associated:
+                        logger.warning(f"Line item {line_item_id} not associated to deal {deal_id}")
+                        self.error_tracker.add_error(
+                            'line_item_association', line_item_id, f"Association to deal {deal_id} failed"
+                        )
+                created_count = len(results)
+                logger.debug("Batch created %s line items", created_count)
+                # Failed records are missing from a 207 response's results
+                created_line_ids = {
+                    str(result.get('properties', {}).get('epicor_line_item_id'))
+                    for result in results
+                }
+                for line_item, properties in to_create:
+                    if str(properties.get('epicor_line_item_id')) not in created_line_ids:
+                        self.error_tracker.add_error(
+                            'line_item', _line_ref(line_item), f"Batch create for deal {deal_id} failed"
+                        )
+            except Exception as e:
+                logger.error(f"Error batch creating line items: {e}")
+                for line_item, _ in to_create:
+                    self.error_tracker.add_error('line_item', _line_ref(line_item), str(e))
+
+        return created_count, updated_count
+
+    def ensure_products_exist(
+        self,
+        products: List[Tuple[str, Optional[str], Optional[float], Optional[float]]]
+    ) -> Tuple[int, Dict[str, Exception]]:
+        """
+        Ensure products exist in HubSpot for many SKUs, creating missing ones.
+
+        STRATEGY:
+        1. Skip SKUs already in the cache
+        2. Look up the rest with batched IN-filter searches
+        3. Batch update existing products, batch create missing ones
+
+        Args:
+            products: (sku, description, price, cost) tuples, one per unique SKU
+
+        Returns:
+            Tuple of (products_created_count, {sku: exception} for failed SKUs)
+        """
+        pending = {
+            product[0]: product for product in products
+            if product[0] not in self.product_cache
         }
+        if not pending:
+            return 0, {}
+
+        try:
+            existing = self.hubspot.get_products_by_skus(list(pending))
+        except Exception as e:
+            logger.error(f"Error looking up products: {e}")
+            return 0, {sku: e for sku in pending}
+
+        to_update = []
+        to_create = []
+        for sku, args in pending.items():
+            properties = self.transformer.get_minimal_product_properties(*args)
+            product = existing.get(sku)
+            if product:
+                self.product_cache[sku] = product['id']
+                to_update.append({'id': product['id'], 'properties': properties})
+            else:
+                to_create.append(properties)
 
-        logger.info(
-            f"Line items: {created_count} created, {updated_count} updated, "
-            f"{product_created_count} products auto-created"
-        )
+        if to_update:
+            try:
+                self.hubspot.update_products_batch(to_update)
+                logger.debug("Updated %s products", len(to_update))
+            except Exception as e:
+                # Products exist, so line items can still reference them
+                logger.warning(f"Failed to update {len(to_update)} products: {e}")
+
+        if not to_create:
+            return 0, {}
+
+        logger.info("%s products not found, auto-creating...", len(to_create))
+        try:
+            results = self.hubspot.create_products_batch(to_create)
+        except Exception as e:
+            logger.error(f"❌ Failed to auto-create products: {e}")
+            return 0, {properties['hs_sku']: e for properties in to_create}
+
+        for result in results:
+            sku = result.get('properties', {}).get('hs_sku')
+            if sku:
+                self.product_cache[sku] = result['id']
+                logger.info("✅ Auto-created product: %s", sku)
 
-        return summary
+        for properties in to_create:
+            if properties['hs_sku'] not in self.product_cache:
+                logger.error(f"❌ Failed to auto-create product: {properties['hs_sku']}")
+
+        return len(results), {}
 
     def ensure_product_exists(
         self,
@@ -233,10 +462,7 @@ class LineItemSync:
         """
         Ensure product exists in HubSpot, create if not.
 
-        STRATEGY:
-        1. Check cache first
-        2. Search HubSpot
-        3. Create minimal product if not found
+        Single-SKU form of ensure_products_exist.
 
         Args:
             sku: Product SKU
@@ -247,39 +473,7 @@ class LineItemSync:
         Returns:
             True if product was created, False if already existed
         """
-        # Check cache
-        if sku in self.product_cache:
-            return False
-
-        # Search HubSpot
-        product = self.hubspot.get_product_by_sku(sku)
-
-        # Get product properties
-        properties = self.transformer.get_minimal_product_properties(sku, description, price, cost)
-
-        if product:
-            # Product exists, update it
-            product_id = product['id']
-            self.product_cache[sku] = product_id
-
-            result = self.hubspot.update_product(product_id, properties)
-            if result:
-                logger.debug(f"Updated product {sku}")
-                return False  # Not created, updated
-            else:
-                logger.warning(f"Failed to update product {sku}")
-                return False
-        else:
-            # Product doesn't exist, create it
-            logger.info(f"Product {sku} not found, auto-creating...")
-
-            # Create product
-            result = self.hubspot.create_product(properties)
-
-            if result:
-                self.product_cache[sku] = result['id']
-                logger.info(f"✅ Auto-created product: {sku}")
-                return True
-            else:
-                logger.error(f"❌ Failed to auto-create product: {sku}")
-                return False
+        created_count, errors = self.ensure_products_exist([(sku, description, price, cost)])
+        if sku in errors:
+            raise errors[sku]
+        return created_count > 0
@@ -4,13 +4,14 @@ Syncs Epicor Sales Orders to HubSpot Deals (Orders Pipeline).
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from src.clients.epicor_client import EpicorClient
 from src.clients.hubspot_client import HubSpotClient
 from src.transformers.order_transformer import OrderTransformer
 from src.sync.line_item_sync import LineItemSync
 from src.utils.error_handler import ErrorTracker, FailedRecordTracker
+from src.utils.prefetch import prefetched
 
 
 logger = logging.getLogger(__name__)
@@ -19,6 +20,10 @@ logger = logging.getLogger(__name__)
 class OrderSync:
     """Handles order to deal synchronization."""
 
+    # Orders synced at once (each makes several HubSpot calls; the client's
+    # shared rate limiter keeps the overall request rate in check)
+    SYNC_WORKERS = 8
+
     def __init__(
         self,
         epicor_client: EpicorClient,
@@ -39,6 +44,9 @@ class OrderSync:
         self.line_item_sync = LineItemSync(hubspot_client)
         self.error_tracker = ErrorTracker()
         self.failed_tracker = failed_record_tracker
+        # (deal_id, company_id) pairs queued while a page syncs, created in one batch
+        # afterwards (None means associate each deal immediately)
+        self.pending_company_links: Optional[List[Tuple[str, str]]] = None
 
     def sync_all_orders(
         self,
@@ -47,6 +55,9 @@ class OrderSync:
         """
         Sync all orders from Epicor to HubSpot.
 
+        Orders are streamed from Epicor a page at a time, and the next page is
+        fetched while the current one is synced.
+
         Args:
             filter_condition: Optional OData filter
 
@@ -57,62 +68,156 @@ class OrderSync:
         logger.info("STARTING ORDER SYNC")
         logger.info("=" * 60)
 
-        # Fetch orders from Epicor
+        total = created_count = updated_count = unchanged_count = 0
+
+        # Page N+1 is fetched in the background while page N is synced
         try:
-            orders = self.epicor.get_orders(
+            pages = self.epicor.iter_order_pages(
                 expand_line_items=True,
                 filter_condition=filter_condition
             )
-            logger.info(f"Fetched {len(orders)} orders from Epicor")
+            for orders in prefetched(pages):
+                total += len(orders)
+                created, updated, unchanged = self._sync_page(orders)
+                created_count += created
+                updated_count += updated
+                unchanged_count += unchanged
         except Exception as e:
             logger.error(f"Failed to fetch orders: {e}")
             return {
                 'success': False,
                 'error': str(e),
-                'total': 0,
-                'created': 0,
-                'updated': 0,
-                'errors': 0
+                'total': total,
+                'created': created_count,
+                'updated': updated_count,
+                'unchanged': unchanged_count,
+                'errors': self.error_tracker.error_count
             }
-
-        # Sync each order
-        created_count = 0
-        updated_count = 0
-
-        for order in orders:
-            try:
-                result = self.sync_order(order)
-                if result == 'created':
-                    created_count += 1
-                elif result == 'updated':
-                    updated_count += 1
-            except Exception as e:
-                order_num = order.get('OrderNum', 'unknown')
-                logger.error(f"Error syncing order {order_num}: {e}")
-                self.error_tracker.add_error('order', order_num, str(e))
-                if self.failed_tracker:
-                    self.failed_tracker.add_failed_record(
-                        entity_type='order', entity_id=order_num, operation='sync',
-                        error_message=str(e), error_type=type(e).__name__, source_data=order
-                    )
+        finally:
+            # Write this phase's failed records in one append
+            if self.failed_tracker:
+                self.failed_tracker.flush()
 
         # Summary
         summary = {
             'success': True,
-            'total': len(orders),
+            'total': total,
             'created': created_count,
             'updated': updated_count,
-            'errors': len(self.error_tracker.errors),
-            'error_details': self.error_tracker.errors if self.error_tracker.has_errors() else None
+            'unchanged': unchanged_count,
+            'errors': self.error_tracker.error_count,
+            'error_details': self.error_tracker.error_details() if self.error_tracker.has_errors() else None
         }
 
         logger.info("=" * 60)
         logger.info("ORDER SYNC COMPLETE")
-        logger.info(f"Total: {summary['total']}, Created: {created_count}, Updated: {updated_count}, Errors: {summary['errors']}")
+        logger.info(f"Total: {summary['total']}, Created: {created_count}, Updated: {updated_count}, Unchanged: {unchanged_count}, Errors: {summary['errors']}")
         logger.info("=" * 60)
 
         return summary
 
+    def _sync_page(self, orders: List[Dict[str, Any]]) -> Tuple[int, int, int]:
+        """
+        Sync one page of Epicor orders, with lookups batched across the page.
+
+        Args:
+            orders: Epicor order records
+
+        Returns:
+            Tuple of (created_count, updated_count, unchanged_count)
+        """
+        # Seed the client's lookup cache so sync_order finds deals/companies without searching
+        self._prefetch_lookups(orders)
+
+        # Look up or create every order's products in one batched pass
+        try:
+            self.line_item_sync.prewarm_products(
+                [line for order in orders for line in order.get('OrderDtls') or []],
+                self.line_item_sync.transformer.transform_order_line
+            )
+        except Exception as e:
+            logger.warning(f"Failed to prewarm products: {e}")
+
+        # Sync each order
+        created_count = 0
+        updated_count = 0
+        unchanged_count = 0
+
+        def sync_one(order):
+            try:
+                return self.sync_order(order), None
+            except Exception as e:
+                return None, e
+
+        self.pending_company_links = []
+        outcomes = self.hubspot.map_parallel(sync_one, orders, workers=self.SYNC_WORKERS)
+        self._flush_company_links()
+
+        # Tally on this thread once every order has finished
+        for order, (result, error) in zip(orders, outcomes):
+            if error is None:
+                if result == 'created':
+                    created_count += 1
+                elif result == 'updated':
+                    updated_count += 1
+                elif result == 'unchanged':
+                    unchanged_count += 1
+                continue
+            order_num = order.get('OrderNum', 'unknown')
+            logger.error(f"Error syncing order {order_num}: {error}")
+            self.error_tracker.add_error('order', order_num, str(error))
+            if self.failed_tracker:
+                self.failed_tracker.add_failed_record(
+                    entity_type='order', entity_id=order_num, operation='sync',
+                    error_message=str(error), error_type=type(error).__name__, source_data=order
+                )
+
+        return created_count, updated_count, unchanged_count
+
+    def _associate_to_company(self, deal_id: str, company_id: str) -> None:
+        """Queue a deal-company association for the page's batch, or create it now outside a page."""
+        if self.pending_company_links is not None:
+            self.pending_company_links.append((deal_id, company_id))
+        else:
+            self.hubspot.associate_deal_to_company(deal_id, company_id)
+
+    def _flush_company_links(self) -> None:
+        """Create the page's queued deal-company associations in batch."""
+        links, self.pending_company_links = self.pending_company_links, None
+        if not links:
+            return
+        try:
+            status = self.hubspot.associate_deals_to_companies(links)
+            failed = [deal_id for deal_id, ok in status.items() if not ok]
+        except Exception as e:
+            logger.warning(f"Failed to associate {len(links)} deals to companies: {e}")
+            return
+        if failed:
+            logger.warning(f"Failed to associate deals to companies: {failed}")
+
+    def _prefetch_lookups(self, orders: List[Dict[str, Any]]) -> None:
+        """
+        Look up every order's deal and company in batched HubSpot searches.
+
+        Results (including misses) land in the client's lookup cache, so the
+        per-order get_deal_by_property/get_company_by_property calls are
+        answered from memory. A failure only costs the batching; sync_order
+        falls back to searching one record at a time.
+
+        Args:
+            orders: Epicor order records
+        """
+        try:
+            self.hubspot.get_deals_by_property(
+                'epicor_order_number', [order['OrderNum'] for order in orders if 'OrderNum' in order],
+                properties=list(self.transformer.DEAL_PROPERTIES)
+            )
+            self.hubspot.get_companies_by_property(
+                'epicor_customer_number', [order['CustNum'] for order in orders if 'CustNum' in order]
+            )
+        except Exception as e:
+            logger.warning(f"Failed to prefetch HubSpot deals/companies: {e}")
+
     def sync_order(self, order_data: Dict[str, Any]) -> str:
         """
         Sync a single order.
@@ -121,12 +226,12 @@ class OrderSync:
             order_data: Epicor order record
 
         Returns:
-            'created' or 'updated'
+            'created', 'updated' or 'unchanged'
         """
         order_num = order_data['OrderNum']
         cust_num = order_data['CustNum']
 
-        logger.debug(f"Syncing order {order_num} for customer {cust_num}")
+        logger.debug("Syncing order %s for customer %s", order_num, cust_num)
 
         # Transform data
         try:
@@ -177,11 +282,16 @@ class OrderSync:
         company_id = company['id']
 
         if existing_deal:
-            # Update existing deal
+            # Update existing deal, sending only the properties that differ
             deal_id = existing_deal['id']
-            result = self.hubspot.update_deal(deal_id, properties)
-            if result:
-                logger.info(f"Updated order {order_num}")
+            changed = self.transformer.changed_properties(
+                properties, existing_deal.get('properties') or {}
+            )
+            if not changed:
+                logger.debug("Order %s unchanged, skipping update", order_num)
+                action = 'unchanged'
+            elif self.hubspot.update_deal(deal_id, changed):
+                logger.info("Updated order %s", order_num)
                 action = 'updated'
             else:
                 logger.error(f"Failed to update order {order_num}")
@@ -198,7 +308,7 @@ class OrderSync:
             result = self.hubspot.create_deal(properties)
             if result:
                 deal_id = result['id']
-                logger.info(f"Created order {order_num}")
+                logger.info("Created order %s", order_num)
                 action = 'created'
             else:
                 logger.error(f"Failed to create order {order_num}")
@@ -213,8 +323,8 @@ class OrderSync:
 
         # Always ensure association exists (for both create and update)
         try:
-            self.hubspot.associate_deal_to_company(deal_id, company_id)
-            logger.debug(f"Associated order {order_num} to company {customer_num}")
+            self._associate_to_company(deal_id, company_id)
+            logger.debug("Associated order %s to company %s", order_num, customer_num)
         except Exception as e:
             logger.warning(f"Failed to associate order {order_num} to company: {e}")
 
@@ -226,8 +336,8 @@ class OrderSync:
                     deal_id, line_items, order_num
                 )
                 logger.info(
-                    f"Order {order_num} line items: {line_item_summary['created']} created, "
-                    f"{line_item_summary['updated']} updated"
+                    "Order %s line items: %s created, %s updated",
+                    order_num, line_item_summary['created'], line_item_summary['updated']
                 )
             except Exception as e:
                 logger.warning(f"Failed to sync line items for order {order_num}: {e}")
@@ -9,7 +9,7 @@ When a quote is converted to an order (Closed Won):
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from src.clients.epicor_client import EpicorClient
 from src.clients.hubspot_client import HubSpotClient
@@ -17,6 +17,7 @@ from src.transformers.quote_transformer import QuoteTransformer
 from src.transformers.order_transformer import OrderTransformer
 from src.sync.line_item_sync import LineItemSync
 from src.utils.error_handler import ErrorTracker, FailedRecordTracker
+from src.utils.prefetch import prefetched
 
 
 logger = logging.getLogger(__name__)
@@ -25,6 +26,10 @@ logger = logging.getLogger(__name__)
 class QuoteSync:
     """Handles quote to deal synchronization with stage logic."""
 
+    # Quotes synced at once (each makes several HubSpot calls; the client's
+    # shared rate limiter keeps the overall request rate in check)
+    SYNC_WORKERS = 8
+
     def __init__(
         self,
         epicor_client: EpicorClient,
@@ -46,6 +51,12 @@ class QuoteSync:
         self.line_item_sync = LineItemSync(hubspot_client)
         self.error_tracker = ErrorTracker()
         self.failed_tracker = failed_record_tracker
+        # (deal_id, company_id) pairs queued while a page syncs, created in one batch
+        # afterwards (None means associate each deal immediately)
+        self.pending_company_links: Optional[List[Tuple[str, str]]] = None
+        # Quote number -> linked Epicor order, prefetched by sync_all_quotes
+        # (None means look each converted quote's order up on demand)
+        self.linked_orders: Optional[Dict[int, Dict[str, Any]]] = None
 
     def sync_all_quotes(
         self,
@@ -54,6 +65,9 @@ class QuoteSync:
         """
         Sync all quotes from Epicor to HubSpot.
 
+        Quotes are streamed from Epicor a page at a time, and the next page is
+        fetched while the current one is synced.
+
         Args:
             filter_condition: Optional OData filter (e.g., for date range)
 
@@ -64,67 +78,296 @@ class QuoteSync:
         logger.info("STARTING QUOTE SYNC")
         logger.info("=" * 60)
 
-        # Fetch quotes from Epicor
+        total = created_count = updated_count = unchanged_count = 0
+
+        # Page N+1 is fetched in the background while page N is synced
         try:
-            quotes = self.epicor.get_quotes(
+            pages = self.epicor.iter_quote_pages(
                 expand_line_items=True,
                 filter_condition=filter_condition
             )
-            logger.info(f"Fetched {len(quotes)} quotes from Epicor")
+            for quotes in prefetched(pages):
+                total += len(quotes)
+                created, updated, unchanged = self._sync_page(quotes)
+                created_count += created
+                updated_count += updated
+                unchanged_count += unchanged
         except Exception as e:
             logger.error(f"Failed to fetch quotes: {e}")
             return {
                 'success': False,
                 'error': str(e),
-                'total': 0,
-                'created': 0,
-                'updated': 0,
-                'errors': 0
+                'total': total,
+                'created': created_count,
+                'updated': updated_count,
+                'unchanged': unchanged_count,
+                'errors': self.error_tracker.error_count
             }
-
-        # Sync each quote
-        created_count = 0
-        updated_count = 0
-
-        for quote in quotes:
-            try:
-                result = self.sync_quote(quote)
-                if result == 'created':
-                    created_count += 1
-                elif result == 'updated':
-                    updated_count += 1
-            except Exception as e:
-                quote_num = quote.get('QuoteNum', 'unknown')
-                logger.error(f"Error syncing quote {quote_num}: {e}")
-                self.error_tracker.add_error('quote', quote_num, str(e))
-                # Track failed record for CSV output
-                if self.failed_tracker:
-                    self.failed_tracker.add_failed_record(
-                        entity_type='quote',
-                        entity_id=quote_num,
-                        operation='sync',
-                        error_message=str(e),
-                        error_type=type(e).__name__,
-                        source_data=quote
-                    )
+        finally:
+            # Direct sync_quote() calls look linked orders up on demand again
+            self.linked_orders = None
+            # Write this phase's failed records in one append
+            if self.failed_tracker:
+                self.failed_tracker.flush()
 
         # Summary
         summary = {
             'success': True,
-            'total': len(quotes),
+            'total': total,
             'created': created_count,
             'updated': updated_count,
-            'errors': len(self.error_tracker.errors),
-            'error_details': self.error_tracker.errors if self.error_tracker.has_errors() else None
+            'unchanged': unchanged_count,
+            'errors': self.error_tracker.error_count,
+            'error_details': self.error_tracker.error_details() if self.error_tracker.has_errors() else None
         }
 
         logger.info("=" * 60)
         logger.info("QUOTE SYNC COMPLETE")
-        logger.info(f"Total: {summary['total']}, Created: {created_count}, Updated: {updated_count}, Errors: {summary['errors']}")
+        logger.info(f"Total: {summary['total']}, Created: {created_count}, Updated: {updated_count}, Unchanged: {unchanged_count}, Errors: {summary['errors']}")
         logger.info("=" * 60)
 
         return summary
 
+    def _sync_page(self, quotes: List[Dict[str, Any]]) -> Tuple[int, int, int]:
+        """
+        Sync one page of Epicor quotes, with lookups and deal writes batched across the page.
+
+        Args:
+            quotes: Epicor quote records
+
+        Returns:
+            Tuple of (created_count, updated_count, unchanged_count)
+        """
+        # Seed the client's lookup cache so sync_quote finds deals/companies without searching
+        self._prefetch_lookups(quotes)
+
+        # Fetch the orders for every converted quote in a few batched Epicor queries
+        self.linked_orders = self._prefetch_linked_orders(quotes)
+
+        # Look up or create every quote's products in one batched pass
+        try:
+            self.line_item_sync.prewarm_products(
+                [line for quote in quotes for line in quote.get('QuoteDtls') or []],
+                self.line_item_sync.transformer.transform_quote_line
+            )
+        except Exception as e:
+            logger.warning(f"Failed to prewarm products: {e}")
+
+        # Transform and diff every quote (lookups come from the prefetched cache)
+        def plan_one(quote):
+            try:
+                return self._plan_quote(quote), None
+            except Exception as e:
+                return None, e
+
+        planned = []
+        failed = []
+        for quote, (plan, error) in zip(
+            quotes, self.hubspot.map_parallel(plan_one, quotes, workers=self.SYNC_WORKERS)
+        ):
+            if error is not None:
+                failed.append((quote, error))
+            elif plan is not None:
+                planned.append((quote, *plan))
+
+        # Write new and changed deals through the batch endpoints
+        written = self._write_deals(planned)
+
+        # Associations, line items and linked orders need the deal ID, so they follow per quote
+        def finish_one(entry):
+            quote, deal_id, company_id, action = entry
+            try:
+                self._finish_quote(quote, deal_id, company_id)
+                return action, None
+            except Exception as e:
+                return None, e
+
+        self.pending_company_links = []
+        outcomes = self.hubspot.map_parallel(finish_one, written, workers=self.SYNC_WORKERS)
+        self._flush_company_links()
+
+        # Tally on this thread once every quote has finished
+        created_count = 0
+        updated_count = 0
+        unchanged_count = 0
+        for (quote, *_), (result, error) in zip(written, outcomes):
+            if error is None:
+                if result == 'created':
+                    created_count += 1
+                elif result == 'updated':
+                    updated_count += 1
+                elif result == 'unchanged':
+                    unchanged_count += 1
+            else:
+                failed.append((quote, error))
+
+        for quote, error in failed:
+            quote_num = quote.get('QuoteNum', 'unknown')
+            logger.error(f"Error syncing quote {quote_num}: {error}")
+            self.error_tracker.add_error('quote', quote_num, str(error))
+            # Track failed record for CSV output
+            if self.failed_tracker:
+                self.failed_tracker.add_failed_record(
+                    entity_type='quote',
+                    entity_id=quote_num,
+                    operation='sync',
+                    error_message=str(error),
+                    error_type=type(error).__name__,
+                    source_data=quote
+                )
+
+        return created_count, updated_count, unchanged_count
+
+    def _write_deals(
+        self,
+        planned: List[Tuple[Dict[str, Any], Optional[str], Dict[str, Any], str]]
+    ) -> List[Tuple[Dict[str, Any], str, str, str]]:
+        """
+        Create and update a page's quote deals with batch requests.
+
+        Args:
+            planned: (quote, deal_id, properties, company_id) tuples from _plan_quote
+
+        Returns:
+            (quote, deal_id, company_id, action) for every quote whose deal is
+            in place, where action is 'created', 'updated' or 'unchanged'
+        """
+        written = []
+        to_create = []
+        to_update = []
+        for quote, deal_id, properties, company_id in planned:
+            if not deal_id:
+                to_create.append((quote, properties, company_id))
+            elif properties:
+                to_update.append((quote, deal_id, properties, company_id))
+            else:
+                logger.debug("Quote %s unchanged, skipping update", quote['QuoteNum'])
+                written.append((quote, deal_id, company_id, 'unchanged'))
+
+        if to_update:
+            try:
+                results = self.hubspot.update_objects_batch('deals', [
+                    {'id': deal_id, 'properties': properties}
+                    for _, deal_id, properties, _ in to_update
+                ])
+                updated_ids = {str(result.get('id')) for result in results}
+            except Exception as e:
+                logger.error(f"Batch update of quote deals failed: {e}")
+                updated_ids = set()
+            for quote, deal_id, _, company_id in to_update:
+                if str(deal_id) in updated_ids:
+                    written.append((quote, deal_id, company_id, 'updated'))
+                else:
+                    self._record_write_failure(quote, 'update')
+
+        if to_create:
+            try:
+                results = self.hubspot.create_objects_batch(
+                    'deals', [properties for _, properties, _ in to_create]
+                )
+                # Batch results are not guaranteed to follow input order
+                created_ids = {
+                    str(result.get('properties', {}).get('epicor_quote_number')): result['id']
+                    for result in results
+                }
+            except Exception as e:
+                logger.error(f"Batch create of quote deals failed: {e}")
+                created_ids = {}
+            for quote, _, company_id in to_create:
+                deal_id = created_ids.get(str(quote['QuoteNum']))
+                if deal_id:
+                    written.append((quote, deal_id, company_id, 'created'))
+                else:
+                    self._record_write_failure(quote, 'create')
+
+        logger.info(
+            "Quote deals: %s created, %s updated in batch",
+            sum(1 for *_, action in written if action == 'created'),
+            sum(1 for *_, action in written if action == 'updated')
+        )
+        return written
+
+    def _associate_to_company(self, deal_id: str, company_id: str) -> None:
+        """Queue a deal-company association for the page's batch, or create it now outside a page."""
+        if self.pending_company_links is not None:
+            self.pending_company_links.append((deal_id, company_id))
+        else:
+            self.hubspot.associate_deal_to_company(deal_id, company_id)
+
+    def _flush_company_links(self) -> None:
+        """Create the page's queued deal-company associations in batch."""
+        links, self.pending_company_links = self.pending_company_links, None
+        if not links:
+            return
+        try:
+            status = self.hubspot.associate_deals_to_companies(links)
+            failed = [deal_id for deal_id, ok in status.items() if not ok]
+        except Exception as e:
+            logger.warning(f"Failed to associate {len(links)} deals to companies: {e}")
+            return
+        if failed:
+            logger.warning(f"Failed to associate deals to companies: {failed}")
+
+    def _prefetch_lookups(self, quotes: List[Dict[str, Any]]) -> None:
+        """
+        Look up every quote's deal and company in batched HubSpot searches.
+
+        Results (including misses) land in the client's lookup cache, so the
+        per-quote get_deal_by_property/get_company_by_property calls are
+        answered from memory. A failure only costs the batching; sync_quote
+        falls back to searching one record at a time.
+
+        Args:
+            quotes: Epicor quote records
+        """
+        try:
+            self.hubspot.get_deals_by_property(
+                'epicor_quote_number', [quote['QuoteNum'] for quote in quotes if 'QuoteNum' in quote],
+                properties=list(self.transformer.DEAL_PROPERTIES)
+            )
+            self.hubspot.get_companies_by_property(
+                'epicor_customer_number', [quote['CustNum'] for quote in quotes if 'CustNum' in quote]
+            )
+        except Exception as e:
+            logger.warning(f"Failed to prefetch HubSpot deals/companies: {e}")
+
+    def _prefetch_linked_orders(
+        self,
+        quotes: List[Dict[str, Any]]
+    ) -> Optional[Dict[int, Dict[str, Any]]]:
+        """
+        Fetch the Epicor orders created from every converted (Ordered) quote.
+
+        Their HubSpot order deals are looked up in the same pass so
+        _handle_converted_order finds them in the client's lookup cache.
+
+        Args:
+            quotes: Epicor quote records
+
+        Returns:
+            Dict mapping quote number to order, or None if the batched fetch
+            failed (each converted quote then looks its order up on its own)
+        """
+        quote_nums = [quote['QuoteNum'] for quote in quotes if quote.get('Ordered')]
+        if not quote_nums:
+            return {}
+
+        try:
+            linked_orders = self.epicor.get_orders_by_quotes(quote_nums)
+        except Exception as e:
+            logger.warning(f"Failed to prefetch linked orders: {e}")
+            return None
+
+        # Seed the lookup cache with the order deals too (misses included)
+        try:
+            self.hubspot.get_deals_by_property(
+                'epicor_order_number', [order['OrderNum'] for order in linked_orders.values()]
+            )
+        except Exception as e:
+            logger.warning(f"Failed to prefetch linked order deals: {e}")
+
+        return linked_orders
+
     def sync_quote(self, quote_data: Dict[str, Any]) -> str:
         """
         Sync a single quote with stage logic.
@@ -133,12 +376,55 @@ class QuoteSync:
             quote_data: Epicor quote record
 
         Returns:
-            'created' or 'updated'
+            'created', 'updated', 'unchanged' or 'error'
+        """
+        plan = self._plan_quote(quote_data)
+        if plan is None:
+            return 'error'
+        deal_id, properties, company_id = plan
+        quote_num = quote_data['QuoteNum']
+
+        if deal_id and not properties:
+            logger.debug("Quote %s unchanged, skipping update", quote_num)
+            action = 'unchanged'
+        elif deal_id:
+            if not self.hubspot.update_deal(deal_id, properties):
+                self._record_write_failure(quote_data, 'update')
+                return 'error'
+            logger.info("Updated quote %s", quote_num)
+            action = 'updated'
+        else:
+            result = self.hubspot.create_deal(properties)
+            if not result:
+                self._record_write_failure(quote_data, 'create')
+                return 'error'
+            deal_id = result['id']
+            logger.info("Created quote %s", quote_num)
+            action = 'created'
+
+        self._finish_quote(quote_data, deal_id, company_id)
+        return action
+
+    def _plan_quote(
+        self,
+        quote_data: Dict[str, Any]
+    ) -> Optional[Tuple[Optional[str], Dict[str, Any], str]]:
+        """
+        Work out what writing a quote's deal involves, without writing it.
+
+        Args:
+            quote_data: Epicor quote record
+
+        Returns:
+            (deal_id, properties, company_id): deal_id is None for a new deal,
+            and properties holds only the changed ones for an existing deal
+            (empty if it is up to date). None if the quote cannot be synced;
+            the reason is already recorded.
         """
         quote_num = quote_data['QuoteNum']
         cust_num = quote_data['CustNum']
 
-        logger.debug(f"Syncing quote {quote_num} for customer {cust_num}")
+        logger.debug("Syncing quote %s for customer %s", quote_num, cust_num)
 
         # Check if deal exists in HubSpot
         existing_deal = self.hubspot.get_deal_by_property(
@@ -162,7 +448,7 @@ class QuoteSync:
                     entity_type='quote', entity_id=quote_num, operation='transform',
                     error_message=str(e), error_type=type(e).__name__, source_data=quote_data
                 )
-            return 'error'
+            return None
 
         # Get customer number for association
         customer_num = self.transformer.get_customer_num(quote_data)
@@ -189,49 +475,58 @@ class QuoteSync:
                     error_message=f"Company {customer_num} not found in HubSpot",
                     error_type='MissingCompany', source_data=quote_data
                 )
-            return 'error'
+            return None
 
         company_id = company['id']
 
-        if existing_deal:
-            # Update existing deal
-            deal_id = existing_deal['id']
-            result = self.hubspot.update_deal(deal_id, properties)
-            if result:
-                logger.info(f"Updated quote {quote_num}")
-                action = 'updated'
-            else:
-                logger.error(f"Failed to update quote {quote_num}")
-                self.error_tracker.add_error('quote', quote_num, "HubSpot update failed")
-                if self.failed_tracker:
-                    self.failed_tracker.add_failed_record(
-                        entity_type='quote', entity_id=quote_num, operation='update',
-                        error_message='HubSpot update failed', error_type='HubSpotAPIError',
-                        source_data=quote_data
-                    )
-                return 'error'
-        else:
-            # Create new deal
-            result = self.hubspot.create_deal(properties)
-            if result:
-                deal_id = result['id']
-                logger.info(f"Created quote {quote_num}")
-                action = 'created'
-            else:
-                logger.error(f"Failed to create quote {quote_num}")
-                self.error_tracker.add_error('quote', quote_num, "HubSpot create failed")
-                if self.failed_tracker:
-                    self.failed_tracker.add_failed_record(
-                        entity_type='quote', entity_id=quote_num, operation='create',
-                        error_message='HubSpot create failed', error_type='HubSpotAPIError',
-                        source_data=quote_data
-                    )
-                return 'error'
+        if not existing_deal:
+            return None, properties, company_id
+
+        # Send only the properties that differ from HubSpot
+        changed = self.transformer.changed_properties(
+            properties, existing_deal.get('properties') or {}
+        )
+        return existing_deal['id'], changed, company_id
+
+    def _record_write_failure(self, quote_data: Dict[str, Any], operation: str) -> None:
+        """
+        Record a quote whose deal create or update failed.
+
+        Args:
+            quote_data: Epicor quote record
+            operation: 'create' or 'update'
+        """
+        quote_num = quote_data['QuoteNum']
+        message = f"HubSpot {operation} failed"
+        logger.error(f"Failed to {operation} quote {quote_num}")
+        self.error_tracker.add_error('quote', quote_num, message)
+        if self.failed_tracker:
+            self.failed_tracker.add_failed_record(
+                entity_type='quote', entity_id=quote_num, operation=operation,
+                error_message=message, error_type='HubSpotAPIError',
+                source_data=quote_data
+            )
+
+    def _finish_quote(
+        self,
+        quote_data: Dict[str, Any],
+        deal_id: str,
+        company_id: str
+    ) -> None:
+        """
+        Associate a written quote deal and sync its line items and linked order.
+
+        Args:
+            quote_data: Epicor quote record
+            deal_id: HubSpot quote deal ID
+            company_id: HubSpot company ID
+        """
+        quote_num = quote_data['QuoteNum']
 
         # Always ensure association exists (for both create and update)
         try:
-            self.hubspot.associate_deal_to_company(deal_id, company_id)
-            logger.debug(f"Associated quote {quote_num} to company {customer_num}")
+            self._associate_to_company(deal_id, company_id)
+            logger.debug("Associated quote %s to company %s", quote_num, company_id)
         except Exception as e:
             logger.warning(f"Failed to associate quote {quote_num} to company: {e}")
 
@@ -243,8 +538,8 @@ class QuoteSync:
                     deal_id, line_items, quote_num
                 )
                 logger.info(
-                    f"Quote {quote_num} line items: {line_item_summary['created']} created, "
-                    f"{line_item_summary['updated']} updated"
+                    "Quote %s line items: %s created, %s updated",
+                    quote_num, line_item_summary['created'], line_item_summary['updated']
                 )
             except Exception as e:
                 logger.warning(f"Failed to sync line items for quote {quote_num}: {e}")
@@ -253,8 +548,6 @@ class QuoteSync:
         if quote_data.get('Ordered'):
             self._handle_converted_order(quote_num, deal_id, company_id)
 
-        return action
-
     def _handle_converted_order(
         self,
         quote_num: int,
@@ -275,11 +568,14 @@ class QuoteSync:
             quote_deal_id: HubSpot quote deal ID
             company_id: HubSpot company ID
         """
-        logger.info(f"Quote {quote_num} converted to order - processing linked order...")
+        logger.info("Quote %s converted to order - processing linked order...", quote_num)
 
         # Find the order in Epicor that was created from this quote
         try:
-            order_data = self.epicor.get_order_by_quote(quote_num)
+            if self.linked_orders is not None:
+                order_data = self.linked_orders.get(quote_num)
+            else:
+                order_data = self.epicor.get_order_by_quote(quote_num)
         except Exception as e:
             logger.error(f"Failed to find order for quote {quote_num}: {e}")
             self.error_tracker.add_error('quote', quote_num, f"Failed to find linked order: {e}")
@@ -290,7 +586,7 @@ class QuoteSync:
             return
 
         order_num = order_data['OrderNum']
-        logger.info(f"Found order {order_num} linked to quote {quote_num}")
+        logger.info("Found order %s linked to quote %s", order_num, quote_num)
 
         # Transform order data
         try:
@@ -311,7 +607,7 @@ class QuoteSync:
             order_deal_id = existing_order_deal['id']
             result = self.hubspot.update_deal(order_deal_id, order_properties)
             if result:
-                logger.info(f"✅ Updated linked order {order_num}")
+                logger.info("✅ Updated linked order %s", order_num)
             else:
                 logger.error(f"❌ Failed to update order {order_num}")
                 self.error_tracker.add_error('order', order_num, "HubSpot update failed")
@@ -321,7 +617,7 @@ class QuoteSync:
             result = self.hubspot.create_deal(order_properties)
             if result:
                 order_deal_id = result['id']
-                logger.info(f"✅ Created linked order {order_num}")
+                logger.info("✅ Created linked order %s", order_num)
             else:
                 logger.error(f"❌ Failed to create order {order_num}")
                 self.error_tracker.add_error('order', order_num, "HubSpot create failed")
@@ -329,15 +625,15 @@ class QuoteSync:
 
         # Associate order deal with company
         try:
-            self.hubspot.associate_deal_to_company(order_deal_id, company_id)
-            logger.debug(f"Associated order {order_num} to company")
+            self._associate_to_company(order_deal_id, company_id)
+            logger.debug("Associated order %s to company", order_num)
         except Exception as e:
             logger.warning(f"Failed to associate order {order_num} to company: {e}")
 
         # Link quote deal to order deal
         try:
             self.hubspot.associate_deal_to_deal(quote_deal_id, order_deal_id)
-            logger.info(f"🔗 Linked quote {quote_num} to order {order_num}")
+            logger.info("🔗 Linked quote %s to order %s", quote_num, order_num)
         except Exception as e:
             logger.warning(f"Failed to link quote {quote_num} to order {order_num}: {e}")
 
@@ -349,8 +645,8 @@ class QuoteSync:
                     order_deal_id, order_line_items, order_num
                 )
                 logger.info(
-                    f"Order {order_num} line items: {line_item_summary['created']} created, "
-                    f"{line_item_summary['updated']} updated"
+                    "Order %s line items: %s created, %s updated",
+                    order_num, line_item_summary['created'], line_item_summary['updated']
                 )
             except Exception as e:
                 logger.warning(f"Failed to sync line items for order {order_num}: {e}")
@@ -14,6 +14,7 @@ from src.sync.quote_sync import QuoteSync
 from src.sync.order_sync import OrderSync
 from src.sync.line_item_sync import LineItemSync
 from src.utils.error_handler import FailedRecordTracker
+from src.utils.profiler import phase
 from src.config import settings
 
 
@@ -89,7 +90,8 @@ class SyncManager:
                 logger.info("\n" + "=" * 60)
                 logger.info("PHASE 1: CUSTOMER SYNC")
                 logger.info("=" * 60)
-                summary['customers'] = self.customer_sync.sync_all_customers()
+                with phase('customers'):
+                    summary['customers'] = self.customer_sync.sync_all_customers()
             except Exception as e:
                 logger.error(f"Customer sync failed: {e}", exc_info=True)
                 summary['success'] = False
@@ -101,9 +103,10 @@ class SyncManager:
                 logger.info("\n" + "=" * 60)
                 logger.info(f"PHASE 2: QUOTE SYNC{f' (filter: {filter_condition})' if filter_condition else ''}")
                 logger.info("=" * 60)
-                summary['quotes'] = self.quote_sync.sync_all_quotes(
-                    filter_condition=filter_condition
-                )
+                with phase('quotes'):
+                    summary['quotes'] = self.quote_sync.sync_all_quotes(
+                        filter_condition=filter_condition
+                    )
             except Exception as e:
                 logger.error(f"Quote sync failed: {e}", exc_info=True)
                 summary['success'] = False
@@ -115,9 +118,10 @@ class SyncManager:
                 logger.info("\n" + "=" * 60)
                 logger.info(f"PHASE 3: ORDER SYNC{f' (filter: {filter_condition})' if filter_condition else ''}")
                 logger.info("=" * 60)
-                summary['orders'] = self.order_sync.sync_all_orders(
-                    filter_condition=filter_condition
-                )
+                with phase('orders'):
+                    summary['orders'] = self.order_sync.sync_all_orders(
+                        filter_condition=filter_condition
+                    )
             except Exception as e:
                 logger.error(f"Order sync failed: {e}", exc_info=True)
                 summary['success'] = False
@@ -189,7 +193,8 @@ class SyncManager:
                 logger.info("\n" + "=" * 60)
                 logger.info("PHASE 1: CUSTOMER SYNC (full)")
                 logger.info("=" * 60)
-                summary['customers'] = self.customer_sync.sync_all_customers()
+                with phase('customers'):
+                    summary['customers'] = self.customer_sync.sync_all_customers()
             except Exception as e:
                 logger.error(f"Customer sync failed: {e}", exc_info=True)
                 summary['success'] = False
@@ -202,9 +207,10 @@ class SyncManager:
                 logger.info("\n" + "=" * 60)
                 logger.info(f"PHASE 2: QUOTE SYNC (delta: {quote_filter})")
                 logger.info("=" * 60)
-                summary['quotes'] = self.quote_sync.sync_all_quotes(
-                    filter_condition=quote_filter
-                )
+                with phase('quotes'):
+                    summary['quotes'] = self.quote_sync.sync_all_quotes(
+                        filter_condition=quote_filter
+                    )
             except Exception as e:
                 logger.error(f"Quote sync failed: {e}", exc_info=True)
                 summary['success'] = False
@@ -217,9 +223,10 @@ class SyncManager:
                 logger.info("\n" + "=" * 60)
                 logger.info(f"PHASE 3: ORDER SYNC (delta: {order_filter})")
                 logger.info("=" * 60)
-                summary['orders'] = self.order_sync.sync_all_orders(
-                    filter_condition=order_filter
-                )
+                with phase('orders'):
+                    summary['orders'] = self.order_sync.sync_all_orders(
+                        filter_condition=order_filter
+                    )
             except Exception as e:
                 logger.error(f"Order sync failed: {e}", exc_info=True)
                 summary['success'] = False
@@ -3,13 +3,32 @@ Base transformer class for data transformation.
 """
 
 import logging
-from datetime import datetime, timezone
+import time
 from typing import Dict, Any, Optional
 from abc import ABC, abstractmethod
 
+from src.utils.date_utils import epicor_to_unix_ms
+
 
 logger = logging.getLogger(__name__)
 
+SECONDS_PER_DAY = 86400
+
+
+def _same_value(new: Any, current: Any) -> bool:
+    """Compare a property about to be written with HubSpot's string value for it."""
+    if current is None:
+        return False
+    if isinstance(new, bool):
+        return str(new).lower() == str(current).lower()
+    if isinstance(new, (int, float)):
+        try:
+            return float(new) == float(current)
+        except (TypeError, ValueError):
+            # Dates are written as Unix ms but read back as ISO strings
+            return epicor_to_unix_ms(str(current)) == new
+    return str(new) == str(current)
+
 
 class BaseTransformer(ABC):
     """Base class for all data transformers."""
@@ -78,6 +97,29 @@ class BaseTransformer(ABC):
         Returns:
             Unix timestamp in milliseconds for today at 00:00:00 UTC
         """
-        now = datetime.now(timezone.utc)
-        midnight = datetime(now.year, now.month, now.day, 0, 0, 0, tzinfo=timezone.utc)
-        return int(midnight.timestamp() * 1000)
+        # Unix time has no leap seconds, so UTC midnights are exact multiples of a day
+        return int(time.time()) // SECONDS_PER_DAY * SECONDS_PER_DAY * 1000
+
+    @staticmethod
+    def changed_properties(
+        properties: Dict[str, Any],
+        current: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Return the properties whose values differ from the object's current HubSpot values.
+
+        HubSpot returns every property as a string, so numbers are compared
+        numerically, booleans case-insensitively and Unix ms dates against the
+        parsed ISO value. Properties missing from current always count as changed.
+
+        Args:
+            properties: Transformed properties about to be written
+            current: The object's 'properties' as returned by HubSpot
+
+        Returns:
+            The properties that need writing (empty if nothing changed)
+        """
+        return {
+            key: value for key, value in properties.items()
+            if not _same_value(value, current.get(key))
+        }
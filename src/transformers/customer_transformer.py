@@ -34,6 +34,37 @@ class CustomerTransformer(BaseTransformer):
 
     REQUIRED_FIELDS = ['CustNum', 'Name']
 
+    # (Epicor field, HubSpot property, converter or None), built once at import
+    FIELD_MAP = (
+        # 1. Primary matching field
+        ('CustNum', 'epicor_customer_number', None),
+
+        # 2. Business ID
+        ('CustID', 'epicor_customer_code', None),
+
+        # 3. Company name (required)
+        ('Name', 'name', None),
+
+        # 4-9. Address fields
+        ('Address1', 'address', None),
+        ('Address2', 'address2', None),
+        ('City', 'city', None),
+        ('State', 'state', None),
+        ('Zip', 'zip', None),
+        ('Country', 'country', None),
+
+        # 10-12. Contact fields
+        ('PhoneNum', 'phone', format_phone_e164),
+        ('FaxNum', 'fax_number', None),
+        ('EmailAddress', 'epicor_email', None),
+
+        # 13. Business fields
+        ('CurrencyCode', 'currency_code', None),
+
+        # 14. System fields
+        ('SysRowID', 'epicor_sysrowid', guid_to_string),
+    )
+
     def transform(self, customer_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Transform Epicor customer to HubSpot company properties.
@@ -42,7 +73,7 @@ class CustomerTransformer(BaseTransformer):
             customer_data: Epicor customer record
 
         Returns:
-            HubSpot company properties
+            HubSpot company properties (None values omitted)
 
         Raises:
             ValueError: If required fields missing
@@ -53,42 +84,17 @@ class CustomerTransformer(BaseTransformer):
                 f"Missing required fields in customer {customer_data.get('CustNum')}"
             )
 
-        # Transform data (14 fields)
-        properties = {
-            # 1. Primary matching field
-            'epicor_customer_number': customer_data['CustNum'],
-
-            # 2. Business ID
-            'epicor_customer_code': self.safe_get(customer_data, 'CustID'),
-
-            # 3. Company name (required)
-            'name': customer_data['Name'],
-
-            # 4-9. Address fields
-            'address': self.safe_get(customer_data, 'Address1'),
-            'address2': self.safe_get(customer_data, 'Address2'),
-            'city': self.safe_get(customer_data, 'City'),
-            'state': self.safe_get(customer_data, 'State'),
-            'zip': self.safe_get(customer_data, 'Zip'),
-            'country': self.safe_get(customer_data, 'Country'),
-
-            # 10-12. Contact fields
-            'phone': format_phone_e164(self.safe_get(customer_data, 'PhoneNum')),
-            'fax_number': self.safe_get(customer_data, 'FaxNum'),
-            'epicor_email': self.safe_get(customer_data, 'EmailAddress'),
-
-            # 13. Business fields
-            'currency_code': self.safe_get(customer_data, 'CurrencyCode'),
-
-            # 14. System fields
-            'epicor_sysrowid': guid_to_string(self.safe_get(customer_data, 'SysRowID'))
-        }
-
-        # Remove None values
-        properties = {k: v for k, v in properties.items() if v is not None}
+        # Transform data (14 fields) in a single pass, skipping None values
+        properties = {}
+        for epicor_field, hubspot_property, convert in self.FIELD_MAP:
+            value = customer_data.get(epicor_field)
+            if value is not None and convert is not None:
+                value = convert(value)
+            if value is not None:
+                properties[hubspot_property] = value
 
         logger.debug(
-            f"Transformed customer {customer_data['CustNum']}: {customer_data['Name']}"
+            "Transformed customer %s: %s", customer_data['CustNum'], customer_data['Name']
         )
 
         return properties
@@ -21,6 +21,43 @@ logger = logging.getLogger(__name__)
 class LineItemTransformer(BaseTransformer):
     """Transform Epicor line items to HubSpot line items."""
 
+    # Epicor detail fields read by transform_quote_line / transform_order_line
+    # (usable as nested OData $select lists inside $expand)
+    QUOTE_LINE_SOURCE_FIELDS = (
+        'QuoteNum', 'QuoteLine', 'PartNum', 'LineDesc', 'OrderQty',
+        'ExpUnitPrice', 'ExtPriceDtl', 'Number02', 'Character06',
+        'Character01', 'QuoteComment',
+    )
+    ORDER_LINE_SOURCE_FIELDS = (
+        'OrderNum', 'OrderLine', 'PartNum', 'LineDesc', 'OrderQty',
+        'UnitPrice', 'ExtPriceDtl', 'NeedByDate', 'RequestDate', 'Character01',
+    )
+
+    # (Epicor field, HubSpot property, default if missing, converter or None) for the
+    # fields copied as-is; SKU, name and the line ID are built separately
+    QUOTE_LINE_FIELD_MAP = (
+        ('OrderQty', 'quantity', 1, None),
+        ('ExpUnitPrice', 'price', 0, None),
+        ('ExtPriceDtl', 'amount', 0, None),
+        # Cost fields
+        ('Number02', 'epicor_line_current_cost', None, None),
+        ('Number02', 'hs_cost_of_goods_sold', None, None),
+        ('Character06', 'epicor_cost_source', None, None),
+        # Comment/note fields
+        ('Character01', 'epicor_quote_backup_note', None, None),
+        ('QuoteComment', 'epicor_line_comment', None, None),
+    )
+    ORDER_LINE_FIELD_MAP = (
+        ('OrderQty', 'quantity', 1, None),
+        ('UnitPrice', 'price', 0, None),
+        ('ExtPriceDtl', 'amount', 0, None),
+        # Date fields (Unix ms for HubSpot date/time picker)
+        ('NeedByDate', 'epicor_promise_ship_date', None, epicor_to_unix_ms),
+        ('RequestDate', 'epicor_revised_ship_date', None, epicor_to_unix_ms),
+        # Custom fields
+        ('Character01', 'epicor_c1_manager', None, None),
+    )
+
     def transform(self, source_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Default transform method (not used for line items).
@@ -45,47 +82,34 @@ class LineItemTransformer(BaseTransformer):
         Returns:
             HubSpot line item properties
         """
+        get = line_data.get
+
         # Get quote number and line number for unique ID
-        q_num = quote_num or self.safe_get(line_data, 'QuoteNum')
-        q_line = self.safe_get(line_data, 'QuoteLine')
+        q_num = quote_num or get('QuoteNum')
+        q_line = get('QuoteLine')
 
         # Get part number and description
-        part_num = self.safe_get(line_data, 'PartNum') or ''
-        description = self.safe_get(line_data, 'LineDesc') or ''
+        part_num = get('PartNum') or ''
+        description = get('LineDesc') or ''
 
         # Build name as: part_number + ' ' + description
         name = f"{part_num} {description}".strip() or f"Part {part_num}"
 
-        # Get cost and comment fields
-        current_cost = self.safe_get(line_data, 'Number02')
-        cost_source = self.safe_get(line_data, 'Character06')
-        backup_note = self.safe_get(line_data, 'Character01')
-        line_comment = self.safe_get(line_data, 'QuoteComment')
-
         properties = {
             'sku': part_num,
             'name': name,
-            'description': description,
-            'quantity': self.safe_get(line_data, 'OrderQty', 1),
-            'price': self.safe_get(line_data, 'ExpUnitPrice', 0),
-            'amount': self.safe_get(line_data, 'ExtPriceDtl', 0),
-            # Cost fields
-            'epicor_line_current_cost': current_cost,
-            'hs_cost_of_goods_sold': current_cost,
-            'epicor_cost_source': cost_source,
-            # Comment/note fields
-            'epicor_quote_backup_note': backup_note,
-            'epicor_line_comment': line_comment
+            'description': description
         }
+        self._map_fields(line_data, self.QUOTE_LINE_FIELD_MAP, properties)
 
         # Add unique identifier for upsert logic
         if q_num and q_line:
             properties['epicor_line_item_id'] = f"Q{q_num}-{q_line}"
 
-        # Remove None values
-        properties = {k: v for k, v in properties.items() if v is not None}
-
-        logger.debug(f"Transformed quote line: {properties.get('sku')} ({properties.get('epicor_line_item_id')})")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Transformed quote line: %s (%s)", part_num, properties.get('epicor_line_item_id')
+            )
 
         return properties
 
@@ -104,53 +128,61 @@ class LineItemTransformer(BaseTransformer):
         Returns:
             HubSpot line item properties
         """
+        get = line_data.get
+
         # Get order number and line number for unique ID
-        o_num = order_num or self.safe_get(line_data, 'OrderNum')
-        o_line = self.safe_get(line_data, 'OrderLine')
+        o_num = order_num or get('OrderNum')
+        o_line = get('OrderLine')
 
         # Get part number and description
-        part_num = self.safe_get(line_data, 'PartNum') or ''
-        description = self.safe_get(line_data, 'LineDesc') or ''
+        part_num = get('PartNum') or ''
+        description = get('LineDesc') or ''
 
         # Build name as: part_number + ' ' + description
         name = f"{part_num} {description}".strip() or f"Part {part_num}"
 
-        # Get date fields and convert to Unix ms for HubSpot date/time picker
-        need_by_date = epicor_to_unix_ms(self.safe_get(line_data, 'NeedByDate'))
-        request_date = epicor_to_unix_ms(self.safe_get(line_data, 'RequestDate'))
-
-        # Get custom fields
-        c1_manager = self.safe_get(line_data, 'Character01')
-
-        # Build computed field: OrderNum~OrderLine~PartNum
-        c1_job_manager = f"{o_num}~{o_line}~{part_num}" if o_num and o_line else None
-
         properties = {
             'sku': part_num,
             'name': name,
-            'description': description,
-            'quantity': self.safe_get(line_data, 'OrderQty', 1),
-            'price': self.safe_get(line_data, 'UnitPrice', 0),
-            'amount': self.safe_get(line_data, 'ExtPriceDtl', 0),
-            # Date fields (Unix ms for HubSpot date/time picker)
-            'epicor_promise_ship_date': need_by_date,
-            'epicor_revised_ship_date': request_date,
-            # Custom fields
-            'epicor_c1_manager': c1_manager,
-            'epicor_c1_job_manager': c1_job_manager
+            'description': description
         }
+        self._map_fields(line_data, self.ORDER_LINE_FIELD_MAP, properties)
 
-        # Add unique identifier for upsert logic
         if o_num and o_line:
+            # Computed field: OrderNum~OrderLine~PartNum
+            properties['epicor_c1_job_manager'] = f"{o_num}~{o_line}~{part_num}"
+            # Add unique identifier for upsert logic
             properties['epicor_line_item_id'] = f"O{o_num}-{o_line}"
 
-        # Remove None values
-        properties = {k: v for k, v in properties.items() if v is not None}
-
-        logger.debug(f"Transformed order line: {properties.get('sku')} ({properties.get('epicor_line_item_id')})")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Transformed order line: %s (%s)", part_num, properties.get('epicor_line_item_id')
+            )
 
         return properties
 
+    @staticmethod
+    def _map_fields(
+        line_data: Dict[str, Any],
+        field_map: tuple,
+        properties: Dict[str, Any]
+    ) -> None:
+        """
+        Copy mapped fields into properties, skipping None values.
+
+        Args:
+            line_data: Epicor QuoteDtl or OrderDtl record
+            field_map: QUOTE_LINE_FIELD_MAP or ORDER_LINE_FIELD_MAP
+            properties: Line item properties to add to
+        """
+        get = line_data.get
+        for epicor_field, hubspot_property, default, convert in field_map:
+            value = get(epicor_field, default)
+            if value is not None and convert is not None:
+                value = convert(value)
+            if value is not None:
+                properties[hubspot_property] = value
+
     def get_minimal_product_properties(
         self,
         part_num: str,
@@ -81,29 +81,29 @@ class OrderStageLogic:
 
         # Priority 1: Cancelled
         if void_order:
-            logger.debug(f"Order stage: cancelled (VoidOrder=true)")
+            logger.debug("Order stage: cancelled (VoidOrder=true)")
             return 'cancelled'
 
         # Priority 2: Completed
         if not open_order:
-            logger.debug(f"Order stage: completed (OpenOrder=false)")
+            logger.debug("Order stage: completed (OpenOrder=false)")
             return 'completed'
 
         # Priority 3: On hold
         if order_held:
-            logger.debug(f"Order stage: order_held (OrderHeld=true)")
+            logger.debug("Order stage: order_held (OrderHeld=true)")
             return 'order_held'
 
         # Priority 4: Partially shipped
         if open_order and total_shipped > 0:
             logger.debug(
-                f"Order stage: partially_shipped "
-                f"(OpenOrder=true, TotalShipped={total_shipped})"
+                "Order stage: partially_shipped (OpenOrder=true, TotalShipped=%s)",
+                total_shipped
             )
             return 'partially_shipped'
 
         # Priority 5: New order
-        logger.debug(f"Order stage: order_received (default)")
+        logger.debug("Order stage: order_received (default)")
         return 'order_received'
 
 
@@ -112,6 +112,22 @@ class OrderTransformer(BaseTransformer):
 
     REQUIRED_FIELDS = ['OrderNum', 'CustNum', 'OpenOrder']
 
+    # Epicor SalesOrder fields read by transform() (usable as an OData $select list)
+    SOURCE_FIELDS = (
+        'OrderNum', 'CustNum', 'OpenOrder', 'VoidOrder', 'OrderHeld',
+        'TotalShipped', 'OrderDate', 'RequestDate', 'NeedByDate', 'OrderAmt',
+        'DocOrderAmt', 'PONum', 'CurrencyCode', 'SysRowID',
+    )
+
+    # HubSpot deal properties transform() can set (fetched with existing deals
+    # so unchanged ones can be skipped)
+    DEAL_PROPERTIES = (
+        'dealname', 'epicor_order_number', 'pipeline', 'dealstage', 'createdate',
+        'closedate', 'need_by_date', 'amount', 'epicor_doc_amount',
+        'customer_po_number', 'deal_currency_code_', 'epicor_open_order',
+        'epicor_order_sysrowid', 'epicor_last_sync_timestamp',
+    )
+
     def transform(self, order_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Transform Epicor order to HubSpot deal properties.
@@ -203,9 +219,7 @@ class OrderTransformer(BaseTransformer):
         # Remove None values
         properties = {k: v for k, v in properties.items() if v is not None}
 
-        logger.debug(
-            f"Transformed order {order_data['OrderNum']} to stage '{stage}'"
-        )
+        logger.debug("Transformed order %s to stage '%s'", order_data['OrderNum'], stage)
 
         return properties
 
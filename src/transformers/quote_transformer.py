@@ -155,20 +155,18 @@ class QuoteStageLogic:
 
         # Rule 2: Terminal stages from Epicor always win
         if new in QuoteStageLogic.TERMINAL_STAGES:
-            logger.debug(f"Terminal stage override: '{new}' always updates")
+            logger.debug("Terminal stage override: '%s' always updates", new)
             return True
 
         # Rule 3: Can't reopen permanent terminals
         if current in QuoteStageLogic.PERMANENT_TERMINAL_STAGES:
-            logger.debug(
-                f"Blocking: Cannot reopen permanent terminal '{current}'"
-            )
+            logger.debug("Blocking: Cannot reopen permanent terminal '%s'", current)
             return False
 
         # Rule 4: Can reactivate reversible terminals (Expired)
         if current in QuoteStageLogic.REVERSIBLE_TERMINAL_STAGES:
             logger.info(
-                f"Reactivating quote from reversible terminal '{current}' � '{new}'"
+                "Reactivating quote from reversible terminal '%s' � '%s'", current, new
             )
             return True
 
@@ -178,14 +176,14 @@ class QuoteStageLogic:
 
         if new_position > current_position:
             logger.debug(
-                f"Forward progression: '{current}' (pos {current_position}) "
-                f"� '{new}' (pos {new_position})"
+                "Forward progression: '%s' (pos %s) � '%s' (pos %s)",
+                current, current_position, new, new_position
             )
             return True
         else:
             logger.debug(
-                f"Blocking backward movement: '{current}' (pos {current_position}) "
-                f"� '{new}' (pos {new_position})"
+                "Blocking backward movement: '%s' (pos %s) � '%s' (pos %s)",
+                current, current_position, new, new_position
             )
             return False
 
@@ -195,6 +193,26 @@ class QuoteTransformer(BaseTransformer):
 
     REQUIRED_FIELDS = ['QuoteNum', 'CustNum']
 
+    # Epicor Quote fields read by transform() (usable as an OData $select list)
+    SOURCE_FIELDS = (
+        'QuoteNum', 'CustNum', 'EntryDate', 'DueDate', 'ExpirationDate',
+        'DateQuoted', 'QuoteAmt', 'DocQuoteAmt', 'DiscountPercent', 'PONum',
+        'CurrencyCode', 'Character03', 'Quoted', 'QuoteClosed', 'Ordered',
+        'Expired', 'SalesRepCode', 'SysRowID',
+    )
+
+    # HubSpot deal properties transform() can set (fetched with existing deals
+    # so unchanged ones can be skipped)
+    DEAL_PROPERTIES = (
+        'dealname', 'epicor_quote_number', 'pipeline', 'dealstage', 'createdate',
+        'closedate', 'quote_expiration_date', 'quote_sent_date', 'amount',
+        'epicor_doc_amount', 'discount_percentage', 'customer_po_number',
+        'deal_currency_code_', 'epicor_project', 'epicor_quoted', 'epicor_closed',
+        'epicor_converted_to_order', 'epicor_expired', 'epicor_sales_rep_code',
+        'hubspot_owner_id', 'epicor_quote_sysrowid', 'epicor_last_sync_stage',
+        'epicor_last_sync_timestamp',
+    )
+
     def transform(
         self,
         quote_data: Dict[str, Any],
@@ -313,17 +331,17 @@ class QuoteTransformer(BaseTransformer):
             stage_id = QuoteStageLogic.get_stage_id(new_stage)
             properties['dealstage'] = stage_id
             action = 'set to' if current_hubspot_stage is None else 'updated to'
-            logger.info(f"Quote {quote_data['QuoteNum']}: Stage {action} '{new_stage}' (ID: {stage_id})")
+            logger.info("Quote %s: Stage %s '%s' (ID: %s)", quote_data['QuoteNum'], action, new_stage, stage_id)
         else:
             logger.info(
-                f"Quote {quote_data['QuoteNum']}: "
-                f"Stage update blocked (keeping '{current_hubspot_stage}')"
+                "Quote %s: Stage update blocked (keeping '%s')",
+                quote_data['QuoteNum'], current_hubspot_stage
             )
 
         # 20. Add owner if mapped
         if hubspot_owner:
             properties['hubspot_owner_id'] = hubspot_owner
-            logger.debug(f"Mapped rep '{sales_rep_code}' to owner '{hubspot_owner}'")
+            logger.debug("Mapped rep '%s' to owner '%s'", sales_rep_code, hubspot_owner)
         elif sales_rep_code:
             logger.warning(
                 f"Sales rep '{sales_rep_code}' not mapped. Deal will be unassigned."
@@ -332,7 +350,7 @@ class QuoteTransformer(BaseTransformer):
         # Remove None values
         properties = {k: v for k, v in properties.items() if v is not None}
 
-        logger.debug(f"Transformed quote {quote_data['QuoteNum']}")
+        logger.debug("Transformed quote %s", quote_data['QuoteNum'])
 
         return properties
 
@@ -12,10 +12,14 @@ to ensure consistent behavior across different servers and environments.
 from datetime import datetime, timezone
 from typing import Optional
 import logging
+import re
 
 
 logger = logging.getLogger(__name__)
 
+# Everything that is not a digit, stripped from phone numbers in one pass
+_NON_DIGIT_RE = re.compile(r'\D')
+
 
 def epicor_to_unix_ms(date_str: Optional[str]) -> Optional[int]:
     """
@@ -284,9 +288,9 @@ def format_phone_e164(phone: Optional[str]) -> Optional[str]:
 
         # Remove all non-digit characters except leading +
         if has_country_code:
-            digits = '+' + ''.join(c for c in phone_str[1:] if c.isdigit())
+            digits = '+' + _NON_DIGIT_RE.sub('', phone_str[1:])
         else:
-            digits = ''.join(c for c in phone_str if c.isdigit())
+            digits = _NON_DIGIT_RE.sub('', phone_str)
 
         # If no digits, return None
         if not digits or digits == '+':
@@ -10,8 +10,13 @@ import time
 import functools
 import csv
 import os
+import threading
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Callable, Any, Type, Tuple, Optional, List, Dict
+from typing import Callable, Any, Type, Tuple, Optional, List, Dict, Deque
+
+from . import json_utils
 
 
 logger = logging.getLogger(__name__)
@@ -214,9 +219,10 @@ def handle_api_error(response, api_name: str = "API") -> None:
     """
     status_code = response.status_code
     try:
-        error_detail = response.json()
-    except:
-        error_detail = response.text
+        # Parse raw bytes directly (skips decoding to response.text first)
+        error_detail = json_utils.loads(response.content)
+    except ValueError:
+        error_detail = response.text[:2048]
 
     error_message = f"{api_name} request failed with status {status_code}"
 
@@ -262,11 +268,26 @@ def safe_get(dictionary: dict, *keys, default: Any = None) -> Any:
 # Error Tracker Class
 # ============================================================================
 
+@dataclass(slots=True)
+class TrackedIssue:
+    """A single error or warning recorded by ErrorTracker."""
+
+    entity_type: str
+    identifier: Any
+    message: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary form used in sync results."""
+        return {'type': self.entity_type, 'id': self.identifier, 'message': self.message}
+
+
 class ErrorTracker:
     """
     Track errors and warnings during sync operations.
 
     Collects errors and warnings for reporting after batch operations complete.
+    Only the most recent MAX_ENTRIES of each are kept in memory; error_count
+    and warning_count still count every one. Safe to use from worker threads.
 
     Example:
         >>> tracker = ErrorTracker()
@@ -277,10 +298,12 @@ class ErrorTracker:
         >>> print(tracker.get_summary())
     """
 
+    MAX_ENTRIES = 10000
+
     def __init__(self):
         """Initialize empty error and warning lists."""
-        self.errors = []
-        self.warnings = []
+        self._lock = threading.Lock()
+        self.clear()
 
     def add_error(self, entity_type: str, identifier: Any, message: str) -> None:
         """
@@ -291,12 +314,9 @@ class ErrorTracker:
             identifier: Identifier of the entity (e.g., CustNum, QuoteNum)
             message: Error message
         """
-        error_entry = {
-            'type': entity_type,
-            'id': identifier,
-            'message': message
-        }
-        self.errors.append(error_entry)
+        with self._lock:
+            self.errors.append(TrackedIssue(entity_type, identifier, message))
+            self.error_count += 1
         logger.error(f"[{entity_type}:{identifier}] {message}")
 
     def add_warning(self, entity_type: str, identifier: Any, message: str) -> None:
@@ -308,21 +328,22 @@ class ErrorTracker:
             identifier: Identifier of the entity
             message: Warning message
         """
-        warning_entry = {
-            'type': entity_type,
-            'id': identifier,
-            'message': message
-        }
-        self.warnings.append(warning_entry)
+        with self._lock:
+            self.warnings.append(TrackedIssue(entity_type, identifier, message))
+            self.warning_count += 1
         logger.warning(f"[{entity_type}:{identifier}] {message}")
 
     def has_errors(self) -> bool:
         """Return True if any errors have been recorded."""
-        return len(self.errors) > 0
+        return self.error_count > 0
 
     def has_warnings(self) -> bool:
         """Return True if any warnings have been recorded."""
-        return len(self.warnings) > 0
+        return self.warning_count > 0
+
+    def error_details(self) -> List[Dict[str, Any]]:
+        """Return the retained errors as dicts (type, id, message)."""
+        return [error.to_dict() for error in self.errors]
 
     def get_summary(self) -> dict:
         """
@@ -332,16 +353,18 @@ class ErrorTracker:
             Dictionary with error and warning counts and details
         """
         return {
-            'error_count': len(self.errors),
-            'warning_count': len(self.warnings),
-            'errors': self.errors,
-            'warnings': self.warnings
+            'error_count': self.error_count,
+            'warning_count': self.warning_count,
+            'errors': self.error_details(),
+            'warnings': [warning.to_dict() for warning in self.warnings]
         }
 
     def clear(self) -> None:
         """Clear all errors and warnings."""
-        self.errors = []
-        self.warnings = []
+        self.errors: Deque[TrackedIssue] = deque(maxlen=self.MAX_ENTRIES)
+        self.warnings: Deque[TrackedIssue] = deque(maxlen=self.MAX_ENTRIES)
+        self.error_count = 0
+        self.warning_count = 0
 
 
 # ============================================================================
@@ -353,7 +376,8 @@ class FailedRecordTracker:
     Tracks failed sync records and writes them to a CSV file for retry.
 
     This tracker logs failed records with full context for debugging and
-    enables easy retry of failed records.
+    enables easy retry of failed records. Records are buffered in memory
+    and written in one append by flush() (also called by close()).
 
     Example:
         >>> tracker = FailedRecordTracker("logs/failed_records.csv")
@@ -391,31 +415,8 @@ class FailedRecordTracker:
 
         self.output_file = output_file
         self.failed_records: List[Dict] = []
-        self._file_handle = None
-        self._writer = None
-        self._initialized = False
-
-    def _ensure_initialized(self) -> None:
-        """Initialize CSV file and writer on first use."""
-        if self._initialized:
-            return
-
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(self.output_file) if os.path.dirname(self.output_file) else 'logs', exist_ok=True)
-
-        # Check if file exists (for header writing)
-        file_exists = os.path.exists(self.output_file)
-
-        # Open file in append mode
-        self._file_handle = open(self.output_file, 'a', newline='', encoding='utf-8')
-        self._writer = csv.DictWriter(self._file_handle, fieldnames=self.CSV_HEADERS)
-
-        # Write header only if new file
-        if not file_exists:
-            self._writer.writeheader()
-
-        self._initialized = True
-        logger.info(f"Failed record tracker initialized: {self.output_file}")
+        # Rows not yet written to the CSV; flushed in one write by flush()
+        self._pending: List[Dict] = []
 
     def add_failed_record(
         self,
@@ -439,8 +440,6 @@ class FailedRecordTracker:
             source_data: Original data that failed to sync (optional)
             retry_count: Number of times this record has been retried
         """
-        self._ensure_initialized()
-
         record = {
             'timestamp': datetime.now().isoformat(),
             'entity_type': entity_type,
@@ -448,15 +447,14 @@ class FailedRecordTracker:
             'operation': operation,
             'error_message': str(error_message)[:500],  # Truncate long messages
             'error_type': error_type or 'Unknown',
-            'source_data': str(source_data)[:1000] if source_data else '',
+            'source_data': (
+                json_utils.dumps(source_data, default=str).decode()[:1000] if source_data else ''
+            ),
             'retry_count': retry_count
         }
 
-        # Write to CSV immediately
-        self._writer.writerow(record)
-        self._file_handle.flush()  # Ensure written to disk
-
-        # Keep in memory for summary
+        # Buffer for the CSV and keep in memory for the summary
+        self._pending.append(record)
         self.failed_records.append(record)
 
         # Log the failure
@@ -497,12 +495,28 @@ class FailedRecordTracker:
         """Return True if any records have failed."""
         return len(self.failed_records) > 0
 
+    def flush(self) -> None:
+        """Append buffered records to the CSV file in a single write."""
+        if not self._pending:
+            return
+
+        # Ensure directory exists
+        os.makedirs(os.path.dirname(self.output_file) or 'logs', exist_ok=True)
+
+        # Write header only if new file
+        file_exists = os.path.exists(self.output_file)
+        with open(self.output_file, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=self.CSV_HEADERS)
+            if not file_exists:
+                writer.writeheader()
+            writer.writerows(self._pending)
+
+        logger.info(f"Wrote {len(self._pending)} failed records to {self.output_file}")
+        self._pending = []
+
     def close(self) -> None:
-        """Close the CSV file handle."""
-        if self._file_handle:
-            self._file_handle.close()
-            self._file_handle = None
-            self._writer = None
+        """Flush any buffered records to the CSV file."""
+        self.flush()
 
         if self.failed_records:
             logger.warning(
@@ -515,6 +529,6 @@ class FailedRecordTracker:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit - ensure file is closed."""
+        """Context manager exit - ensure buffered records are written."""
         self.close()
         return False
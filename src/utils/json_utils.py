@@ -0,0 +1,67 @@
+"""
+JSON encode/decode helpers for API payloads.
+
+Uses orjson when it is installed (C implementation, several times faster
+on large batch/search responses) and falls back to the standard library
+json module otherwise, so callers never need to care which is available.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: Raw JSON bytes (e.g., response.content) or string
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        ValueError: If data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(
+    obj: Any,
+    sort_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+    indent: bool = False
+) -> bytes:
+    """
+    Serialize an object to JSON bytes (compact unless indent is set).
+
+    Non-string dict keys are converted to strings, as the standard library does.
+
+    Args:
+        obj: JSON-serializable object
+        sort_keys: Sort dict keys (canonical output, e.g. for cache keys)
+        default: Called for objects that cannot be serialized (e.g., str)
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, sort_keys=sort_keys, default=default).encode('utf-8')
+    return json.dumps(
+        obj, separators=(',', ':'), sort_keys=sort_keys, default=default
+    ).encode('utf-8')
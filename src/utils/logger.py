@@ -24,6 +24,11 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
     # Convert level string to logging constant
     numeric_level = getattr(logging, level.upper(), logging.INFO)
 
+    # Warm invocations call this on every run; keep the handlers if nothing changed
+    root_logger = logging.getLogger()
+    if getattr(root_logger, "_configured", None) == (numeric_level, log_file):
+        return
+
     # Create formatter
     formatter = logging.Formatter(
         fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -31,7 +36,6 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
     )
 
     # Configure root logger
-    root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
 
     # Remove existing handlers to avoid duplicates
@@ -53,6 +57,8 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
         except Exception as e:
             logging.error(f"Failed to create file handler for {log_file}: {e}")
 
+    root_logger._configured = (numeric_level, log_file)
+
     # Log initial message
     logging.info(f"Logging initialized at {level} level")
 
@@ -0,0 +1,40 @@
+"""
+Background prefetching for paged Epicor fetches.
+
+Lets a sync process one page while the next is fetched, so the Epicor
+round trip overlaps the HubSpot writes instead of adding to them.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, TypeVar
+
+
+T = TypeVar('T')
+
+_DONE = object()
+
+
+def prefetched(iterable: Iterable[T]) -> Iterator[T]:
+    """
+    Yield items from iterable, fetching the next one on a background thread.
+
+    At most one item is fetched ahead, so memory stays at two items. Any
+    exception raised while fetching is re-raised to the consumer at the
+    point it would have received that item.
+
+    Args:
+        iterable: Usually a page generator such as EpicorClient.iter_quote_pages()
+
+    Yields:
+        The items of iterable, in order
+
+    Example:
+        >>> for quotes in prefetched(epicor.iter_quote_pages(expand_line_items=True)):
+        ...     sync_page(quotes)
+    """
+    iterator = iter(iterable)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        next_item = executor.submit(next, iterator, _DONE)
+        while (item := next_item.result()) is not _DONE:
+            next_item = executor.submit(next, iterator, _DONE)
+            yield item
@@ -0,0 +1,67 @@
+"""
+Lightweight per-phase profiling for sync runs.
+
+Each phase logs one structured line with its wall-clock duration. Setting
+PROFILE_MEM=1 also traces allocations with tracemalloc and adds the peak
+and net memory for the phase (tracing slows the run, so it is off by default).
+"""
+
+import logging
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Iterator
+
+from . import json_utils
+
+
+logger = logging.getLogger(__name__)
+
+
+def memory_profiling_enabled() -> bool:
+    """Return True if PROFILE_MEM=1 is set."""
+    return os.environ.get('PROFILE_MEM') == '1'
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """
+    Time a sync phase and log a single structured line when it ends.
+
+    The line is logged even if the phase raises. Phases should not be
+    nested when PROFILE_MEM=1, as each one resets the tracemalloc peak.
+
+    Args:
+        name: Phase name (e.g., 'customers', 'quotes', 'orders')
+
+    Example:
+        >>> with phase("customers"):
+        ...     customer_sync.sync_all_customers()
+        # PHASE {"phase":"customers","duration_ms":1234}
+    """
+    trace_memory = memory_profiling_enabled()
+    started_tracing = False
+    if trace_memory:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            started_tracing = True
+        tracemalloc.reset_peak()
+        start_bytes = tracemalloc.get_traced_memory()[0]
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record = {
+            'phase': name,
+            'duration_ms': round((time.perf_counter() - start) * 1000)
+        }
+        if trace_memory:
+            current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+            record['peak_kb'] = (peak_bytes - start_bytes) // 1024
+            record['net_kb'] = (current_bytes - start_bytes) // 1024
+            if started_tracing:
+                tracemalloc.stop()
+
+        logger.info("PHASE %s", json_utils.dumps(record).decode())
@@ -0,0 +1,313 @@
+"""
+Test configuration helpers.
+"""
+
+import sys
+
+import pytest
+from unittest.mock import Mock
+from pydantic import ValidationError
+
+import src.config as config
+
+
+class TestSecretClient:
+    """Test Key Vault client caching."""
+
+    @pytest.fixture(autouse=True)
+    def azure_sdk(self, monkeypatch):
+        """Stub the Azure SDK classes and reset the cached client."""
+        monkeypatch.setattr(config, 'SecretClient', Mock(side_effect=lambda **kw: Mock(**kw)))
+        monkeypatch.setattr(config, 'DefaultAzureCredential', Mock())
+        monkeypatch.setattr(config, '_SECRET_CLIENT', None)
+        monkeypatch.setattr(config, '_SECRET_CLIENT_VAULT_URL', None)
+
+    def test_client_reused(self):
+        """Test the client is built once per vault URL."""
+        first = config._get_secret_client('https://vault-a.vault.azure.net/')
+        second = config._get_secret_client('https://vault-a.vault.azure.net/')
+
+        assert first is second
+        config.SecretClient.assert_called_once()
+
+    def test_new_vault_url_rebuilds(self):
+        """Test a different vault URL gets its own client."""
+        first = config._get_secret_client('https://vault-a.vault.azure.net/')
+        second = config._get_secret_client('https://vault-b.vault.azure.net/')
+
+        assert first is not second
+
+    def test_missing_sdk_raises(self, monkeypatch):
+        """Test ImportError when the Azure SDK is not installed."""
+        monkeypatch.setattr(config, 'SecretClient', None)
+        # A None entry makes the import fail even where the SDK is installed
+        monkeypatch.setitem(sys.modules, 'azure.keyvault.secrets', None)
+
+        with pytest.raises(ImportError):
+            config._get_secret_client('https://vault-a.vault.azure.net/')
+
+
+class TestLoadSecrets:
+    """Test loading secrets from Key Vault into the environment."""
+
+    @pytest.fixture
+    def azure_env(self, monkeypatch):
+        """Pretend to run in Azure with no credentials set."""
+        monkeypatch.setenv('AZURE_FUNCTIONS_ENVIRONMENT', 'Production')
+        monkeypatch.setenv('AZURE_KEYVAULT_URL', 'https://vault.vault.azure.net/')
+        monkeypatch.delenv('EPICOR_BASE_URL', raising=False)
+        monkeypatch.delenv('AZURE_KEYVAULT_BUNDLE_SECRET', raising=False)
+        monkeypatch.setattr(config, '_SECRETS_LOADED', False)
+        # Registered with monkeypatch so values written by the loader are undone
+        for env_key in config.SECRET_ENV_MAPPING.values():
+            monkeypatch.delenv(env_key, raising=False)
+
+    def test_individual_secrets_loaded(self, azure_env, monkeypatch):
+        """Test each mapped secret is fetched and exported."""
+        client = Mock()
+        client.get_secret.side_effect = lambda name: Mock(value=f"value-{name}")
+        monkeypatch.setattr(config, '_get_secret_client', lambda url: client)
+
+        assert config.load_secrets_from_cloud() is True
+
+        assert config.os.environ['EPICOR_BASE_URL'] == 'value-epicor-base-url'
+        assert config.os.environ['HUBSPOT_API_KEY'] == 'value-hubspot-api-key'
+        assert client.get_secret.call_count == 8
+
+    def test_bundle_secret_single_call(self, azure_env, monkeypatch):
+        """Test a JSON bundle secret is loaded with one Key Vault call."""
+        client = Mock()
+        client.get_secret.return_value = Mock(
+            value='{"EPICOR_BASE_URL": "https://erp", "epicor_company": "PLP"}'
+        )
+        monkeypatch.setattr(config, '_get_secret_client', lambda url: client)
+
+        assert config.load_secrets_from_cloud(bundle_secret_name='integration-config') is True
+
+        client.get_secret.assert_called_once_with('integration-config')
+        assert config.os.environ['EPICOR_BASE_URL'] == 'https://erp'
+        assert config.os.environ['EPICOR_COMPANY'] == 'PLP'
+
+    def test_bundle_keeps_set_values(self, azure_env, monkeypatch):
+        """Test the bundle only fills missing credentials and ignores unknown keys."""
+        monkeypatch.setenv('HUBSPOT_API_KEY', 'resolved-by-platform')
+        monkeypatch.delenv('UNRELATED_SETTING', raising=False)
+        client = Mock()
+        client.get_secret.return_value = Mock(value=(
+            '{"EPICOR_BASE_URL": "https://erp", "HUBSPOT_API_KEY": "stale", '
+            '"UNRELATED_SETTING": "x"}'
+        ))
+        monkeypatch.setattr(config, '_get_secret_client', lambda url: client)
+
+        assert config.load_secrets_from_cloud(bundle_secret_name='integration-config') is True
+
+        assert config.os.environ['EPICOR_BASE_URL'] == 'https://erp'
+        assert config.os.environ['HUBSPOT_API_KEY'] == 'resolved-by-platform'
+        assert 'UNRELATED_SETTING' not in config.os.environ
+
+    def test_unresolved_key_vault_reference_falls_back_to_sdk(self, azure_env, monkeypatch):
+        """Test a literal Key Vault reference is not treated as a loaded credential."""
+        monkeypatch.setenv(
+            'EPICOR_BASE_URL',
+            '@Microsoft.KeyVault(VaultName=kv;SecretName=epicor-base-url)'
+        )
+        client = Mock()
+        client.get_secret.side_effect = lambda name: Mock(value=f"value-{name}")
+        monkeypatch.setattr(config, '_get_secret_client', lambda url: client)
+
+        assert config.load_secrets_from_cloud() is True
+
+        assert config.os.environ['EPICOR_BASE_URL'] == 'value-epicor-base-url'
+
+    def test_second_call_short_circuits(self, azure_env, monkeypatch):
+        """Test secrets are only fetched by the first successful call."""
+        client = Mock()
+        client.get_secret.side_effect = lambda name: Mock(value=f"value-{name}")
+        get_client = Mock(return_value=client)
+        monkeypatch.setattr(config, '_get_secret_client', get_client)
+
+        assert config.load_secrets_from_cloud() is True
+        assert config.load_secrets_from_cloud() is True
+
+        get_client.assert_called_once()
+
+    def test_only_missing_secrets_fetched(self, azure_env, monkeypatch):
+        """Test secrets already in the environment are not fetched again."""
+        monkeypatch.setenv('EPICOR_BASE_URL', 'https://epicor.example.com')
+        monkeypatch.setenv('HUBSPOT_API_KEY', 'token')
+        client = Mock()
+        client.get_secret.side_effect = lambda name: Mock(value=f"value-{name}")
+        monkeypatch.setattr(config, '_get_secret_client', lambda url: client)
+
+        assert config.load_secrets_from_cloud() is True
+
+        fetched = {c.args[0] for c in client.get_secret.call_args_list}
+        assert 'epicor-base-url' not in fetched
+        assert 'hubspot-api-key' not in fetched
+        assert len(fetched) == 6
+        assert config.os.environ['EPICOR_BASE_URL'] == 'https://epicor.example.com'
+
+    def test_resolved_key_vault_reference_skips_sdk(self, azure_env, monkeypatch):
+        """Test platform-resolved settings skip the Key Vault round trip."""
+        for env_key in config.SECRET_ENV_MAPPING.values():
+            monkeypatch.setenv(env_key, 'resolved')
+        get_client = Mock()
+        monkeypatch.setattr(config, '_get_secret_client', get_client)
+
+        assert config.load_secrets_from_cloud() is False
+
+        get_client.assert_not_called()
+
+
+class TestSalesRepMapping:
+    """Test sales rep to HubSpot owner mapping."""
+
+    @pytest.fixture
+    def make_settings(self):
+        """Build Settings pointing at a given mapping file."""
+        def _make(mapping_file):
+            return config.Settings(
+                epicor_base_url="https://test.epicor.com/ERP11TEST",
+                epicor_company="TEST",
+                epicor_username="user",
+                epicor_password="password",
+                epicor_api_key="key",
+                hubspot_api_key="token",
+                hubspot_quotes_pipeline_id="quotes",
+                hubspot_orders_pipeline_id="orders",
+                sales_rep_mapping_file=str(mapping_file),
+            )
+        return _make
+
+    def test_mapped_and_default_owner(self, make_settings, tmp_path):
+        """Test mapped reps resolve and unmapped reps fall back to the default."""
+        mapping_file = tmp_path / "sales_rep_mapping.json"
+        mapping_file.write_text(
+            '{"default_owner_id": "999", "mappings": {"REP001": "123"}}',
+            encoding="utf-8"
+        )
+        settings = make_settings(mapping_file)
+
+        assert settings.get_hubspot_owner("REP001") == "123"
+        assert settings.get_hubspot_owner("REP002") == "999"
+        assert settings.get_hubspot_owner(None) is None
+
+    def test_missing_mapping_file_unassigned(self, make_settings, tmp_path):
+        """Test a missing mapping file leaves deals unassigned."""
+        settings = make_settings(tmp_path / "missing.json")
+
+        assert settings.get_hubspot_owner("REP001") is None
+
+    def test_numeric_owner_ids_accepted(self, make_settings, tmp_path):
+        """Test numeric owner IDs in the mapping file are returned as strings."""
+        mapping_file = tmp_path / "sales_rep_mapping.json"
+        mapping_file.write_text(
+            '{"default_owner_id": 999, "mappings": {"REP001": 123}}',
+            encoding="utf-8"
+        )
+        settings = make_settings(mapping_file)
+
+        assert settings.get_hubspot_owner("REP001") == "123"
+        assert settings.get_hubspot_owner("REP002") == "999"
+
+    def test_non_object_mapping_file_unassigned(self, make_settings, tmp_path):
+        """Test a mapping file that is not an object leaves deals unassigned."""
+        mapping_file = tmp_path / "sales_rep_mapping.json"
+        mapping_file.write_text('["REP001"]', encoding="utf-8")
+        settings = make_settings(mapping_file)
+
+        assert settings.get_hubspot_owner("REP001") is None
+
+    def test_invalid_mapping_file_unassigned(self, make_settings, tmp_path):
+        """Test an unparseable mapping file leaves deals unassigned."""
+        mapping_file = tmp_path / "sales_rep_mapping.json"
+        mapping_file.write_text("{not json", encoding="utf-8")
+        settings = make_settings(mapping_file)
+
+        assert settings.get_hubspot_owner("REP001") is None
+
+
+class TestSettingsConstruct:
+    """Test building Settings without validation."""
+
+    @pytest.fixture
+    def settings_env(self, monkeypatch):
+        """Required settings in the environment."""
+        for name in config.Settings.model_fields:
+            monkeypatch.delenv(name.upper(), raising=False)
+        monkeypatch.setenv('EPICOR_BASE_URL', 'https://test.epicor.com/ERP11TEST/')
+        monkeypatch.setenv('EPICOR_COMPANY', 'TEST')
+        monkeypatch.setenv('EPICOR_USERNAME', 'user')
+        monkeypatch.setenv('EPICOR_PASSWORD', 'password')
+        monkeypatch.setenv('EPICOR_API_KEY', 'key')
+        monkeypatch.setenv('HUBSPOT_API_KEY', 'token')
+        monkeypatch.setenv('HUBSPOT_QUOTES_PIPELINE_ID', 'quotes')
+        monkeypatch.setenv('HUBSPOT_ORDERS_PIPELINE_ID', 'orders')
+
+    def test_matches_validated_settings(self, settings_env, monkeypatch):
+        """Test constructed settings coerce and normalize like validation does."""
+        monkeypatch.setenv('LOG_LEVEL', 'debug')
+        monkeypatch.setenv('SYNC_BATCH_SIZE', '50')
+        monkeypatch.setenv('SYNC_ORDERS', 'false')
+
+        constructed = config._construct_settings_from_env()
+        validated = config.Settings(_env_file=None)
+
+        assert constructed.model_dump() == validated.model_dump()
+        assert constructed.epicor_base_url == 'https://test.epicor.com/ERP11TEST'
+        assert constructed.sync_orders is False
+
+    def test_missing_required_field_validates(self, settings_env, monkeypatch):
+        """Test a missing required value still raises the validation error."""
+        monkeypatch.delenv('HUBSPOT_API_KEY')
+
+        with pytest.raises(ValidationError):
+            config._construct_settings_from_env()
+
+    def test_reload_reuses_instance_when_env_unchanged(self, settings_env, monkeypatch):
+        """Test force_reload only rebuilds settings when the environment changed."""
+        monkeypatch.setattr(config, '_settings', None)
+        monkeypatch.setattr(config, '_settings_env', None)
+        monkeypatch.setattr(config, '_settings_fields', None)
+
+        first = config.get_settings()
+        assert config.get_settings(force_reload=True) is first
+
+        monkeypatch.setenv('HUBSPOT_API_KEY', 'rotated')
+        reloaded = config.get_settings(force_reload=True)
+        assert reloaded is not first
+        assert reloaded.hubspot_api_key == 'rotated'
+
+    def test_reload_discards_mutated_instance(self, settings_env, monkeypatch):
+        """Test fields toggled on the cached instance do not survive a reload."""
+        monkeypatch.setattr(config, '_settings', None)
+        monkeypatch.setattr(config, '_settings_env', None)
+        monkeypatch.setattr(config, '_settings_fields', None)
+
+        config.get_settings().sync_customers = False
+
+        assert config.get_settings(force_reload=True).sync_customers is True
+
+    def test_pipeline_ids_cached_until_settings_rebuilt(self, settings_env, monkeypatch):
+        """Test pipeline IDs are cached and refreshed when settings change."""
+        monkeypatch.setattr(config, '_settings', None)
+        monkeypatch.setattr(config, '_settings_env', None)
+        monkeypatch.setattr(config, '_settings_fields', None)
+        config.Pipelines._reset()
+
+        config.get_settings()
+        assert config.Pipelines.get_quotes_pipeline_id() == 'quotes'
+
+        monkeypatch.setenv('HUBSPOT_QUOTES_PIPELINE_ID', 'new-quotes')
+        assert config.Pipelines.get_quotes_pipeline_id() == 'quotes'
+
+        config.get_settings(force_reload=True)
+        assert config.Pipelines.get_quotes_pipeline_id() == 'new-quotes'
+        config.Pipelines._reset()
+
+    def test_invalid_environment_rejected(self, settings_env, monkeypatch):
+        """Test values outside the allowed literals fail validation."""
+        monkeypatch.setenv('ENVIRONMENT', 'qa')
+
+        with pytest.raises(ValidationError):
+            config.Settings(_env_file=None)
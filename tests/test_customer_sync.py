@@ -14,7 +14,7 @@ class TestCustomerSync:
     def epicor_client(self):
         """Mock Epicor client."""
         client = Mock()
-        client.get_customers = Mock(return_value=[
+        client.iter_customer_pages = Mock(side_effect=lambda: iter([[
             {
                 'CustNum': 12345,
                 'Name': 'Test Company 1',
@@ -25,7 +25,7 @@ class TestCustomerSync:
                 'Name': 'Test Company 2',
                 'City': 'Vancouver'
             }
-        ])
+        ]]))
         return client
 
     @pytest.fixture
@@ -35,6 +35,19 @@ class TestCustomerSync:
         client.get_company_by_property = Mock(return_value=None)
         client.create_company = Mock(return_value={'id': '123'})
         client.update_company = Mock(return_value={'id': '123'})
+        client.get_companies_by_property = Mock(return_value={})
+        client.create_companies_batch = Mock(
+            side_effect=lambda inputs: [
+                {'id': str(i), 'properties': {
+                    'epicor_customer_number': str(properties['epicor_customer_number'])
+                }}
+                for i, properties in enumerate(inputs)
+            ]
+        )
+        client.update_companies_batch = Mock(
+            side_effect=lambda inputs: [{'id': update['id']} for update in inputs]
+        )
+        client.map_parallel = lambda fn, items, workers=16: [fn(item) for item in items]
         return client
 
     @pytest.fixture
@@ -47,7 +60,7 @@ class TestCustomerSync:
         result = customer_sync.sync_all_customers()
 
         # Verify it fetched customers from Epicor
-        epicor_client.get_customers.assert_called_once()
+        epicor_client.iter_customer_pages.assert_called_once()
 
         # Verify summary
         assert result['success'] == True
@@ -58,7 +71,10 @@ class TestCustomerSync:
     def test_sync_all_customers_updates_existing(self, customer_sync, epicor_client, hubspot_client):
         """Test syncing customers that exist in HubSpot."""
         # Mock existing companies
-        hubspot_client.get_company_by_property = Mock(return_value={'id': '123'})
+        hubspot_client.get_companies_by_property = Mock(return_value={
+            '12345': {'id': '123'},
+            '67890': {'id': '456'}
+        })
 
         result = customer_sync.sync_all_customers()
 
@@ -68,9 +84,77 @@ class TestCustomerSync:
         assert result['created'] == 0
         assert result['updated'] == 2
 
+    def test_sync_all_customers_batches_hubspot_calls(self, customer_sync, hubspot_client):
+        """Test existing companies are looked up and written in batches."""
+        hubspot_client.get_companies_by_property = Mock(return_value={
+            '12345': {'id': '123'}
+        })
+
+        result = customer_sync.sync_all_customers()
+
+        hubspot_client.get_companies_by_property.assert_called_once_with(
+            'epicor_customer_number', [12345, 67890]
+        )
+        hubspot_client.get_company_by_property.assert_not_called()
+        hubspot_client.update_companies_batch.assert_called_once()
+        hubspot_client.create_companies_batch.assert_called_once()
+        assert result['created'] == 1
+        assert result['updated'] == 1
+
+    def test_sync_all_customers_batch_failure_recorded(self, customer_sync, hubspot_client):
+        """Test a failed batch create marks each customer in it as an error."""
+        hubspot_client.create_companies_batch = Mock(side_effect=Exception("HubSpot down"))
+
+        result = customer_sync.sync_all_customers()
+
+        assert result['success'] == True
+        assert result['created'] == 0
+        assert result['errors'] == 2
+
+    def test_sync_all_customers_partial_batch_recorded(self, customer_sync, hubspot_client):
+        """Test customers missing from a partial batch response are recorded individually."""
+        hubspot_client.create_companies_batch = Mock(return_value=[
+            {'id': '1', 'properties': {'epicor_customer_number': '67890'}}
+        ])
+
+        result = customer_sync.sync_all_customers()
+
+        assert result['created'] == 1
+        assert result['errors'] == 1
+        assert [error.identifier for error in customer_sync.error_tracker.errors] == [12345]
+
+    def test_sync_all_customers_empty(self, customer_sync, epicor_client, hubspot_client):
+        """Test no HubSpot calls are made when Epicor returns no customers."""
+        epicor_client.iter_customer_pages = Mock(return_value=iter([]))
+
+        result = customer_sync.sync_all_customers()
+
+        assert result['success'] == True
+        assert result['total'] == 0
+        hubspot_client.get_companies_by_property.assert_not_called()
+
+    def test_sync_all_customers_streams_pages(self, customer_sync, epicor_client, hubspot_client):
+        """Test each Epicor page is looked up and written on its own."""
+        epicor_client.iter_customer_pages = Mock(return_value=iter([
+            [{'CustNum': 1, 'Name': 'A'}, {'CustNum': 2, 'Name': 'B'}],
+            [{'CustNum': 3, 'Name': 'C'}]
+        ]))
+
+        result = customer_sync.sync_all_customers()
+
+        assert [c.args[1] for c in hubspot_client.get_companies_by_property.call_args_list] == [
+            [1, 2], [3]
+        ]
+        assert result['total'] == 3
+        assert result['created'] == 3
+
     def test_sync_all_customers_handles_error(self, customer_sync, epicor_client):
         """Test error handling when fetch fails."""
-        epicor_client.get_customers = Mock(side_effect=Exception("API Error"))
+        def failing_pages():
+            raise Exception("API Error")
+            yield
+
+        epicor_client.iter_customer_pages = Mock(return_value=failing_pages())
 
         result = customer_sync.sync_all_customers()
 
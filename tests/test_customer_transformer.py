@@ -98,3 +98,14 @@ class TestCustomerTransformer:
 
         result = transformer.transform(customer)
         assert result['phone'] == '+14165551234'
+
+    def test_phone_formatting_keeps_country_code(self, transformer):
+        """Test a leading + is kept and only digits survive after it."""
+        customer = {
+            'CustNum': 12345,
+            'Name': 'Test',
+            'PhoneNum': '+44 (20) 7946-0958 ext.'
+        }
+
+        result = transformer.transform(customer)
+        assert result['phone'] == '+442079460958'
@@ -0,0 +1,49 @@
+"""
+Test Epicor client paging.
+"""
+
+import pytest
+from unittest.mock import Mock
+from src.clients.epicor_client import EpicorClient
+from src.utils.error_handler import EpicorAPIError
+
+
+class TestIterPages:
+    """Test paged OData fetches."""
+
+    @pytest.fixture
+    def client(self):
+        """Create Epicor client with a mocked session."""
+        client = EpicorClient(
+            base_url='https://epicor.example.com/ERP11',
+            company='PLPC',
+            username='user',
+            password='pass',
+            api_key='key',
+            batch_size=2
+        )
+        client.session = Mock()
+        return client
+
+    @staticmethod
+    def _response(content):
+        """Build a successful response with the given raw body."""
+        return Mock(ok=True, status_code=200, content=content)
+
+    def test_parses_raw_content(self, client):
+        """Test pages are parsed from the raw response bytes until a short page."""
+        client.session.get = Mock(side_effect=[
+            self._response(b'{"value": [{"QuoteNum": 1}, {"QuoteNum": 2}]}'),
+            self._response(b'{"value": [{"QuoteNum": 3}]}')
+        ])
+
+        pages = list(client._iter_pages('https://epicor.example.com/ERP11/api/Quotes'))
+
+        assert pages == [[{'QuoteNum': 1}, {'QuoteNum': 2}], [{'QuoteNum': 3}]]
+
+    def test_invalid_json_raises_api_error(self, client):
+        """Test a non-JSON body is reported as an EpicorAPIError."""
+        client.session.get = Mock(return_value=self._response(b'<html>Bad gateway</html>'))
+
+        with pytest.raises(EpicorAPIError):
+            list(client._iter_pages('https://epicor.example.com/ERP11/api/Quotes'))
@@ -0,0 +1,84 @@
+"""
+Test error handling utilities.
+"""
+
+import csv
+from decimal import Decimal
+from src.utils.error_handler import ErrorTracker, FailedRecordTracker
+
+
+class TestFailedRecordTracker:
+    """Test buffered failed record CSV output."""
+
+    def test_records_buffered_until_flush(self, tmp_path):
+        """Test nothing is written until flush, then all rows in one file."""
+        output_file = tmp_path / "failed.csv"
+        tracker = FailedRecordTracker(str(output_file))
+
+        tracker.add_failed_record('customer', 1, 'create', 'boom')
+        tracker.add_failed_record('customer', 2, 'update', 'bang')
+        assert not output_file.exists()
+        assert tracker.has_failures()
+
+        tracker.flush()
+
+        with open(output_file, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        assert [row['entity_id'] for row in rows] == ['1', '2']
+
+    def test_flush_appends_without_duplicating(self, tmp_path):
+        """Test repeated flushes append new rows only and write one header."""
+        output_file = tmp_path / "failed.csv"
+        tracker = FailedRecordTracker(str(output_file))
+
+        tracker.add_failed_record('quote', 10, 'create', 'boom')
+        tracker.flush()
+        tracker.add_failed_record('quote', 11, 'create', 'boom')
+        tracker.close()
+        tracker.close()
+
+        with open(output_file, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        assert [row['entity_id'] for row in rows] == ['10', '11']
+        assert tracker.get_summary()['total_failures'] == 2
+
+    def test_source_data_serialized_as_json(self, tmp_path):
+        """Test source_data is written as JSON, with non-JSON values stringified."""
+        tracker = FailedRecordTracker(str(tmp_path / "failed.csv"))
+
+        tracker.add_failed_record(
+            'order', 5, 'create', 'boom',
+            source_data={'OrderNum': 5, 'DocOrderAmt': Decimal('12.50')}
+        )
+
+        assert tracker.failed_records[0]['source_data'] == '{"OrderNum":5,"DocOrderAmt":"12.50"}'
+
+
+class TestErrorTracker:
+    """Test error and warning tracking."""
+
+    def test_summary_uses_dict_entries(self):
+        """Test errors are reported as type/id/message dicts."""
+        tracker = ErrorTracker()
+        tracker.add_error('customer', 123, 'Failed to sync')
+        tracker.add_warning('quote', 456, 'Missing field')
+
+        summary = tracker.get_summary()
+
+        assert summary['error_count'] == 1
+        assert summary['errors'] == [{'type': 'customer', 'id': 123, 'message': 'Failed to sync'}]
+        assert summary['warnings'] == [{'type': 'quote', 'id': 456, 'message': 'Missing field'}]
+
+    def test_retained_entries_are_bounded(self, monkeypatch):
+        """Test only the newest MAX_ENTRIES are kept while every error is counted."""
+        monkeypatch.setattr(ErrorTracker, 'MAX_ENTRIES', 2)
+        tracker = ErrorTracker()
+
+        for order_num in range(5):
+            tracker.add_error('order', order_num, 'boom')
+
+        assert tracker.error_count == 5
+        assert [error['id'] for error in tracker.error_details()] == [3, 4]
+
+        tracker.clear()
+        assert not tracker.has_errors()
@@ -0,0 +1,520 @@
+"""
+Test HubSpot client batch helpers.
+"""
+
+import json
+import socket
+
+import pytest
+from unittest.mock import Mock
+from src.clients.hubspot_client import HubSpotClient
+from src.utils.error_handler import HubSpotAPIError
+
+
+def _response(data):
+    """Build a mock response with a JSON body."""
+    response = Mock()
+    response.content = json.dumps(data).encode('utf-8')
+    response.json = Mock(return_value=data)
+    return response
+
+
+class TestSearchObjectsBatch:
+    """Test IN-filter batch search."""
+
+    @pytest.fixture
+    def client(self):
+        """HubSpot client with _raw_request mocked out."""
+        client = HubSpotClient(api_key="test_key")
+        client._raw_request = Mock()
+        return client
+
+    def test_single_in_filter_request(self, client):
+        """Test that values are searched with one IN filter and mapped by value."""
+        client._raw_request.return_value = {
+            'results': [
+                {'id': '1', 'properties': {'epicor_line_item_id': 'Q1-1'}},
+                {'id': '2', 'properties': {'epicor_line_item_id': 'Q1-2'}}
+            ]
+        }
+
+        result = client.search_objects_batch(
+            'line_items', 'epicor_line_item_id', ['Q1-1', 'Q1-2', 'Q1-3']
+        )
+
+        assert set(result) == {'Q1-1', 'Q1-2'}
+        assert result['Q1-2']['id'] == '2'
+        client._raw_request.assert_called_once()
+        payload = client._raw_request.call_args.args[2]
+        filter_ = payload['filterGroups'][0]['filters'][0]
+        assert filter_['operator'] == 'IN'
+        assert filter_['values'] == ['q1-1', 'q1-2', 'q1-3']
+        assert 'epicor_line_item_id' in payload['properties']
+
+    def test_chunks_and_paginates(self, client):
+        """Test that >100 values are chunked and paging.next.after is followed."""
+        client._raw_request.side_effect = [
+            {
+                'results': [{'id': '1', 'properties': {'hs_sku': '0'}}],
+                'paging': {'next': {'after': '100'}}
+            },
+            {'results': [{'id': '2', 'properties': {'hs_sku': '99'}}]},
+            {'results': [{'id': '3', 'properties': {'hs_sku': '100'}}]}
+        ]
+
+        result = client.search_objects_batch('products', 'hs_sku', list(range(101)))
+
+        assert set(result) == {'0', '99', '100'}
+        assert client._raw_request.call_count == 3
+        second_payload = client._raw_request.call_args_list[1].args[2]
+        assert second_payload['after'] == '100'
+
+    def test_mixed_case_values_matched_case_insensitively(self, client):
+        """Test string values are sent lowercase and escaped, and mapped back as requested."""
+        client._raw_request.return_value = {
+            'results': [
+                {'id': '1', 'properties': {'hs_sku': 'ABC-1'}},
+                {'id': '2', 'properties': {'hs_sku': '12" Pipe'}}
+            ]
+        }
+
+        result = client.search_objects_batch('products', 'hs_sku', ['AbC-1', '12" Pipe', 'XYZ'])
+
+        assert result == {
+            'AbC-1': {'id': '1', 'properties': {'hs_sku': 'ABC-1'}},
+            '12" Pipe': {'id': '2', 'properties': {'hs_sku': '12" Pipe'}}
+        }
+        filter_ = client._raw_request.call_args.args[2]['filterGroups'][0]['filters'][0]
+        assert filter_['values'] == ['abc-1', '12\\" pipe', 'xyz']
+
+    def test_empty_values_skip_request(self, client):
+        """Test that no request is made for an empty value list."""
+        assert client.search_objects_batch('deals', 'dealname', []) == {}
+        client._raw_request.assert_not_called()
+
+
+class TestBatchReadObjects:
+    """Test batch read by ID."""
+
+    def test_batch_read_payload(self):
+        """Test batch read inputs, properties and idProperty."""
+        client = HubSpotClient(api_key="test_key")
+        client._raw_request = Mock(return_value={
+            'results': [{'id': '10'}, {'id': '11'}]
+        })
+
+        results = client.batch_read_objects(
+            'deals', ['10', '11', '10'], properties=['dealstage'], id_property='epicor_quote_number'
+        )
+
+        assert [r['id'] for r in results] == ['10', '11']
+        payload = client._raw_request.call_args.args[2]
+        assert payload['inputs'] == [{'id': '10'}, {'id': '11'}]
+        assert payload['properties'] == ['dealstage']
+        assert payload['idProperty'] == 'epicor_quote_number'
+
+
+class TestBatchWrites:
+    """Test batch create/update and batch associations."""
+
+    @pytest.fixture
+    def client(self):
+        """HubSpot client with _make_request mocked out."""
+        client = HubSpotClient(api_key="test_key")
+        client._make_request = Mock()
+        return client
+
+    def test_create_objects_batch_chunks_inputs(self, client):
+        """Test that creates are chunked at BATCH_SIZE and results concatenated."""
+        client._make_request.side_effect = [
+            _response({'results': [{'id': str(i)} for i in range(100)]}),
+            _response({'results': [{'id': '100'}]})
+        ]
+
+        results = client.create_objects_batch('line_items', [{'name': str(i)} for i in range(101)])
+
+        assert len(results) == 101
+        assert client._make_request.call_count == 2
+        url = client._make_request.call_args_list[0].args[1]
+        assert url.endswith('/crm/v3/objects/line_items/batch/create')
+        last_payload = client._make_request.call_args_list[1].kwargs['json']
+        assert last_payload == {'inputs': [{'properties': {'name': '100'}}]}
+
+    def test_partial_batch_failure_returns_successes(self, client, caplog):
+        """Test a 207 response returns the successful records and logs the failures."""
+        client._make_request.return_value = _response({
+            'status': 'COMPLETE',
+            'results': [{'id': '1'}],
+            'errors': [{'status': 'error', 'message': 'Property values were not valid'}]
+        })
+
+        with caplog.at_level('WARNING'):
+            results = client.create_objects_batch('line_items', [{'name': 'A'}, {'name': 'B'}])
+
+        assert results == [{'id': '1'}]
+        assert 'had 1 failed records' in caplog.text
+
+    def test_update_objects_batch_payload(self, client):
+        """Test batch update input shape."""
+        client._make_request.return_value = _response({'results': [{'id': '5'}]})
+
+        client.update_objects_batch('deals', [{'id': 5, 'properties': {'amount': '10'}}])
+
+        payload = client._make_request.call_args.kwargs['json']
+        assert payload == {'inputs': [{'id': '5', 'properties': {'amount': '10'}}]}
+
+    def test_associate_line_items_to_deal(self, client):
+        """Test batch association uses the v3 type name."""
+        client._association_type_cache['line_items:deals:default'] = 19
+        client._make_request.return_value = _response({})
+
+        status = client.associate_line_items_to_deal(['1', '2'], 'deal-9')
+
+        assert status == {'1': True, '2': True}
+        url = client._make_request.call_args.args[1]
+        assert url.endswith('/crm/v3/associations/line_items/deals/batch/create')
+        payload = client._make_request.call_args.kwargs['json']
+        assert payload['inputs'][1] == {
+            'from': {'id': '2'}, 'to': {'id': 'deal-9'}, 'type': 'line_item_to_deal'
+        }
+
+    def test_association_partial_failure(self, client):
+        """Test a 207 with errors marks inputs missing from results as failed."""
+        client._make_request.return_value = _response({
+            'status': 'COMPLETE',
+            'results': [{'from': {'id': '1'}, 'to': {'id': 'deal-9'}, 'type': 'line_item_to_deal'}],
+            'errors': [{'status': 'error', 'message': 'Object 2 not found'}]
+        })
+
+        status = client.create_associations_batch('line_items', 'deals', [('1', 'deal-9'), ('2', 'deal-9')], 19)
+
+        assert status == {'1': True, '2': False}
+
+
+class TestSessionPool:
+    """Test connection pool configuration."""
+
+    def test_adapter_pool_and_socket_options(self):
+        """Test the mounted adapter uses a single sized pool with TCP_NODELAY."""
+        client = HubSpotClient(api_key="test_key")
+        adapter = client.session.get_adapter("https://api.hubapi.com")
+
+        assert adapter._pool_maxsize == HubSpotClient.POOL_MAXSIZE
+        assert adapter._pool_connections == 1
+        socket_options = adapter.poolmanager.connection_pool_kw['socket_options']
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in socket_options
+        assert client.session.headers['Connection'] == 'keep-alive'
+
+
+    def test_warmup_opens_connection_in_background(self, monkeypatch):
+        """Test warmup issues one HEAD and unblocks requests when done."""
+        head = Mock()
+        monkeypatch.setattr('requests.Session.head', head)
+
+        client = HubSpotClient(api_key="test_key", warmup=True)
+
+        assert client._warmed.wait(timeout=1)
+        head.assert_called_once()
+        assert head.call_args.args[0].endswith('/crm/v3/objects/companies?limit=1')
+
+
+class TestRateLimit:
+    """Test token bucket rate limiter."""
+
+    def test_burst_does_not_sleep(self, monkeypatch):
+        """Test that requests within bucket capacity proceed without sleeping."""
+        sleep = Mock()
+        monkeypatch.setattr('src.clients.hubspot_client.time.sleep', sleep)
+        client = HubSpotClient(api_key="test_key", rate_limit_capacity=5)
+
+        for _ in range(5):
+            client._rate_limit()
+
+        sleep.assert_not_called()
+
+    def test_empty_bucket_sleeps_for_refill(self, monkeypatch):
+        """Test that an empty bucket sleeps long enough for one token."""
+        sleep = Mock()
+        monkeypatch.setattr('src.clients.hubspot_client.time.sleep', sleep)
+        monkeypatch.setattr('src.clients.hubspot_client.time.monotonic', lambda: 100.0)
+        client = HubSpotClient(api_key="test_key", rate_limit_capacity=1, rate_limit_per_second=10.0)
+
+        client._rate_limit()
+        client._rate_limit()
+
+        sleep.assert_called_once()
+        assert sleep.call_args.args[0] == pytest.approx(0.1)
+
+    def test_429_drains_bucket(self, monkeypatch):
+        """Test a 429 response empties the bucket and delays the next request."""
+        sleep = Mock()
+        monkeypatch.setattr('src.clients.hubspot_client.time.sleep', sleep)
+        monkeypatch.setattr('src.clients.hubspot_client.time.monotonic', lambda: 100.0)
+        client = HubSpotClient(api_key="test_key")
+
+        client._drain_rate_limit('2')
+        client._rate_limit()
+
+        assert sleep.call_args.args[0] == pytest.approx(2.1)
+
+
+class TestMapParallel:
+    """Test concurrent call helper."""
+
+    def test_preserves_order(self):
+        """Test results come back in input order."""
+        client = HubSpotClient(api_key="test_key")
+
+        assert client.map_parallel(lambda x: x * 2, range(20), workers=4) == [x * 2 for x in range(20)]
+
+    def test_reraises_errors(self):
+        """Test the first exception is propagated."""
+        client = HubSpotClient(api_key="test_key")
+
+        def fail(x):
+            raise ValueError(x)
+
+        with pytest.raises(ValueError):
+            client.map_parallel(fail, [1, 2])
+
+
+class TestLookupCache:
+    """Test property lookup caching."""
+
+    @pytest.fixture
+    def client(self):
+        """HubSpot client with _find_first mocked out."""
+        client = HubSpotClient(api_key="test_key")
+        client._find_first = Mock(return_value={'id': 'c1'})
+        client._make_request = Mock(return_value=_response({'id': 'new'}))
+        return client
+
+    def test_repeated_lookup_hits_cache(self, client):
+        """Test the same lookup only searches once."""
+        first = client.get_company_by_property('epicor_customer_number', 42)
+        second = client.get_company_by_property('epicor_customer_number', '42')
+
+        assert first == second == {'id': 'c1'}
+        client._find_first.assert_called_once()
+
+    def test_not_found_cleared_by_create(self, client):
+        """Test a cached miss is dropped once an object of that type is created."""
+        client._find_first.return_value = None
+        assert client.get_deal_by_property('epicor_quote_number', 1) is None
+        assert client.get_deal_by_property('epicor_quote_number', 1) is None
+        assert client._find_first.call_count == 1
+
+        client.create_deal({'dealname': 'Quote 1'})
+        client.get_deal_by_property('epicor_quote_number', 1)
+
+        assert client._find_first.call_count == 2
+
+    def test_create_keeps_cached_hits(self, client):
+        """Test creating an object leaves lookups that found other objects cached."""
+        client.get_deal_by_property('epicor_order_number', 5001)
+        client.create_deal({'dealname': 'Quote 1'})
+        client.get_deal_by_property('epicor_order_number', 5001)
+
+        assert client._find_first.call_count == 1
+
+    def test_update_drops_cached_object(self, client):
+        """Test updating an object invalidates lookups that returned it."""
+        client.get_company_by_property('epicor_customer_number', 42)
+        client.update_company('c1', {'name': 'New'})
+        client.get_company_by_property('epicor_customer_number', 42)
+
+        assert client._find_first.call_count == 2
+
+    def test_batch_lookup_seeds_single_lookups(self, client):
+        """Test plural lookups search uncached values once and feed single lookups."""
+        client.search_objects_batch = Mock(return_value={'42': {'id': 'c1'}})
+
+        found = client.get_companies_by_property('epicor_customer_number', [42, 43])
+
+        assert found == {'42': {'id': 'c1'}}
+        assert client.get_company_by_property('epicor_customer_number', 42) == {'id': 'c1'}
+        assert client.get_company_by_property('epicor_customer_number', 43) is None
+        client._find_first.assert_not_called()
+
+        client.get_companies_by_property('epicor_customer_number', [42, 43])
+        client.search_objects_batch.assert_called_once()
+
+
+class TestRequestSerialization:
+    """Test JSON request/response handling."""
+
+    def test_json_body_sent_as_bytes_and_parsed(self):
+        """Test json= payloads are serialized to data= and responses parsed from content."""
+        client = HubSpotClient(api_key="test_key")
+        response = _response({'results': [{'id': '1'}]})
+        response.ok = True
+        client.session.request = Mock(return_value=response)
+
+        results = client.search_objects('deals', [{'filters': []}])
+
+        assert results == [{'id': '1'}]
+        kwargs = client.session.request.call_args.kwargs
+        assert 'json' not in kwargs
+        assert json.loads(kwargs['data']) == {'filterGroups': [{'filters': []}], 'limit': 100}
+        assert kwargs['headers'] == {'Content-Type': 'application/json'}
+
+    def test_get_has_no_content_type(self):
+        """Test bodiless requests don't send Content-Type."""
+        client = HubSpotClient(api_key="test_key")
+        response = _response({'results': []})
+        response.ok = True
+        client.session.request = Mock(return_value=response)
+
+        client._make_request('GET', 'https://api.hubapi.com/crm/v3/objects/companies?limit=1')
+
+        assert 'headers' not in client.session.request.call_args.kwargs
+        assert 'Content-Type' not in client.session.headers
+
+
+    def test_non_json_error_body_is_truncated(self):
+        """Test HTML error pages raise HubSpotAPIError with a capped body."""
+        client = HubSpotClient(api_key="test_key")
+        response = Mock(
+            ok=False, status_code=502,
+            headers={'Content-Type': 'text/html'},
+            content=b'<html>' + b'x' * 5000
+        )
+        response.text = response.content.decode()
+        client.session.request = Mock(return_value=response)
+
+        with pytest.raises(HubSpotAPIError) as exc_info:
+            client._make_request('GET', 'https://api.hubapi.com/crm/v3/objects/deals')
+
+        assert exc_info.value.status_code == 502
+        assert exc_info.value.response.startswith('<html>')
+        assert len(exc_info.value.response) == HubSpotClient.MAX_ERROR_TEXT
+
+    def test_json_error_body_is_parsed(self):
+        """Test JSON error bodies are parsed for the exception detail."""
+        client = HubSpotClient(api_key="test_key")
+        response = _response({'message': 'Property does not exist'})
+        response.ok = False
+        response.status_code = 400
+        response.headers = {'Content-Type': 'application/json;charset=utf-8'}
+        client.session.request = Mock(return_value=response)
+
+        with pytest.raises(HubSpotAPIError) as exc_info:
+            client._make_request('GET', 'https://api.hubapi.com/crm/v3/objects/deals')
+
+        assert 'Property does not exist' in exc_info.value.response
+
+
+class TestUrls:
+    """Test precomputed endpoint URLs."""
+
+    def test_known_and_unknown_object_urls(self):
+        """Test known types use the precomputed URL and others are built on demand."""
+        client = HubSpotClient(api_key="test_key")
+
+        assert client._search_url('deals') == 'https://api.hubapi.com/crm/v3/objects/deals/search'
+        assert client._object_url('tickets') == 'https://api.hubapi.com/crm/v3/objects/tickets'
+        assert client._search_url('tickets') == 'https://api.hubapi.com/crm/v3/objects/tickets/search'
+
+
+class TestRequestCache:
+    """Test request-level response cache."""
+
+    @pytest.fixture
+    def client(self):
+        """HubSpot client with a mocked session."""
+        client = HubSpotClient(api_key="test_key")
+        response = _response({'results': [{'id': '1'}]})
+        response.ok = True
+        response.status_code = 200
+        client.session.request = Mock(return_value=response)
+        return client
+
+    def test_repeated_search_served_from_cache(self, client):
+        """Test identical searches inside a scope hit HubSpot once."""
+        with client.cache_scope():
+            client.search_objects('deals', [{'filters': []}])
+            client.search_objects('deals', [{'filters': []}])
+
+        assert client.session.request.call_count == 1
+
+    def test_no_caching_outside_scope(self, client):
+        """Test requests are not cached without cache_scope."""
+        client.search_objects('deals', [{'filters': []}])
+        client.search_objects('deals', [{'filters': []}])
+
+        assert client.session.request.call_count == 2
+
+    def test_write_invalidates_type(self, client):
+        """Test a create drops cached reads for that object type and is never cached."""
+        with client.cache_scope():
+            client.search_objects('deals', [{'filters': []}])
+            client.create_deal({'dealname': 'A'})
+            client.search_objects('deals', [{'filters': []}])
+
+        assert client.session.request.call_count == 3
+
+
+class TestRawRequest:
+    """Test the urllib3 hot path."""
+
+    @pytest.fixture
+    def client(self):
+        """HubSpot client with a mocked urllib3 pool."""
+        client = HubSpotClient(api_key="test_key")
+        client.http = Mock()
+        return client
+
+    def test_posts_json_and_parses(self, client):
+        """Test body is serialized, path is relative and response is parsed."""
+        client.http.urlopen.return_value = Mock(status=200, headers={}, data=b'{"results": []}')
+
+        data = client._raw_request('POST', 'https://api.hubapi.com/crm/v3/objects/deals/search', {'limit': 1})
+
+        assert data == {'results': []}
+        args, kwargs = client.http.urlopen.call_args
+        assert args == ('POST', '/crm/v3/objects/deals/search')
+        assert json.loads(kwargs['body']) == {'limit': 1}
+        assert kwargs['headers']['Content-Type'] == 'application/json'
+
+    def test_error_status_raises(self, client):
+        """Test non-2xx responses raise HubSpotAPIError."""
+        client.http.urlopen.return_value = Mock(
+            status=400, headers={'Content-Type': 'application/json'}, data=b'{"message": "bad filter"}'
+        )
+
+        with pytest.raises(HubSpotAPIError) as exc_info:
+            client._raw_request('POST', 'https://api.hubapi.com/crm/v3/objects/deals/search', {})
+
+        assert exc_info.value.status_code == 400
+        assert 'bad filter' in exc_info.value.response
+
+
+class TestIterSearch:
+    """Test lazy paginated search."""
+
+    def test_pages_fetched_on_demand(self):
+        """Test the next page is only requested when iteration continues."""
+        client = HubSpotClient(api_key="test_key")
+        client._make_request = Mock(side_effect=[
+            _response({'results': [{'id': '1'}, {'id': '2'}], 'paging': {'next': {'after': '2'}}}),
+            _response({'results': [{'id': '3'}]})
+        ])
+
+        results = client.iter_search('deals', [{'filters': []}], limit=2)
+        assert next(results)['id'] == '1'
+        assert client._make_request.call_count == 1
+
+        assert [r['id'] for r in results] == ['2', '3']
+        assert client._make_request.call_count == 2
+        assert client._make_request.call_args.kwargs['json']['after'] == '2'
+
+    def test_single_lookup_uses_limit_one(self):
+        """Test get_*_by_property requests a single result and stops."""
+        client = HubSpotClient(api_key="test_key")
+        client._make_request = Mock(return_value=_response({
+            'results': [{'id': 'd1'}], 'paging': {'next': {'after': '1'}}
+        }))
+
+        assert client.get_deal_by_property('epicor_quote_number', 7) == {'id': 'd1'}
+        client._make_request.assert_called_once()
+        assert client._make_request.call_args.kwargs['json']['limit'] == 1
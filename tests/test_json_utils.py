@@ -0,0 +1,51 @@
+"""
+Test JSON helpers (orjson and standard library backends).
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from src.utils import json_utils
+
+
+@pytest.fixture(params=['orjson', 'stdlib'])
+def backend(request, monkeypatch):
+    """Run each test with orjson (when installed) and the stdlib fallback."""
+    if request.param == 'stdlib':
+        monkeypatch.setattr(json_utils, 'orjson', None)
+    elif json_utils.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+class TestDumps:
+    """Test serialization options."""
+
+    def test_compact_round_trip(self, backend):
+        """Test compact output parses back to the same object."""
+        data = {'b': [1, 2], 'a': 'x'}
+
+        encoded = json_utils.dumps(data, sort_keys=True)
+
+        assert encoded == b'{"a":"x","b":[1,2]}'
+        assert json_utils.loads(encoded) == data
+
+    def test_non_str_keys_and_default(self, backend):
+        """Test int keys become strings and unknown types go through default."""
+        encoded = json_utils.dumps({1: {2, 3}}, default=sorted)
+
+        assert json.loads(encoded) == {'1': [2, 3]}
+
+    def test_indent(self, backend):
+        """Test pretty-printed output uses two-space indentation."""
+        encoded = json_utils.dumps({'a': 1}, indent=True)
+
+        assert encoded == b'{\n  "a": 1\n}'
+
+    def test_datetime_serialized(self, backend):
+        """Test datetimes serialize (natively with orjson, via default otherwise)."""
+        encoded = json_utils.dumps({'t': datetime(2024, 1, 1)}, default=str)
+
+        assert json.loads(encoded)['t'].startswith('2024-01-01')
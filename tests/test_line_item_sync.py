@@ -0,0 +1,211 @@
+"""
+Test line item sync module.
+"""
+
+import pytest
+from unittest.mock import Mock
+import src.sync.line_item_sync as line_item_sync_module
+from src.sync.line_item_sync import LineItemSync
+
+
+@pytest.fixture(autouse=True)
+def empty_product_cache(monkeypatch):
+    """Give each test its own empty process-wide product cache."""
+    monkeypatch.setattr(line_item_sync_module, '_PRODUCT_CACHE', {})
+
+
+class TestFlushLineItems:
+    """Test batched line item writes."""
+
+    @pytest.fixture
+    def hubspot_client(self):
+        """Mock HubSpot client."""
+        client = Mock()
+        client.associate_line_items_to_deal = Mock(
+            side_effect=lambda ids, deal_id: {line_item_id: True for line_item_id in ids}
+        )
+        client.map_parallel = lambda fn, items, workers=16: [fn(item) for item in items]
+        return client
+
+    @pytest.fixture
+    def line_item_sync(self, hubspot_client):
+        """Create line item sync instance with mocked client."""
+        return LineItemSync(hubspot_client)
+
+    def test_partial_update_failure_tracked(self, line_item_sync, hubspot_client):
+        """Test line items missing from a batch update response are recorded as errors."""
+        hubspot_client.update_line_items_batch = Mock(return_value=[{'id': '1'}])
+
+        created, updated = line_item_sync._flush_line_items(
+            'deal-1', [], [({'line': 1}, '1', {}), ({'line': 2}, '2', {})]
+        )
+
+        assert (created, updated) == (0, 1)
+        assert len(line_item_sync.error_tracker.errors) == 1
+
+    def test_partial_create_failure_tracked(self, line_item_sync, hubspot_client):
+        """Test each line missing from a short batch create response is recorded."""
+        hubspot_client.create_line_items_batch = Mock(return_value=[
+            {'id': '10', 'properties': {'epicor_line_item_id': 'Q1001-2'}}
+        ])
+
+        created, updated = line_item_sync._flush_line_items(
+            'deal-1',
+            [
+                ({'QuoteNum': 1001, 'QuoteLine': 1}, {'epicor_line_item_id': 'Q1001-1'}),
+                ({'QuoteNum': 1001, 'QuoteLine': 2}, {'epicor_line_item_id': 'Q1001-2'})
+            ],
+            []
+        )
+
+        assert (created, updated) == (1, 0)
+        hubspot_client.associate_line_items_to_deal.assert_called_once_with(['10'], 'deal-1')
+        assert [error.identifier for error in line_item_sync.error_tracker.errors] == ['Q1001-1']
+
+    def test_create_failure_does_not_affect_update(self, line_item_sync, hubspot_client):
+        """Test a failed create batch leaves the concurrent update batch counted."""
+        hubspot_client.update_line_items_batch = Mock(return_value=[{'id': '1'}])
+        hubspot_client.create_line_items_batch = Mock(side_effect=Exception("HubSpot down"))
+
+        created, updated = line_item_sync._flush_line_items(
+            'deal-1', [({'line': 2}, {})], [({'line': 1}, '1', {})]
+        )
+
+        assert (created, updated) == (0, 1)
+        hubspot_client.associate_line_items_to_deal.assert_not_called()
+        assert len(line_item_sync.error_tracker.errors) == 1
+
+
+class TestEnsureProductsExist:
+    """Test batched product existence checks."""
+
+    @pytest.fixture
+    def hubspot_client(self):
+        """Mock HubSpot client with one existing product."""
+        client = Mock()
+        client.get_products_by_skus = Mock(return_value={'SKU-1': {'id': 'p1'}})
+        client.create_products_batch = Mock(side_effect=lambda inputs: [
+            {'id': f"new-{properties['hs_sku']}", 'properties': {'hs_sku': properties['hs_sku']}}
+            for properties in inputs
+        ])
+        return client
+
+    @pytest.fixture
+    def line_item_sync(self, hubspot_client):
+        """Create line item sync instance with mocked client."""
+        return LineItemSync(hubspot_client)
+
+    def test_lookup_and_create_batched(self, line_item_sync, hubspot_client):
+        """Test one lookup and one create cover every uncached SKU."""
+        created, errors = line_item_sync.ensure_products_exist([
+            ('SKU-1', 'Existing', 10.0, None),
+            ('SKU-2', 'Missing', 5.0, 2.0),
+            ('SKU-3', None, None, None)
+        ])
+
+        assert (created, errors) == (2, {})
+        hubspot_client.get_products_by_skus.assert_called_once_with(['SKU-1', 'SKU-2', 'SKU-3'])
+        hubspot_client.update_products_batch.assert_called_once()
+        assert line_item_sync.product_cache == {
+            'SKU-1': 'p1', 'SKU-2': 'new-SKU-2', 'SKU-3': 'new-SKU-3'
+        }
+
+    def test_cached_skus_skipped(self, line_item_sync, hubspot_client):
+        """Test SKUs already in the cache are not looked up again."""
+        line_item_sync.product_cache['SKU-1'] = 'p1'
+
+        assert line_item_sync.ensure_product_exists('SKU-1') is False
+        hubspot_client.get_products_by_skus.assert_not_called()
+
+    def test_create_failure_reported_per_sku(self, line_item_sync, hubspot_client):
+        """Test a failed batch create reports an error for each missing SKU."""
+        hubspot_client.create_products_batch = Mock(side_effect=Exception("HubSpot down"))
+
+        created, errors = line_item_sync.ensure_products_exist([
+            ('SKU-1', None, None, None),
+            ('SKU-2', None, None, None)
+        ])
+
+        assert created == 0
+        assert list(errors) == ['SKU-2']
+
+    def test_cache_shared_across_instances(self, line_item_sync, hubspot_client):
+        """Test products found by one sync are reused by the next."""
+        line_item_sync.ensure_products_exist([('SKU-1', None, None, None)])
+
+        next_sync = LineItemSync(hubspot_client)
+
+        assert next_sync.ensure_product_exists('SKU-1') is False
+        hubspot_client.get_products_by_skus.assert_called_once()
+
+    def test_cache_expires(self, line_item_sync, monkeypatch):
+        """Test the shared cache is cleared once its TTL has passed."""
+        line_item_sync.product_cache['SKU-1'] = 'p1'
+        monkeypatch.setattr(
+            line_item_sync_module, '_product_cache_started',
+            line_item_sync_module.time.monotonic() - line_item_sync_module.PRODUCT_CACHE_TTL_SECONDS - 1
+        )
+
+        assert line_item_sync_module._shared_product_cache() == {}
+
+    def test_prewarm_products_covers_all_deals(self, line_item_sync, hubspot_client):
+        """Test one prewarm caches every SKU across many deals' lines."""
+        lines = [
+            {'QuoteNum': 1, 'QuoteLine': 1, 'PartNum': 'SKU-1'},
+            {'QuoteNum': 2, 'QuoteLine': 1, 'PartNum': 'SKU-2'},
+            {'QuoteNum': 2, 'QuoteLine': 2, 'PartNum': 'SKU-1'}
+        ]
+
+        created = line_item_sync.prewarm_products(
+            lines, line_item_sync.transformer.transform_quote_line
+        )
+
+        assert created == 1
+        hubspot_client.get_products_by_skus.assert_called_once_with(['SKU-1', 'SKU-2'])
+        assert set(line_item_sync.product_cache) == {'SKU-1', 'SKU-2'}
+
+
+class TestLineRef:
+    """Test compact line identifiers used in error reports."""
+
+    @pytest.mark.parametrize('line_item,expected', [
+        ({'QuoteNum': 1001, 'QuoteLine': 2, 'PartNum': 'P1', 'LineDesc': 'x' * 500}, 'Q1001-2'),
+        ({'OrderNum': 5001, 'OrderLine': 1}, 'O5001-1'),
+        ({'PartNum': 'P1'}, 'P1'),
+        ({}, 'unknown'),
+    ])
+    def test_line_ref(self, line_item, expected):
+        """Test quote/order lines are identified by number and line, not the full record."""
+        assert line_item_sync_module._line_ref(line_item) == expected
+
+
+class TestSyncQuoteLineItems:
+    """Test the per-deal quote line item sync."""
+
+    @pytest.fixture
+    def hubspot_client(self):
+        """Mock HubSpot client with no existing line items and one existing product."""
+        client = Mock()
+        client.get_line_items_by_epicor_ids = Mock(return_value={})
+        client.get_products_by_skus = Mock(return_value={'SKU-1': {'id': 'p1'}})
+        client.create_line_items_batch = Mock(side_effect=lambda inputs: [
+            {'id': str(i), 'properties': properties} for i, properties in enumerate(inputs)
+        ])
+        client.associate_line_items_to_deal = Mock(
+            side_effect=lambda ids, deal_id: {line_item_id: True for line_item_id in ids}
+        )
+        client.map_parallel = lambda fn, items, workers=16: [fn(item) for item in items]
+        return client
+
+    def test_duplicate_lines_written_once(self, hubspot_client):
+        """Test a detail row returned twice by Epicor is created once, last copy winning."""
+        result = LineItemSync(hubspot_client).sync_quote_line_items('deal-1', [
+            {'QuoteNum': 1001, 'QuoteLine': 1, 'PartNum': 'SKU-1', 'OrderQty': 1},
+            {'QuoteNum': 1001, 'QuoteLine': 1, 'PartNum': 'SKU-1', 'OrderQty': 3}
+        ], quote_num=1001)
+
+        [inputs] = hubspot_client.create_line_items_batch.call_args.args
+        assert [properties['quantity'] for properties in inputs] == [3]
+        hubspot_client.get_line_items_by_epicor_ids.assert_called_once_with(['Q1001-1'])
+        assert result['created'] == 1
+        assert result['errors'] == 0
@@ -0,0 +1,34 @@
+"""
+Test the main entry point.
+"""
+
+from unittest.mock import Mock, patch
+from src import main as main_module
+from src.clients.hubspot_client import HubSpotClient
+
+
+class TestMain:
+    """Test repeated runs on a warm worker."""
+
+    def test_lookup_cache_cleared_between_runs(self, mock_settings):
+        """Test a second run on the same client does not see the first run's lookups."""
+        hubspot_client = HubSpotClient(api_key='test_hubspot_key')
+        seen = []
+
+        def run_delta_sync(delta_hours):
+            seen.append(dict(hubspot_client._lookup_cache))
+            hubspot_client._lookup_cache[('deals', 'epicor_quote_number', '1001')] = {
+                'id': 'deal-1', 'properties': {'dealstage': 'quote_created'}
+            }
+            return {'success': True}
+
+        sync_manager = Mock()
+        sync_manager.run_delta_sync = Mock(side_effect=run_delta_sync)
+
+        with patch.object(main_module, 'get_settings', return_value=mock_settings), \
+                patch.object(main_module, '_get_clients', return_value=(Mock(), hubspot_client)), \
+                patch.object(main_module, 'SyncManager', return_value=sync_manager):
+            main_module.main()
+            main_module.main()
+
+        assert seen == [{}, {}]
@@ -3,6 +3,7 @@ Test order transformer with stage logic.
 """
 
 import pytest
+from datetime import datetime, timezone
 from src.transformers.order_transformer import OrderTransformer, OrderStageLogic
 
 
@@ -89,6 +90,40 @@ class TestOrderTransformer:
         result = transformer.transform(sample_order)
         assert result['dealstage'] == 'appointmentscheduled'  # order_received
 
+    def test_deal_properties_cover_transform_output(self, transformer, sample_order):
+        """Test DEAL_PROPERTIES lists every property transform() sets."""
+        assert set(transformer.transform(sample_order)) <= set(OrderTransformer.DEAL_PROPERTIES)
+
+    def test_changed_properties_unchanged_in_hubspot_format(self, transformer, sample_order):
+        """Test values read back from HubSpot as strings compare equal to what was written."""
+        properties = transformer.transform(sample_order)
+        current = {key: str(value).lower() if isinstance(value, bool) else str(value)
+                   for key, value in properties.items()}
+        current['createdate'] = '2024-01-15T00:00:00Z'
+        current['amount'] = '25000'
+
+        assert transformer.changed_properties(properties, current) == {}
+
+    def test_changed_properties_returns_differences(self, transformer, sample_order):
+        """Test only differing or missing properties are returned."""
+        properties = transformer.transform(sample_order)
+        current = {key: str(value) for key, value in properties.items()}
+        current['amount'] = '20000.0'
+        del current['customer_po_number']
+
+        assert transformer.changed_properties(properties, current) == {
+            'amount': 25000.00, 'customer_po_number': 'PO-67890'
+        }
+
+    def test_last_sync_timestamp_is_today_midnight_utc(self, transformer, sample_order):
+        """Test the sync timestamp is midnight UTC of the current day, in ms."""
+        now = datetime.now(timezone.utc)
+        midnight = datetime(now.year, now.month, now.day, tzinfo=timezone.utc)
+
+        result = transformer.transform(sample_order)
+
+        assert result['epicor_last_sync_timestamp'] == int(midnight.timestamp() * 1000)
+
     def test_get_customer_num(self, transformer, sample_order):
         """Test getting customer number for association."""
         result = transformer.get_customer_num(sample_order)
@@ -0,0 +1,55 @@
+"""
+Test per-phase profiling.
+"""
+
+import logging
+import tracemalloc
+import pytest
+from src.utils import json_utils
+from src.utils.profiler import phase
+
+
+def _phase_record(caplog):
+    """Parse the structured PHASE log line."""
+    [message] = [r.getMessage() for r in caplog.records if r.getMessage().startswith("PHASE ")]
+    return json_utils.loads(message[len("PHASE "):])
+
+
+class TestPhase:
+    """Test the phase context manager."""
+
+    def test_logs_duration(self, caplog, monkeypatch):
+        """Test a phase logs its name and duration without memory fields by default."""
+        monkeypatch.delenv('PROFILE_MEM', raising=False)
+        caplog.set_level(logging.INFO, logger='src.utils.profiler')
+
+        with phase('customers'):
+            pass
+
+        record = _phase_record(caplog)
+        assert record['phase'] == 'customers'
+        assert record['duration_ms'] >= 0
+        assert 'peak_kb' not in record
+
+    def test_logs_memory_when_enabled(self, caplog, monkeypatch):
+        """Test PROFILE_MEM=1 adds peak memory and stops tracing afterwards."""
+        monkeypatch.setenv('PROFILE_MEM', '1')
+        caplog.set_level(logging.INFO, logger='src.utils.profiler')
+
+        with phase('quotes'):
+            data = [bytes(1024) for _ in range(256)]
+
+        record = _phase_record(caplog)
+        assert record['peak_kb'] >= 256
+        assert not tracemalloc.is_tracing()
+
+    def test_logs_when_phase_raises(self, caplog, monkeypatch):
+        """Test the line is still logged when the phase fails."""
+        monkeypatch.delenv('PROFILE_MEM', raising=False)
+        caplog.set_level(logging.INFO, logger='src.utils.profiler')
+
+        with pytest.raises(RuntimeError):
+            with phase('orders'):
+                raise RuntimeError("boom")
+
+        assert _phase_record(caplog)['phase'] == 'orders'
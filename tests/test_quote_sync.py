@@ -5,16 +5,16 @@ Test quote sync module with stage logic.
 import pytest
 from unittest.mock import Mock, MagicMock
 from src.sync.quote_sync import QuoteSync
+from src.transformers.quote_transformer import QuoteTransformer
 
 
 class TestQuoteSync:
     """Test quote synchronization with stage logic."""
 
     @pytest.fixture
-    def epicor_client(self):
-        """Mock Epicor client."""
-        client = Mock()
-        client.get_quotes = Mock(return_value=[
+    def quotes(self):
+        """Epicor quotes returned by the mock client (one page)."""
+        return [
             {
                 'QuoteNum': 1001,
                 'CustNum': 12345,
@@ -33,7 +33,13 @@ class TestQuoteSync:
                 'Ordered': False,
                 'Expired': False
             }
-        ])
+        ]
+
+    @pytest.fixture
+    def epicor_client(self, quotes):
+        """Mock Epicor client."""
+        client = Mock()
+        client.iter_quote_pages = Mock(side_effect=lambda **kwargs: iter([quotes]))
         return client
 
     @pytest.fixture
@@ -44,7 +50,20 @@ class TestQuoteSync:
         client.get_company_by_property = Mock(return_value={'id': 'company-123'})
         client.create_deal = Mock(return_value={'id': 'deal-123'})
         client.update_deal = Mock(return_value={'id': 'deal-123'})
+        client.create_objects_batch = Mock(side_effect=lambda object_type, inputs: [
+            {'id': f"deal-{properties['epicor_quote_number']}", 'properties': {
+                'epicor_quote_number': str(properties['epicor_quote_number'])
+            }}
+            for properties in reversed(inputs)
+        ])
+        client.update_objects_batch = Mock(side_effect=lambda object_type, updates: [
+            {'id': update['id']} for update in updates
+        ])
         client.associate_deal_to_company = Mock(return_value=True)
+        client.associate_deals_to_companies = Mock(
+            side_effect=lambda pairs: {deal_id: True for deal_id, _ in pairs}
+        )
+        client.map_parallel = lambda fn, items, workers=16: [fn(item) for item in items]
         return client
 
     @pytest.fixture
@@ -57,7 +76,7 @@ class TestQuoteSync:
         result = quote_sync.sync_all_quotes()
 
         # Verify it fetched quotes from Epicor
-        epicor_client.get_quotes.assert_called_once()
+        epicor_client.iter_quote_pages.assert_called_once()
 
         # Verify summary
         assert result['success'] == True
@@ -81,6 +100,18 @@ class TestQuoteSync:
         assert result['created'] == 0
         assert result['updated'] == 2
 
+    def test_sync_all_quotes_prefetches_lookups(self, quote_sync, hubspot_client):
+        """Test deals and companies are looked up in one batch before the per-quote sync."""
+        quote_sync.sync_all_quotes()
+
+        hubspot_client.get_deals_by_property.assert_called_once_with(
+            'epicor_quote_number', [1001, 1002],
+            properties=list(QuoteTransformer.DEAL_PROPERTIES)
+        )
+        hubspot_client.get_companies_by_property.assert_called_once_with(
+            'epicor_customer_number', [12345, 12345]
+        )
+
     def test_sync_quote_with_stage_logic(self, quote_sync, hubspot_client):
         """Test that stage logic is applied during sync."""
         quote_data = {
@@ -146,3 +177,111 @@ class TestQuoteSync:
             'deal-123',
             'company-123'
         )
+
+    def test_sync_all_quotes_batches_linked_order_lookup(self, quote_sync, epicor_client, quotes):
+        """Test converted quotes get their Epicor orders from one batched lookup."""
+        quotes[0]['Ordered'] = True
+        epicor_client.get_orders_by_quotes = Mock(return_value={})
+
+        quote_sync.sync_all_quotes()
+
+        epicor_client.get_orders_by_quotes.assert_called_once_with([1001])
+        epicor_client.get_order_by_quote.assert_not_called()
+
+    def test_sync_all_quotes_prefetches_linked_order_deals(self, quote_sync, epicor_client, hubspot_client, quotes):
+        """Test linked orders' deals are looked up in the same batched pass."""
+        quotes[0]['Ordered'] = True
+        epicor_client.get_orders_by_quotes = Mock(return_value={1001: {'OrderNum': 5001}})
+
+        quote_sync.sync_all_quotes()
+
+        hubspot_client.get_deals_by_property.assert_any_call('epicor_order_number', [5001])
+
+    def test_sync_all_quotes_fetch_failure_keeps_counts(self, quote_sync, epicor_client, quotes):
+        """Test a fetch failure after the first page reports the pages already synced."""
+        def pages(**kwargs):
+            yield quotes
+            raise Exception("Epicor timeout")
+
+        epicor_client.iter_quote_pages = Mock(side_effect=pages)
+
+        result = quote_sync.sync_all_quotes()
+
+        assert result['success'] == False
+        assert 'Epicor timeout' in result['error']
+        assert result['total'] == 2
+        assert result['created'] == 2
+
+    def test_sync_all_quotes_batches_company_associations(self, quote_sync, hubspot_client):
+        """Test a page's deal-company associations are created in one batch call."""
+        quote_sync.sync_all_quotes()
+
+        hubspot_client.associate_deals_to_companies.assert_called_once_with([
+            ('deal-1001', 'company-123'), ('deal-1002', 'company-123')
+        ])
+        hubspot_client.associate_deal_to_company.assert_not_called()
+        assert quote_sync.pending_company_links is None
+
+    def test_sync_quote_skips_unchanged_deal(self, quote_sync, hubspot_client, quotes):
+        """Test an existing deal whose properties already match is not updated."""
+        current = quote_sync.transformer.transform(quotes[0], 'quote_created')
+        hubspot_client.get_deal_by_property = Mock(return_value={
+            'id': 'deal-123',
+            'properties': {key: str(value) for key, value in current.items()}
+        })
+
+        result = quote_sync.sync_quote(quotes[0])
+
+        assert result == 'unchanged'
+        hubspot_client.update_deal.assert_not_called()
+        hubspot_client.associate_deal_to_company.assert_called_once()
+
+    def test_sync_all_quotes_batches_deal_writes(self, quote_sync, hubspot_client):
+        """Test a page's new deals are created in one batch request, not one call each."""
+        quote_sync.sync_all_quotes()
+
+        hubspot_client.create_objects_batch.assert_called_once()
+        object_type, inputs = hubspot_client.create_objects_batch.call_args.args
+        assert object_type == 'deals'
+        assert [properties['epicor_quote_number'] for properties in inputs] == [1001, 1002]
+        hubspot_client.create_deal.assert_not_called()
+
+    def test_sync_all_quotes_partial_batch_create(self, quote_sync, hubspot_client):
+        """Test a quote missing from the batch create response is recorded as an error."""
+        hubspot_client.create_objects_batch = Mock(return_value=[
+            {'id': 'deal-1002', 'properties': {'epicor_quote_number': '1002'}}
+        ])
+
+        result = quote_sync.sync_all_quotes()
+
+        assert result['created'] == 1
+        assert result['errors'] == 1
+        hubspot_client.associate_deals_to_companies.assert_called_once_with([
+            ('deal-1002', 'company-123')
+        ])
+
+    def test_sync_quote_after_full_sync_looks_up_order(self, quote_sync, epicor_client, quotes):
+        """Test a direct sync after sync_all_quotes does not reuse the last page's orders."""
+        epicor_client.get_orders_by_quotes = Mock(return_value={})
+        epicor_client.get_order_by_quote = Mock(return_value=None)
+        quote_sync.sync_all_quotes()
+
+        quotes[0]['Ordered'] = True
+        quote_sync.sync_quote(quotes[0])
+
+        assert quote_sync.linked_orders is None
+        epicor_client.get_order_by_quote.assert_called_once_with(1001)
+
+    def test_sync_all_quotes_flushes_failed_records(self, epicor_client, hubspot_client, quotes):
+        """Test the phase's failed records are written out even when a later fetch fails."""
+        def pages(**kwargs):
+            yield quotes
+            raise Exception("Epicor timeout")
+
+        epicor_client.iter_quote_pages = Mock(side_effect=pages)
+        failed_tracker = Mock()
+        quote_sync = QuoteSync(epicor_client, hubspot_client, failed_tracker)
+
+        quote_sync.sync_all_quotes()
+
+        failed_tracker.flush.assert_called_once()